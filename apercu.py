@@ -0,0 +1,297 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Aperçu des sets sans lancer IBNIZ
+
+Une machine IBNIZ en Python qui évalue le programme vidéo d'un set pour
+tous les pixels d'une image à la fois, avec des tableaux NumPy : chaque
+valeur de la pile est un tableau d'entiers 32 bits en virgule fixe 16.16,
+un élément par pixel. Seul le sous-ensemble sans mémoire, boucles, sauts ni
+sous-programmes est évalué, les autres sets n'ont pas d'aperçu.
+
+Les vignettes calculées sont gardées dans un cache sur disque, indexé par
+l'empreinte du code, dont la taille est bornée en supprimant les vignettes
+utilisées le moins récemment.
+"""
+
+from os import listdir, mkdir, remove, rename, utime, stat
+from os.path import exists, join
+from threading import RLock
+from collections import OrderedDict
+from math import pi
+from stockage import empreinteTexte, octets
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+TAILLEVIGNETTE = 128
+IMAGESPARSECONDE = 60
+REPERTOIREVIGNETTES = ".vignettes"
+TAILLECACHE = 16 * 1024 * 1024
+HEXA = "0123456789ABCDEF"
+BINAIRES = "+-*/%&|^rla"
+UNAIRES = "~sq<>="
+PILE = "dpxv)"
+
+
+class CodeNonSupporte(Exception):
+    """Exception levée quand le set utilise une instruction que l'aperçu n'évalue pas"""
+
+
+def disponible():
+    """Indique si NumPy est installé et que les aperçus peuvent être calculés"""
+    return numpy is not None
+
+
+def analyse(code):
+    """Retourne le programme vidéo du set sous forme d'une liste d'instructions.
+Un nombre est un entier 16.16, une condition est un couple (alors, sinon)"""
+    programme = []
+    blocs = [programme]
+    # Pour chaque condition ouverte : la liste où ajouter le couple, la branche alors et la branche sinon
+    conditions = []
+    position = 0
+    while position < len(code):
+        c = code[position]
+        if c == '\\':
+            # Commentaire jusqu'à la fin de la ligne
+            fin = code.find('\n', position)
+            position = len(code) if fin < 0 else fin
+            continue
+        if c in HEXA or (c == '.' and position + 1 < len(code) and code[position + 1] in HEXA):
+            debut = position
+            while position < len(code) and code[position] in HEXA:
+                position += 1
+            entier = code[debut:position]
+            fraction = ""
+            if position < len(code) and code[position] == '.':
+                position += 1
+                debut = position
+                while position < len(code) and code[position] in HEXA:
+                    position += 1
+                fraction = code[debut:position]
+            valeur = (int(entier[-4:] or "0", 16) << 16) | int((fraction + "0000")[:4], 16)
+            blocs[-1].append(valeur - (1 << 32) if valeur >= 1 << 31 else valeur)
+            continue
+        position += 1
+        if c in " \t\r\n,":
+            continue
+        if c in BINAIRES or c in UNAIRES or c in PILE:
+            blocs[-1].append(c)
+        elif c == '?':
+            alors, sinon = [], []
+            conditions.append((blocs[-1], alors, sinon))
+            blocs[-1].append((alors, sinon))
+            blocs.append(alors)
+        elif c == ':' and conditions and blocs[-1] is conditions[-1][1]:
+            blocs[-1] = conditions[-1][2]
+        elif c == ';' and conditions:
+            conditions.pop()
+            blocs.pop()
+        elif c in "MT":
+            # La suite est le programme audio, ou la fin du programme
+            break
+        else:
+            raise CodeNonSupporte(c)
+    return programme
+
+
+def entiers(valeur):
+    """Ramène un résultat calculé en 64 bits aux entiers signés 32 bits de IBNIZ"""
+    return ((numpy.asarray(valeur, dtype=numpy.int64) + (1 << 31)) % (1 << 32) - (1 << 31)).astype(numpy.int32)
+
+
+def binaire(operation, a, b):
+    """Applique une opération à deux opérandes"""
+    a = numpy.asarray(a, dtype=numpy.int64)
+    b = numpy.asarray(b, dtype=numpy.int64)
+    if operation == '+':
+        return entiers(a + b)
+    if operation == '-':
+        return entiers(a - b)
+    if operation == '*':
+        return entiers((a * b) >> 16)
+    if operation == '/':
+        diviseur = numpy.where(b == 0, 1, b)
+        return entiers(numpy.where(b == 0, 0, (a << 16) // diviseur))
+    if operation == '%':
+        diviseur = numpy.where(b == 0, 1, b)
+        return entiers(numpy.where(b == 0, 0, numpy.fmod(a, diviseur)))
+    if operation == '&':
+        return entiers(a & b)
+    if operation == '|':
+        return entiers(a | b)
+    if operation == '^':
+        return entiers(a ^ b)
+    if operation == 'r':
+        decalage = (b >> 16) & 31
+        a = a & 0xFFFFFFFF
+        return entiers((a >> decalage) | (a << (32 - decalage)))
+    if operation == 'l':
+        decalage = b >> 16
+        return entiers(numpy.where(decalage >= 0, a << numpy.clip(decalage, 0, 63), a >> numpy.clip(-decalage, 0, 63)))
+    # atan2 en fractions de tour
+    return entiers(numpy.arctan2(a, b) / (2 * pi) * 65536)
+
+
+def unaire(operation, a):
+    """Applique une opération à un opérande"""
+    a = numpy.asarray(a, dtype=numpy.int64)
+    if operation == '~':
+        return entiers(~a)
+    if operation == 's':
+        return entiers(numpy.sin(a * (2 * pi / 65536)) * 65536)
+    if operation == 'q':
+        return entiers(numpy.sqrt(numpy.maximum(a, 0) / 65536.0) * 65536)
+    if operation == '<':
+        return entiers(numpy.where(a < 0, a, 0))
+    if operation == '>':
+        return entiers(numpy.where(a > 0, a, 0))
+    return entiers(numpy.where(a == 0, 0x10000, 0))
+
+
+def execute(programme, pile):
+    """Exécute les instructions sur la pile, une liste de tableaux"""
+    for instruction in programme:
+        if isinstance(instruction, int):
+            pile.append(numpy.int32(instruction))
+        elif isinstance(instruction, tuple):
+            alors, sinon = instruction
+            condition = pile.pop() if pile else 0
+            pileAlors = execute(alors, list(pile))
+            pileSinon = execute(sinon, list(pile))
+            if len(pileAlors) != len(pileSinon):
+                raise CodeNonSupporte("?")
+            vrai = numpy.asarray(condition) != 0
+            pile[:] = [numpy.where(vrai, x, y) for x, y in zip(pileAlors, pileSinon)]
+        elif instruction in BINAIRES:
+            b = pile.pop() if pile else 0
+            a = pile.pop() if pile else 0
+            pile.append(binaire(instruction, a, b))
+        elif instruction in UNAIRES:
+            pile.append(unaire(instruction, pile.pop() if pile else 0))
+        elif instruction == 'd':
+            pile.append(pile[-1] if pile else numpy.int32(0))
+        elif instruction == 'p':
+            if pile:
+                pile.pop()
+        elif instruction == 'x':
+            if len(pile) >= 2:
+                pile[-1], pile[-2] = pile[-2], pile[-1]
+        elif instruction == 'v':
+            if len(pile) >= 3:
+                pile.append(pile.pop(-3))
+        elif instruction == ')':
+            # Copie de l'élément de la pile dont la profondeur est indiquée
+            profondeur = numpy.asarray(pile.pop() if pile else 0)
+            if profondeur.ndim:
+                raise CodeNonSupporte(")")
+            index = int(profondeur) >> 16
+            pile.append(pile[-1 - index] if index < len(pile) else numpy.int32(0))
+    return pile
+
+
+def rendu(texte, taille=TAILLEVIGNETTE, image=0):
+    """Retourne l'image numéro image du set, un tableau (taille, taille, 3) d'octets RGB.
+Lève CodeNonSupporte si le set utilise une instruction que l'aperçu n'évalue pas"""
+    programme = analyse(octets(texte))
+    # Au départ la pile contient t, y et x, les coordonnées allant de -1 à 1
+    coordonnees = ((numpy.arange(taille, dtype=numpy.int64) * 2 - taille) << 16) // taille
+    y, x = numpy.meshgrid(coordonnees, coordonnees, indexing='ij')
+    pile = execute(programme, [numpy.int32(image << 16), entiers(y), entiers(x)])
+    valeur = numpy.broadcast_to(pile[-1] if pile else numpy.int32(0), (taille, taille)).astype(numpy.int64)
+    # La valeur du pixel est VVUU.YYyy
+    luminance = ((valeur >> 8) & 0xFF).astype(numpy.float32)
+    u = ((valeur >> 16) & 0xFF).astype(numpy.int8).astype(numpy.float32)
+    v = ((valeur >> 24) & 0xFF).astype(numpy.int8).astype(numpy.float32)
+    rgb = numpy.dstack((luminance + 1.402 * v, luminance - 0.344 * u - 0.714 * v, luminance + 1.772 * u))
+    return numpy.clip(rgb, 0, 255).astype(numpy.uint8)
+
+
+def ppm(pixels):
+    """Retourne l'image au format PPM binaire"""
+    hauteur, largeur = pixels.shape[:2]
+    return "P6\n%d %d\n255\n" % (largeur, hauteur) + pixels.tobytes()
+
+
+def lisPPM(donnees):
+    """Retourne le tableau de pixels d'une image PPM binaire écrite par ppm()"""
+    entete, largeur, hauteur, maximum, pixels = donnees.split(None, 4)
+    if entete != "P6":
+        raise ValueError("Image PPM invalide")
+    return numpy.frombuffer(pixels, dtype=numpy.uint8).reshape(int(hauteur), int(largeur), 3)
+
+
+def couleursTk(pixels):
+    """Retourne les pixels dans le format attendu par PhotoImage.put()"""
+    return " ".join("{%s}" % " ".join("#%02x%02x%02x" % tuple(pixel) for pixel in ligne) for ligne in pixels)
+
+
+class CacheVignettes(object):
+    """Cache sur disque des vignettes, une image PPM par empreinte de code, borné à taillemax octets"""
+
+    def __init__(self, repertoire=REPERTOIREVIGNETTES, taillemax=TAILLECACHE):
+        self.repertoire = repertoire
+        self.taillemax = taillemax
+        self.verrou = RLock()
+        if not exists(repertoire):
+            mkdir(repertoire)
+        # Les vignettes de la moins récemment utilisée à la plus récente, avec leur taille
+        fichiers = []
+        for nom in listdir(repertoire):
+            if nom.endswith(".ppm"):
+                infos = stat(join(repertoire, nom))
+                fichiers.append((infos.st_mtime, nom, infos.st_size))
+        fichiers.sort()
+        self.vignettes = OrderedDict((nom, taille) for mtime, nom, taille in fichiers)
+        self.total = sum(self.vignettes.values())
+
+    def cle(self, texte, taille):
+        """Retourne le nom du fichier de la vignette du code"""
+        return "%s-%d.ppm" % (empreinteTexte(octets(texte)), taille)
+
+    def charge(self, texte, taille=TAILLEVIGNETTE):
+        """Retourne les pixels de la vignette du code, ou None si elle n'est pas dans le cache"""
+        nom = self.cle(texte, taille)
+        chemin = join(self.repertoire, nom)
+        with self.verrou:
+            if nom not in self.vignettes:
+                return None
+            # La vignette devient la plus récemment utilisée
+            self.vignettes[nom] = self.vignettes.pop(nom)
+            try:
+                utime(chemin, None)
+                with open(chemin, 'rb') as fic:
+                    return lisPPM(fic.read())
+            except (IOError, OSError, ValueError):
+                self.total -= self.vignettes.pop(nom)
+                return None
+
+    def sauve(self, texte, pixels, taille=TAILLEVIGNETTE):
+        """Ajoute la vignette du code au cache, en supprimant les plus anciennes au-delà de taillemax"""
+        nom = self.cle(texte, taille)
+        donnees = ppm(pixels)
+        with self.verrou:
+            chemin = join(self.repertoire, nom)
+            with open(chemin + ".tmp", 'wb') as fic:
+                fic.write(donnees)
+            rename(chemin + ".tmp", chemin)
+            self.total += len(donnees) - self.vignettes.pop(nom, 0)
+            self.vignettes[nom] = len(donnees)
+            while self.total > self.taillemax and len(self.vignettes) > 1:
+                ancien, taillefichier = self.vignettes.popitem(last=False)
+                self.total -= taillefichier
+                try:
+                    remove(join(self.repertoire, ancien))
+                except OSError:
+                    pass
+
+    def vignette(self, texte, taille=TAILLEVIGNETTE):
+        """Retourne la vignette du code, calculée et ajoutée au cache si elle n'y est pas"""
+        pixels = self.charge(texte, taille)
+        if pixels is None:
+            pixels = rendu(texte, taille)
+            self.sauve(texte, pixels, taille)
+        return pixels
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+"""
+Mesures de performance de Pybniz
+
+Génère des bibliothèques de sets synthétiques, mesure chargeListeSets,
+chargeSet, chercheSets, sauveSet et lanceIBNIZ (avec un faux exécutable IBNIZ, sans écran
+ni SDL) pour chaque stockage, et écrit les résultats en JSON.
+
+Exemples :
+  ./benchmark.py --sets 100 1000 10000 --sortie mesures.json
+  ./benchmark.py --reference mesures.json --tolerance 0.25
+"""
+
+from argparse import ArgumentParser
+from json import dump, load
+from os import chdir, getcwd, chmod, mkdir
+from os.path import join
+from random import Random
+from shutil import rmtree
+from sys import stdout, exit
+from tempfile import mkdtemp
+from time import time
+import platform
+
+import pybniz
+
+OPCODES = "0123456789ABCDEF.+-*/%&|^~<>=!?:;rqsatxydpvMP@(){}[]JRLTw"
+TAILLES = [2, 20, 200, 2000, 8000]
+FAUXIBNIZ = "#!/bin/sh\nexit 0\n"
+
+
+def lignesSynthetiques(aleatoire, nombre=1000):
+    """Retourne des lignes de code IBNIZ aléatoires, dont quelques-unes avec des accents à supprimer"""
+    lignes = []
+    for i in xrange(nombre):
+        ligne = u''.join(aleatoire.choice(OPCODES) for j in xrange(aleatoire.randint(8, 60)))
+        if aleatoire.random() < 0.05:
+            ligne += u' \\ cré'
+        lignes.append(ligne)
+    return lignes
+
+
+def texteSynthetique(aleatoire, lignes, longueur):
+    """Retourne un set synthétique d'environ longueur caractères, assemblé à partir des lignes"""
+    texte = [r'\ xyt: %d %d %d' % (aleatoire.randint(0, 1600), aleatoire.randint(0, 1200), aleatoire.randint(64, 1000)), u'']
+    taille = 0
+    while taille < longueur:
+        ligne = aleatoire.choice(lignes)
+        texte.append(ligne)
+        taille += len(ligne) + 1
+    return u'\n'.join(texte)
+
+
+def genereBibliotheque(stockage, nombre, graine=0):
+    """Remplit le stockage avec nombre sets synthétiques de tailles variées"""
+    aleatoire = Random(graine)
+    lignes = lignesSynthetiques(aleatoire)
+    sets = (("set %06d" % i, texteSynthetique(aleatoire, lignes, aleatoire.choice(TAILLES)).encode('utf-8'))
+            for i in xrange(nombre))
+    return stockage.sauvePlusieurs(sets)
+
+
+def statistiques(durees):
+    """Retourne les statistiques d'une liste de durées en secondes, exprimées en millisecondes"""
+    durees = sorted(durees)
+    nombre = len(durees)
+    return {
+        "n": nombre,
+        "total_ms": sum(durees) * 1000,
+        "moyenne_ms": sum(durees) / nombre * 1000,
+        "mediane_ms": durees[nombre // 2] * 1000,
+        "p95_ms": durees[min(nombre - 1, int(nombre * 0.95))] * 1000,
+        "min_ms": durees[0] * 1000,
+        "max_ms": durees[-1] * 1000,
+    }
+
+
+def chronometre(fonction, repetitions, *arguments):
+    """Appelle fonction repetitions fois et retourne la liste des durées"""
+    durees = []
+    for i in xrange(repetitions):
+        debut = time()
+        fonction(*arguments)
+        durees.append(time() - debut)
+    return durees
+
+
+def mesure(nombre, base, echantillon, rafale, graine):
+    """Mesure les opérations sur une bibliothèque de nombre sets, dans un répertoire temporaire"""
+    repertoire = mkdtemp(prefix="pybniz-bench-")
+    precedent = getcwd()
+    try:
+        chdir(repertoire)
+        pybniz.BASESETS = base
+        # Bibliothèque vide, sans le set de démonstration
+        mkdir("sets")
+        debut = time()
+        generateur = pybniz.Pybniz(interface=False)
+        genereBibliotheque(generateur.stockage, nombre, graine)
+        generation = time() - debut
+        # Arrête aussi les threads de travail et de sauvegarde de cette instance
+        generateur.fermer()
+
+        resultats = {"generation_s": generation}
+        debut = time()
+        application = pybniz.Pybniz(interface=False)
+        resultats["ouverture"] = statistiques([time() - debut])
+        resultats["chargeListeSets"] = statistiques(chronometre(application.chargeListeSets, 5))
+
+        aleatoire = Random(graine)
+        noms = [aleatoire.choice(application.listesets) for i in xrange(echantillon)]
+        durees = []
+        for nomset in noms:
+            debut = time()
+            application.chargeSet(nomset)
+            durees.append(time() - debut)
+        resultats["chargeSet"] = statistiques(durees)
+
+        textes = [(nomset, application.chargeSet(nomset).decode('utf-8')) for nomset in noms]
+
+        # Première indexation de la bibliothèque, puis recherches de morceaux de code des sets
+        debut = time()
+        application.synchroniseRecherche()
+        resultats["synchroniseRecherche"] = statistiques([time() - debut])
+        motifs = []
+        for nomset, texte in textes:
+            position = aleatoire.randint(0, max(len(texte) - 6, 0))
+            motifs.append(texte[position:position + 6])
+        resultats["chercheSets"] = statistiques([chronometre(application.chercheSets, 1, motif)[0] for motif in motifs])
+        resultats["chercheSets_regex"] = statistiques(chronometre(application.chercheSets, 5, r"d\*[0-9]+", True))
+        durees = []
+        for nomset, texte in textes:
+            debut = time()
+            application.sauveSet(nomset, texte, 10, 20, 300)
+            durees.append(time() - debut)
+        resultats["sauveSet"] = statistiques(durees)
+        resultats["prepareSet"] = statistiques([chronometre(application.prepareSet, 1, texte, 10, 20, 300)[0]
+                                                for nomset, texte in textes])
+
+        # Rafale de lancements avec un faux IBNIZ qui se termine tout de suite
+        with open("ibniz", "w") as fic:
+            fic.write(FAUXIBNIZ)
+        chmod("ibniz", 0755)
+        pybniz.IBNIZPATH = join(repertoire, "ibniz")
+        application.superviseur.maxinstances = rafale
+        # La rafale mesure le coût des lancements, pas le gouverneur
+        application.gouverneur.politique = None
+        nomset, texte = textes[0]
+        debut = time()
+        durees = chronometre(application.lanceIBNIZ, rafale, nomset, texte, 0, 0, 256)
+        resultats["rafale_lancement_ms"] = (time() - debut) * 1000
+        resultats["lanceIBNIZ"] = statistiques(durees)
+        debut = time()
+        application.superviseur.attend()
+        resultats["rafale_fin_ms"] = (time() - debut) * 1000
+        application.fermer()
+        return resultats
+    finally:
+        chdir(precedent)
+        rmtree(repertoire, ignore_errors=True)
+
+
+def compare(resultats, reference, tolerance):
+    """Retourne les mesures dont la médiane a augmenté de plus de tolerance par rapport à la référence"""
+    regressions = []
+    for cle, mesures in resultats["mesures"].items():
+        for operation, valeur in mesures.items():
+            ancienne = reference.get("mesures", {}).get(cle, {}).get(operation)
+            if not isinstance(valeur, dict) or not isinstance(ancienne, dict):
+                continue
+            if ancienne["mediane_ms"] > 0 and valeur["mediane_ms"] > ancienne["mediane_ms"] * (1 + tolerance):
+                regressions.append((cle, operation, ancienne["mediane_ms"], valeur["mediane_ms"]))
+    return regressions
+
+
+def main():
+    parser = ArgumentParser(description="Mesures de performance de Pybniz")
+    parser.add_argument("--sets", type=int, nargs="+", default=[100, 1000, 10000],
+                        help="tailles des bibliothèques générées (100 à 100000)")
+    parser.add_argument("--stockage", choices=["repertoire", "sqlite", "archive"], nargs="+",
+                        default=["repertoire", "sqlite", "archive"])
+    parser.add_argument("--echantillon", type=int, default=200, help="nombre de sets chargés et sauvés")
+    parser.add_argument("--rafale", type=int, default=30, help="nombre de lancements simultanés")
+    parser.add_argument("--graine", type=int, default=0)
+    parser.add_argument("--sortie", help="fichier JSON des résultats, sinon la sortie standard")
+    parser.add_argument("--reference", help="fichier JSON d'une mesure précédente à comparer")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="augmentation relative de la médiane considérée comme une régression")
+    options = parser.parse_args()
+
+    resultats = {
+        "version": pybniz.VERSION,
+        "date": time(),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "mesures": {},
+    }
+    for stockage in options.stockage:
+        for nombre in options.sets:
+            base = {"sqlite": "sets.db", "archive": "sets.pybz"}.get(stockage)
+            resultats["mesures"]["%s-%d" % (stockage, nombre)] = mesure(
+                nombre, base, options.echantillon, options.rafale, options.graine)
+
+    if options.sortie:
+        with open(options.sortie, "w") as fic:
+            dump(resultats, fic, indent=2, sort_keys=True)
+    else:
+        dump(resultats, stdout, indent=2, sort_keys=True)
+        print
+
+    if options.reference:
+        with open(options.reference) as fic:
+            regressions = compare(resultats, load(fic), options.tolerance)
+        for cle, operation, ancienne, nouvelle in regressions:
+            print "Regression %s %s: %.3f ms -> %.3f ms" % (cle, operation, ancienne, nouvelle)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,147 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Boucle de travail en arrière-plan
+
+Les lectures et écritures de sets, le lancement et la surveillance des
+processus IBNIZ et les tâches périodiques s'exécutent dans un thread de
+travail. Leurs résultats sont déposés dans une file sûre entre threads, que
+la boucle Tk vide régulièrement par traiteRetours() pour appeler les rappels
+dans le thread de l'interface, le seul qui peut toucher aux widgets. Chaque
+boucle a son thread : des travaux longs soumis à une autre boucle ne
+retardent pas les tâches de celle-ci.
+"""
+
+from Queue import Queue, Empty
+from heapq import heappush, heappop
+from threading import Thread, Lock
+from time import time
+from traceback import print_exc
+from traces import traceur
+
+
+def nom(fonction):
+    """Retourne le nom d'une fonction pour la trace"""
+    return getattr(fonction, '__name__', 'tache')
+
+
+class Tache(object):
+    """Une fonction à exécuter dans le thread de travail, avec ses rappels"""
+
+    def __init__(self, fonction, arguments, rappel, erreur, intervalle=None):
+        self.fonction = fonction
+        self.arguments = arguments
+        self.rappel = rappel
+        self.erreur = erreur
+        self.intervalle = intervalle
+        self.annulee = False
+
+    def annule(self):
+        """Annule une tâche périodique"""
+        self.annulee = True
+
+
+class Boucle(object):
+    """Exécute des tâches dans un thread de travail et rend leurs résultats au thread de l'interface"""
+
+    def __init__(self, nom="Boucle"):
+        self.taches = Queue()
+        self.retours = Queue()
+        # Tâches programmées : (échéance, numéro, tâche), le numéro départage les échéances égales
+        self.programmees = []
+        self.numero = 0
+        self.verrou = Lock()
+        self.actif = True
+        self.thread = Thread(target=self.boucle, name=nom)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def soumet(self, fonction, *arguments, **options):
+        """Exécute fonction(*arguments) dans le thread de travail. Les options rappel(resultat)
+et erreur(exception) sont appelées ensuite dans le thread qui appelle traiteRetours()"""
+        tache = Tache(fonction, arguments, options.get('rappel'), options.get('erreur'))
+        self.taches.put(tache)
+        return tache
+
+    def periodique(self, intervalle, fonction, *arguments, **options):
+        """Exécute fonction(*arguments) toutes les intervalle secondes dans le thread de travail"""
+        tache = Tache(fonction, arguments, options.get('rappel'), options.get('erreur'), intervalle)
+        self.programme(tache, time() + intervalle)
+        return tache
+
+    def programme(self, tache, echeance):
+        """Ajoute une tâche à exécuter à l'échéance indiquée"""
+        with self.verrou:
+            self.numero += 1
+            heappush(self.programmees, (echeance, self.numero, tache))
+        # Réveille le thread de travail pour qu'il tienne compte de la nouvelle échéance
+        self.taches.put(None)
+
+    def boucle(self):
+        """Boucle du thread de travail"""
+        while self.actif:
+            with self.verrou:
+                prochaine = self.programmees[0][0] if self.programmees else None
+            attente = None if prochaine is None else max(0, prochaine - time())
+            try:
+                tache = self.taches.get(timeout=attente) if attente != 0 else self.taches.get_nowait()
+            except Empty:
+                tache = None
+            if tache is not None:
+                self.execute(tache)
+            for tache in self.echues():
+                self.execute(tache)
+                if not tache.annulee:
+                    self.programme(tache, time() + tache.intervalle)
+
+    def echues(self):
+        """Retire et retourne les tâches programmées dont l'échéance est passée"""
+        maintenant = time()
+        echues = []
+        with self.verrou:
+            while self.programmees and self.programmees[0][0] <= maintenant:
+                echeance, numero, tache = heappop(self.programmees)
+                if not tache.annulee:
+                    echues.append(tache)
+        return echues
+
+    def execute(self, tache):
+        """Exécute une tâche et dépose son résultat pour le thread de l'interface"""
+        try:
+            with traceur.intervalle(nom(tache.fonction), "boucle"):
+                resultat = tache.fonction(*tache.arguments)
+        except Exception as exception:
+            if tache.erreur:
+                self.retours.put((tache.erreur, exception))
+            else:
+                print_exc()
+            return
+        if tache.rappel:
+            self.retours.put((tache.rappel, resultat))
+
+    def signale(self, rappel, valeur):
+        """Dépose un résultat calculé par un autre thread, rappel(valeur) sera appelé par traiteRetours()"""
+        self.retours.put((rappel, valeur))
+
+    def traiteRetours(self, maximum=100):
+        """Appelle les rappels des tâches terminées, à appeler depuis le thread de l'interface"""
+        for i in xrange(maximum):
+            try:
+                rappel, valeur = self.retours.get_nowait()
+            except Empty:
+                return i
+            try:
+                with traceur.intervalle(nom(rappel), "rappel"):
+                    rappel(valeur)
+            except Exception:
+                print_exc()
+        return maximum
+
+    def arrete(self):
+        """Arrête le thread de travail après les tâches déjà soumises"""
+        self.soumet(self.fin)
+        self.thread.join()
+
+    def fin(self):
+        """Dernière tâche exécutée par le thread de travail"""
+        self.actif = False
@@ -0,0 +1,220 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Coloration syntaxique du code IBNIZ
+
+Les commandes insert, delete et replace du widget Text sont interceptées
+au niveau de Tcl : chaque modification indique les lignes touchées, qui sont
+découpées à nouveau quand l'interface est libre. L'état du découpage au début
+de chaque ligne (section de données après '$', profondeur des boucles) est
+gardé en cache : la coloration s'arrête dès qu'une ligne finit dans le même
+état qu'avant, et le temps de réponse à une frappe ne dépend pas de la taille
+du set.
+"""
+
+from re import compile
+
+HEXA = "0123456789ABCDEF"
+OPERATIONS = "+-*/%&|^rla~sq<>="
+PILE = "dpxv)("
+CONDITIONS = "?:;"
+SOUSPROGRAMMES = "{}VR"
+MEMOIRE = "@!"
+SPECIAUX = "MwTUij"
+# Les boucles qui s'ouvrent et se ferment, les sauts
+OUVERTURES = "[X"
+FERMETURES = "]L"
+SAUTS = "J"
+ENTETE = compile(r'\\ (xyt|cpu):')
+# Nombre de couleurs qui alternent selon la profondeur des boucles
+NIVEAUX = 3
+COULEURS = {
+    'entete': {'foreground': 'grey50', 'font': "Courier 14 bold italic"},
+    'commentaire': {'foreground': 'grey50'},
+    'nombre': {'foreground': 'dark orange'},
+    'operation': {'foreground': 'blue'},
+    'pile': {'foreground': 'dark green'},
+    'condition': {'foreground': 'magenta4'},
+    'sousprogramme': {'foreground': 'brown'},
+    'memoire': {'foreground': 'dark cyan'},
+    'special': {'foreground': 'red'},
+    'donnees': {'foreground': 'grey40', 'background': 'grey92'},
+    'boucle0': {'foreground': 'purple', 'background': 'lavender'},
+    'boucle1': {'foreground': 'purple', 'background': 'light yellow'},
+    'boucle2': {'foreground': 'purple', 'background': 'honeydew'},
+}
+# État au début du code : pas dans les données, hors de toute boucle
+ETATINITIAL = (False, 0)
+
+
+def decoupe(ligne, etat=ETATINITIAL):
+    """Découpe une ligne de code, retourne les jetons (classe, début, fin) et l'état à la fin de la ligne"""
+    donnees, niveau = etat
+    if donnees:
+        return ([('donnees', 0, len(ligne))] if ligne else []), etat
+    if ENTETE.match(ligne):
+        return [('entete', 0, len(ligne))], etat
+    jetons = []
+    position = 0
+    longueur = len(ligne)
+    while position < longueur:
+        c = ligne[position]
+        debut = position
+        position += 1
+        if c == '\\':
+            jetons.append(('commentaire', debut, longueur))
+            break
+        if c == '$':
+            # Le reste du set est la section de données
+            jetons.append(('donnees', debut, longueur))
+            return jetons, (True, niveau)
+        if c in HEXA or c == '.':
+            while position < longueur and (ligne[position] in HEXA or ligne[position] == '.'):
+                position += 1
+            classe = 'nombre'
+        elif c in OUVERTURES:
+            classe = 'boucle%d' % (niveau % NIVEAUX)
+            niveau += 1
+        elif c in FERMETURES:
+            niveau = max(niveau - 1, 0)
+            classe = 'boucle%d' % (niveau % NIVEAUX)
+        elif c in SAUTS:
+            classe = 'boucle%d' % (niveau % NIVEAUX)
+        elif c in OPERATIONS:
+            classe = 'operation'
+        elif c in PILE:
+            classe = 'pile'
+        elif c in CONDITIONS:
+            classe = 'condition'
+        elif c in SOUSPROGRAMMES:
+            classe = 'sousprogramme'
+        elif c in MEMOIRE:
+            classe = 'memoire'
+        elif c in SPECIAUX:
+            classe = 'special'
+        else:
+            continue
+        # Deux jetons voisins de la même classe forment un seul intervalle
+        if jetons and jetons[-1][0] == classe and jetons[-1][2] == debut:
+            jetons[-1] = (classe, jetons[-1][1], position)
+        else:
+            jetons.append((classe, debut, position))
+    return jetons, (False, niveau)
+
+
+def ligneColonne(index):
+    """Retourne la ligne et la colonne d'un index Tk 'ligne.colonne'"""
+    ligne, colonne = index.split('.')
+    return int(ligne), int(colonne)
+
+
+class Coloration(object):
+    """Colore un widget Text et le recolore ligne par ligne après chaque modification"""
+
+    def __init__(self, widget, couleurs=COULEURS):
+        self.widget = widget
+        self.tk = widget.tk
+        self.classes = list(couleurs)
+        for classe, options in couleurs.items():
+            widget.tag_configure(classe, **options)
+        # Les boucles sont colorées par-dessus les autres classes
+        for niveau in xrange(NIVEAUX):
+            widget.tag_raise('boucle%d' % niveau)
+        # etats[i] est l'état au début de la ligne i + 1, None s'il est à recalculer
+        self.etats = [ETATINITIAL, None]
+        # Lignes touchées depuis la dernière coloration
+        self.premiere = None
+        self.derniere = None
+        self.programme = None
+        # Le widget Tcl d'origine est renommé, la commande du widget passe par commande()
+        self.original = widget._w + "_original"
+        self.tk.call("rename", widget._w, self.original)
+        self.tk.createcommand(widget._w, self.commande)
+
+    def appel(self, *arguments):
+        """Appelle le widget Tcl d'origine"""
+        return self.tk.call((self.original,) + arguments)
+
+    def commande(self, operation, *arguments):
+        """Exécute une commande du widget, et note les lignes touchées par insert, delete et replace"""
+        if operation == 'insert' and arguments:
+            ligne = self.ligne(arguments[0])
+            resultat = self.appel(operation, *arguments)
+            # Les arguments sont des textes suivis de leurs étiquettes
+            lignes = sum(texte.count('\n') for texte in arguments[1::2])
+            self.insere(ligne, lignes)
+            return resultat
+        if operation in ('delete', 'replace') and arguments:
+            ligne = self.ligne(arguments[0])
+            lignes = max(self.ligne(arguments[1]) - ligne, 0) if len(arguments) > 1 else 0
+            resultat = self.appel(operation, *arguments)
+            self.supprime(ligne, lignes)
+            if operation == 'replace':
+                self.insere(ligne, sum(texte.count('\n') for texte in arguments[2::2]))
+            return resultat
+        return self.appel(operation, *arguments)
+
+    def ligne(self, index):
+        """Retourne le numéro de ligne d'un index, la fin du texte étant sur la dernière ligne"""
+        return min(ligneColonne(self.appel('index', index))[0], ligneColonne(self.appel('index', 'end - 1 chars'))[0])
+
+    def insere(self, ligne, lignes):
+        """Note l'insertion de lignes nouvelles après la ligne, qui est modifiée"""
+        if lignes:
+            # L'état de fin de la ligne modifiée devient celui de la dernière ligne insérée
+            self.etats[ligne:ligne] = [None] * lignes
+            if self.derniere is not None and self.derniere > ligne:
+                self.derniere += lignes
+        self.touche(ligne, ligne + lignes)
+
+    def supprime(self, ligne, lignes):
+        """Note la suppression des lignes qui suivent la ligne, qui est modifiée"""
+        if lignes:
+            del self.etats[ligne:ligne + lignes]
+            if self.derniere is not None and self.derniere > ligne:
+                self.derniere = max(self.derniere - lignes, ligne)
+        self.touche(ligne, ligne)
+
+    def touche(self, premiere, derniere):
+        """Ajoute des lignes à recolorer et programme la coloration"""
+        self.premiere = premiere if self.premiere is None else min(self.premiere, premiere)
+        self.derniere = derniere if self.derniere is None else max(self.derniere, derniere)
+        if self.programme is None:
+            self.programme = self.widget.after_idle(self.colore)
+
+    def colore(self):
+        """Recolore les lignes touchées, puis les suivantes tant que leur état de départ change"""
+        self.programme = None
+        if self.premiere is None:
+            return 0
+        nombre = ligneColonne(self.appel('index', 'end - 1 chars'))[0]
+        if len(self.etats) != nombre + 1:
+            # Le cache ne correspond plus au texte : tout est recoloré
+            self.etats = [ETATINITIAL] + [None] * nombre
+            self.premiere, self.derniere = 1, nombre
+        ligne = max(self.premiere, 1)
+        derniere = min(self.derniere, nombre)
+        self.premiere = self.derniere = None
+        etat = self.etats[ligne - 1] or ETATINITIAL
+        colorees = 0
+        while ligne <= nombre:
+            jetons, suivant = decoupe(self.appel('get', '%d.0' % ligne, '%d.end' % ligne), etat)
+            self.etiquette(ligne, jetons)
+            colorees += 1
+            ancien = self.etats[ligne]
+            self.etats[ligne] = suivant
+            if ligne >= derniere and ancien == suivant:
+                break
+            etat = suivant
+            ligne += 1
+        return colorees
+
+    def etiquette(self, ligne, jetons):
+        """Remplace les étiquettes d'une ligne, un seul appel à Tk par classe"""
+        for classe in self.classes:
+            self.appel('tag', 'remove', classe, '%d.0' % ligne, '%d.end' % ligne)
+        intervalles = {}
+        for classe, debut, fin in jetons:
+            intervalles.setdefault(classe, []).extend(('%d.%d' % (ligne, debut), '%d.%d' % (ligne, fin)))
+        for classe, indices in intervalles.iteritems():
+            self.appel('tag', 'add', classe, *indices)
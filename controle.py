@@ -0,0 +1,254 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Serveur de contrôle de Pybniz
+
+Permet de piloter Pybniz depuis une console lumière ou un pont MIDI par des
+datagrammes UDP sur 127.0.0.1, ou sur une socket Unix si l'adresse est un
+chemin. Chaque ligne d'un datagramme est une commande, plusieurs commandes
+peuvent être envoyées dans un même datagramme. La réponse contient une ligne
+par commande, 'ok ...' ou 'erreur ...', suivie des lignes annoncées par
+'ok N' pour les commandes qui retournent une liste :
+
+  ping
+  lance <set> [x y taille]           ok <pid>, ou ok attente si la machine est saturée
+  remplace <set> [x y taille]
+  arrete <pid> | tout
+  liste                               ok N, puis 'pid set x y taille'
+  sets [filtre]                       ok N, puis un nom de set par ligne
+  cherche <motif> [regex]             ok N, puis les sets dont le code contient le motif
+  journal [set|pid] [N]               ok N, puis les N dernières lignes écrites par les instances
+  charge <set>                        ok <code>
+  sauve <set> <code> [x y taille]
+
+Les arguments contenant des espaces sont entre guillemets, le code d'un set
+est écrit sur une ligne avec les échappements de Python (\\n) et entre
+apostrophes. Les commandes sont exécutées dans le thread du serveur, sans
+passer par la boucle Tk.
+"""
+
+from socket import socket, AF_INET, AF_UNIX, SOCK_DGRAM, error as ErreurSocket
+from threading import Thread
+from shlex import split
+from inspect import getargspec
+from pipes import quote
+from os import remove, getpid
+from errno import EMSGSIZE
+from os.path import exists
+from stockage import lisXYT, octets
+from gouverneur import EnAttente
+from journaux import formate
+
+ADRESSE = ("127.0.0.1", 9011)
+TAILLEDATAGRAMME = 65507
+# Nombre de lignes de journal répondues par défaut
+LIGNESJOURNAL = 50
+DELAIREPONSE = 1.0
+
+
+def commande(*champs):
+    """Retourne une ligne de commande dont les champs sont protégés, le code d'un set doit être échappé par echappe()"""
+    return " ".join(quote(str(champ)) for champ in champs)
+
+
+def echappe(texte):
+    """Retourne le code d'un set sur une seule ligne"""
+    return octets(texte).encode('string_escape')
+
+
+def desechappe(texte):
+    """Retourne le code d'un set échappé par echappe()"""
+    return texte.decode('string_escape')
+
+
+def ouvreSocket(adresse):
+    """Retourne une socket datagramme pour l'adresse UDP (hôte, port) ou le chemin de socket Unix"""
+    return socket(AF_UNIX if isinstance(adresse, basestring) else AF_INET, SOCK_DGRAM)
+
+
+def envoie(lignes, adresse=ADRESSE, delai=DELAIREPONSE):
+    """Envoie des commandes en un seul datagramme et retourne les lignes de la réponse"""
+    client = ouvreSocket(adresse)
+    chemin = None
+    try:
+        if isinstance(adresse, basestring):
+            # Un client de socket Unix doit avoir une adresse pour recevoir la réponse
+            chemin = "%s.client%d" % (adresse, getpid())
+            if exists(chemin):
+                remove(chemin)
+            client.bind(chemin)
+        client.settimeout(delai)
+        client.sendto("\n".join(lignes), adresse)
+        return client.recv(TAILLEDATAGRAMME).split("\n")
+    finally:
+        client.close()
+        if chemin and exists(chemin):
+            remove(chemin)
+
+
+class ErreurCommande(Exception):
+    """Exception levée pour une commande invalide"""
+
+
+def accepte(methode, nombre):
+    """Indique si la méthode d'une commande accepte nombre arguments"""
+    arguments, variables, nommes, defauts = getargspec(methode)
+    # Le premier argument est self
+    maximum = len(arguments) - 1
+    return maximum - len(defauts or ()) <= nombre and (variables is not None or nombre <= maximum)
+
+
+class ServeurControle(object):
+    """Reçoit les commandes dans un thread et les exécute avec l'instance de Pybniz"""
+
+    def __init__(self, pybniz, adresse=ADRESSE):
+        self.pybniz = pybniz
+        self.socket = ouvreSocket(adresse)
+        if isinstance(adresse, basestring) and exists(adresse):
+            remove(adresse)
+        self.socket.bind(adresse)
+        self.adresse = self.socket.getsockname()
+        self.actif = False
+        self.thread = None
+        self.nombre = 0
+
+    def demarre(self):
+        """Démarre le thread du serveur"""
+        self.actif = True
+        self.thread = Thread(target=self.serve, name="Controle")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def arrete(self):
+        """Arrête le serveur, un datagramme vide réveille le thread en attente"""
+        self.actif = False
+        if self.thread is not None:
+            reveil = ouvreSocket(self.adresse)
+            try:
+                reveil.sendto("", self.adresse)
+            except ErreurSocket:
+                pass
+            reveil.close()
+            self.thread.join()
+        self.socket.close()
+        if isinstance(self.adresse, basestring) and exists(self.adresse):
+            remove(self.adresse)
+
+    def serve(self):
+        """Boucle du thread : reçoit un datagramme, exécute ses commandes et envoie la réponse"""
+        while self.actif:
+            try:
+                donnees, client = self.socket.recvfrom(TAILLEDATAGRAMME)
+            except ErreurSocket:
+                continue
+            if not self.actif:
+                break
+            reponse = self.traite(donnees)
+            if client and reponse:
+                try:
+                    self.socket.sendto(reponse, client)
+                except ErreurSocket as erreur:
+                    if erreur.errno != EMSGSIZE:
+                        # Le client est parti avant la réponse
+                        continue
+                    try:
+                        self.socket.sendto("erreur reponse trop longue", client)
+                    except ErreurSocket:
+                        continue
+
+    def traite(self, donnees):
+        """Exécute les commandes d'un datagramme et retourne la réponse"""
+        reponses = []
+        for ligne in donnees.splitlines():
+            if not ligne.strip():
+                continue
+            self.nombre += 1
+            try:
+                champs = split(ligne)
+                methode = getattr(self, "commande" + champs[0].capitalize(), None)
+                if methode is None:
+                    raise ErreurCommande("commande inconnue %s" % champs[0])
+                if not accepte(methode, len(champs) - 1):
+                    raise ErreurCommande("arguments invalides : %s" % ligne)
+                reponses.extend(methode(*champs[1:]))
+            except Exception as erreur:
+                reponses.append("erreur %s" % str(erreur).replace("\n", " "))
+        return "\n".join(reponses)
+
+    def geometrie(self, texte, xyt):
+        """Retourne la position et la taille indiquées, sinon celles du set"""
+        if xyt:
+            if len(xyt) != 3:
+                raise ErreurCommande("il faut x, y et taille")
+            return tuple(int(v) for v in xyt)
+        return lisXYT(texte) or (0, 0, 512)
+
+    def commandePing(self):
+        """Répond ok, pour mesurer la latence"""
+        return ["ok"]
+
+    def commandeLance(self, nomset, *xyt):
+        """Lance un set, à sa position ou à celle indiquée, et répond son PID"""
+        texte = self.pybniz.chargeSet(nomset)
+        posx, posy, taille = self.geometrie(texte, xyt)
+        try:
+            return ["ok %d" % self.pybniz.lanceIBNIZ(nomset, texte, posx, posy, taille).pid]
+        except EnAttente:
+            return ["ok attente"]
+
+    def commandeRemplace(self, nomset, *xyt):
+        """Remplace à chaud la dernière instance du set, et répond le PID de la nouvelle"""
+        texte = self.pybniz.chargeSet(nomset)
+        posx, posy, taille = self.geometrie(texte, xyt)
+        return ["ok %d" % self.pybniz.remplaceIBNIZ(nomset, texte, posx, posy, taille).pid]
+
+    def commandeArrete(self, pid):
+        """Arrête une instance, ou toutes"""
+        if pid == "tout":
+            self.pybniz.superviseur.arreteTout()
+        elif self.pybniz.superviseur.arrete(int(pid)) is None:
+            raise ErreurCommande("pas d'instance %s" % pid)
+        return ["ok"]
+
+    def commandeListe(self):
+        """Répond la liste des instances en cours"""
+        lignes = [commande(i.pid, i.nomset, i.posx, i.posy, i.taille) for i in self.pybniz.superviseur.instances]
+        return ["ok %d" % len(lignes)] + lignes
+
+    def commandeSets(self, filtre=""):
+        """Répond la liste des sets dont le nom contient le filtre"""
+        filtre = filtre.lower()
+        noms = [quote(nomset) for nomset in self.pybniz.listesets if filtre in nomset.lower()]
+        return ["ok %d" % len(noms)] + noms
+
+    def commandeCherche(self, motif, regex=None):
+        """Répond la liste des sets dont le code contient le motif, ou l'expression régulière"""
+        if regex not in (None, "regex"):
+            raise ErreurCommande("option inconnue %s" % regex)
+        noms = [quote(nomset) for nomset in self.pybniz.chercheSets(motif, regex is not None)]
+        return ["ok %d" % len(noms)] + noms
+
+    def commandeJournal(self, filtre=None, nombre=LIGNESJOURNAL):
+        """Répond les dernières lignes écrites par les instances, toutes ou celles du set ou du PID"""
+        journaux = self.pybniz.journaux
+        if journaux is None:
+            raise ErreurCommande("sortie des instances non capturee")
+        if filtre is not None and filtre.isdigit():
+            lignes = journaux.lignes(pid=int(filtre), maximum=int(nombre))
+        else:
+            lignes = journaux.lignes(nomset=filtre, maximum=int(nombre))
+        return ["ok %d" % len(lignes)] + [formate(entree) for entree in lignes]
+
+    def commandeCharge(self, nomset):
+        """Répond le code du set échappé"""
+        return ["ok " + echappe(self.pybniz.chargeSet(nomset))]
+
+    def commandeSauve(self, nomset, texte, *xyt):
+        """Sauve le code échappé d'un set, à sa position ou à celle indiquée"""
+        texte = desechappe(texte).decode('utf-8')
+        posx, posy, taille = self.geometrie(texte, xyt)
+        nouveau = nomset not in self.pybniz.listesets
+        self.pybniz.sauveSet(nomset, texte, posx, posy, taille)
+        self.pybniz.ajouterSet(nomset)
+        self.pybniz.signaleSets([nomset] if nouveau else [], [], [] if nouveau else [nomset])
+        return ["ok"]
@@ -0,0 +1,100 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Gouverneur des lancements
+
+Avant chaque lancement, le gouverneur estime la charge de la machine : la
+charge moyenne de /proc/loadavg et le CPU mesuré des instances, rapportés au
+nombre de coeurs. Le coût d'une nouvelle instance est estimé d'après le CPU
+par pixel des instances en cours. Si la charge prévue dépasse CHARGEMAX, selon
+la politique le lancement est mis en attente jusqu'à ce que la charge baisse,
+la taille de la fenêtre est réduite pour tenir dans le budget, ou le
+lancement est refusé.
+"""
+
+from math import sqrt
+from threading import Lock
+
+# Charge maximum visée, en fraction des coeurs disponibles
+CHARGEMAX = 0.9
+# Taille en dessous de laquelle une fenêtre n'est plus réduite mais refusée
+TAILLEMIN = 64
+# Coût estimé d'un pixel en fraction de coeur, tant qu'aucune instance n'a été mesurée : un coeur pour 512x512
+COUTPIXEL = 1.0 / (512 * 512)
+
+
+def lisCharge():
+    """Retourne la charge moyenne sur une minute, lue dans /proc/loadavg, ou 0"""
+    try:
+        with open('/proc/loadavg') as fic:
+            return float(fic.read().split()[0])
+    except (IOError, ValueError, IndexError):
+        return 0.0
+
+
+class Surcharge(Exception):
+    """Exception levée quand un lancement est refusé parce que la machine est saturée"""
+
+
+class EnAttente(Surcharge):
+    """Exception levée quand un lancement est mis en attente jusqu'à ce que la charge baisse"""
+
+
+class Gouverneur(object):
+    """Décide de chaque lancement selon la charge : politique est 'attente', 'reduit', 'refus' ou None"""
+
+    def __init__(self, politique='reduit', coeurs=1, chargemax=CHARGEMAX):
+        self.politique = politique
+        self.coeurs = max(coeurs, 1)
+        self.chargemax = chargemax
+        self.verrou = Lock()
+        # Lancements en attente : (nomset, texte, posx, posy, taille)
+        self.attente = []
+
+    def estime(self, instances, telemetrie):
+        """Retourne la charge actuelle et le coût estimé d'un pixel, en fraction des coeurs.
+Les instances pas encore mesurées, lancées depuis le dernier relevé, comptent pour leur coût estimé"""
+        mesures = dict((ligne[0], ligne[2]) for ligne in telemetrie.tableau())
+        cpu = sum(mesures.values()) / 100.0 / self.coeurs
+        pixels = sum(i.taille * i.taille for i in instances if mesures.get(i.pid))
+        nouveaux = sum(i.taille * i.taille for i in instances if not mesures.get(i.pid))
+        cout = cpu / pixels if pixels and cpu > 0 else COUTPIXEL / self.coeurs
+        # La charge moyenne de /proc/loadavg réagit en une minute, le CPU mesuré en un relevé
+        charge = max(lisCharge() / self.coeurs, cpu + cout * nouveaux)
+        return charge, cout
+
+    def admet(self, taille, instances, telemetrie):
+        """Retourne la taille à laquelle lancer une instance, lève Surcharge ou EnAttente sinon"""
+        if self.politique is None:
+            return taille
+        charge, cout = self.estime(instances, telemetrie)
+        if charge + cout * taille * taille <= self.chargemax:
+            return taille
+        message = "Machine saturée (charge %d%%, %d%% prévus)" % (charge * 100, (charge + cout * taille * taille) * 100)
+        if self.politique == 'reduit':
+            reste = self.chargemax - charge
+            reduite = int(sqrt(reste / cout)) if reste > 0 else 0
+            if reduite >= TAILLEMIN:
+                return reduite
+            raise Surcharge(message + ", même à la taille minimum")
+        if self.politique == 'attente':
+            raise EnAttente(message + ", lancement mis en attente")
+        raise Surcharge(message + ", lancement refusé")
+
+    def metEnAttente(self, *lancement):
+        """Ajoute un lancement à la file d'attente"""
+        with self.verrou:
+            self.attente = self.attente + [lancement]
+
+    def prochain(self, instances, telemetrie):
+        """Retire et retourne le premier lancement en attente si la charge le permet, sinon None"""
+        with self.verrou:
+            if not self.attente:
+                return None
+            taille = self.attente[0][4]
+            charge, cout = self.estime(instances, telemetrie)
+            if charge + cout * taille * taille > self.chargemax:
+                return None
+            lancement = self.attente[0]
+            self.attente = self.attente[1:]
+            return lancement
@@ -0,0 +1,286 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Historique des versions des sets
+
+Chaque sauvegarde d'un set ajoute une révision à son journal. Le texte est
+rangé dans un magasin d'objets adressés par leur empreinte : un texte déjà
+connu n'est pas enregistré une seconde fois, et un nouveau texte est
+enregistré comme les différences, ligne par ligne, avec la révision
+précédente du set. Les objets sont compressés, et regroupés dans un paquet
+dès qu'ils sont assez nombreux, pour que des milliers de sauvegardes
+automatiques pendant un spectacle prennent peu de place et peu de fichiers.
+Au-delà de MAXPAQUETS paquets, ils sont fusionnés en un seul : le nombre de
+fichiers à ouvrir au démarrage reste borné. Le répertoire n'est créé qu'à la
+première sauvegarde ou lecture de l'historique.
+
+  .historique/objets/<empreinte>   objets isolés
+  .historique/paquets/<n>.paquet   objets regroupés, avec leur index <n>.index
+  .historique/journaux/<set>       une ligne 'instant empreinte' par révision
+"""
+
+from os import listdir, mkdir, remove, rename, fsync
+from os.path import exists, join
+from threading import RLock
+from collections import OrderedDict
+from difflib import SequenceMatcher, unified_diff
+from hashlib import sha1
+from urllib import quote
+from time import time
+from stockage import octets
+import marshal
+import zlib
+
+REPERTOIREHISTORIQUE = ".historique"
+# Nombre d'objets isolés au-delà duquel ils sont regroupés dans un paquet
+SEUILPAQUET = 256
+# Nombre de paquets à partir duquel le prochain regroupement les fusionne tous
+MAXPAQUETS = 16
+# Longueur maximum d'une chaîne de différences, au-delà le texte est enregistré entier
+MAXCHAINE = 32
+# Nombre de textes reconstruits gardés en mémoire
+TEXTESENMEMOIRE = 64
+
+
+def empreinte(texte):
+    """Retourne l'empreinte d'un texte, son adresse dans le magasin"""
+    return sha1(texte).hexdigest()
+
+
+def differences(base, texte):
+    """Retourne les opérations qui construisent texte à partir de base : ('c', debut, fin) copie
+des lignes de base, ('i', lignes) insère des lignes"""
+    lignesBase = base.splitlines(True)
+    lignes = texte.splitlines(True)
+    operations = []
+    for code, debutBase, finBase, debut, fin in SequenceMatcher(None, lignesBase, lignes, False).get_opcodes():
+        if code == 'equal':
+            operations.append(('c', debutBase, finBase))
+        elif code in ('replace', 'insert'):
+            operations.append(('i', ''.join(lignes[debut:fin])))
+    return operations
+
+
+def applique(base, operations):
+    """Reconstruit le texte à partir de base et des opérations de differences()"""
+    lignesBase = base.splitlines(True)
+    morceaux = []
+    for operation in operations:
+        if operation[0] == 'c':
+            morceaux.extend(lignesBase[operation[1]:operation[2]])
+        else:
+            morceaux.append(operation[1])
+    return ''.join(morceaux)
+
+
+class Historique(object):
+    """Magasin d'objets et journaux des révisions des sets"""
+
+    def __init__(self, repertoire=REPERTOIREHISTORIQUE):
+        self.repertoire = repertoire
+        self.verrou = RLock()
+        self.ouvert = False
+        self.journaux = {}
+        self.textes = OrderedDict()
+
+    def ouvre(self):
+        """Crée les répertoires et lit les index des paquets, à la première utilisation de l'historique"""
+        if self.ouvert:
+            return
+        with self.verrou:
+            if self.ouvert:
+                return
+            self.charge()
+            self.ouvert = True
+
+    def charge(self):
+        """Crée les répertoires qui manquent, et lit la liste des objets isolés et les index des paquets"""
+        repertoire = self.repertoire
+        for chemin in (repertoire, join(repertoire, "objets"), join(repertoire, "paquets"), join(repertoire, "journaux")):
+            if not exists(chemin):
+                mkdir(chemin)
+        # Les fichiers .tmp sont des écritures interrompues
+        self.isoles = set(nom for nom in listdir(join(repertoire, "objets")) if '.' not in nom)
+        # empreinte -> (numéro du paquet, position, longueur)
+        self.index = {}
+        self.paquets = sorted(int(nom.split('.')[0]) for nom in listdir(join(repertoire, "paquets"))
+                              if nom.endswith(".index"))
+        for numero in self.paquets:
+            with open(self.cheminPaquet(numero, "index"), 'rb') as fic:
+                for cle, (position, longueur) in marshal.load(fic).iteritems():
+                    self.index[cle] = (numero, position, longueur)
+
+    def cheminPaquet(self, numero, extension):
+        """Retourne le chemin d'un paquet ou de son index"""
+        return join(self.repertoire, "paquets", "%d.%s" % (numero, extension))
+
+    def cheminJournal(self, nomset):
+        """Retourne le chemin du journal d'un set"""
+        return join(self.repertoire, "journaux", quote(octets(nomset), safe=''))
+
+    def existe(self, cle):
+        """Indique si l'objet est dans le magasin"""
+        self.ouvre()
+        return cle in self.isoles or cle in self.index
+
+    def litObjet(self, cle):
+        """Retourne l'objet décompressé : ('t', texte) ou ('d', base, profondeur, opérations)"""
+        self.ouvre()
+        if cle in self.isoles:
+            with open(join(self.repertoire, "objets", cle), 'rb') as fic:
+                donnees = fic.read()
+        else:
+            numero, position, longueur = self.index[cle]
+            with open(self.cheminPaquet(numero, "paquet"), 'rb') as fic:
+                fic.seek(position)
+                donnees = fic.read(longueur)
+        return marshal.loads(zlib.decompress(donnees))
+
+    def ecritObjet(self, cle, objet):
+        """Écrit un objet isolé, regroupe les objets isolés dans un paquet quand ils sont assez nombreux"""
+        self.ouvre()
+        chemin = join(self.repertoire, "objets", cle)
+        with open(chemin + ".tmp", 'wb') as fic:
+            fic.write(zlib.compress(marshal.dumps(objet), 9))
+        rename(chemin + ".tmp", chemin)
+        self.isoles.add(cle)
+        if len(self.isoles) >= SEUILPAQUET:
+            self.empaquette()
+
+    def texte(self, cle):
+        """Retourne le texte d'un objet, en suivant sa chaîne de différences"""
+        with self.verrou:
+            if cle in self.textes:
+                self.textes[cle] = self.textes.pop(cle)
+                return self.textes[cle]
+            objet = self.litObjet(cle)
+            if objet[0] == 't':
+                texte = objet[1]
+            else:
+                texte = applique(self.texte(objet[1]), objet[3])
+            self.textes[cle] = texte
+            while len(self.textes) > TEXTESENMEMOIRE:
+                self.textes.popitem(last=False)
+            return texte
+
+    def profondeur(self, cle):
+        """Retourne la longueur de la chaîne de différences d'un objet"""
+        objet = self.litObjet(cle)
+        return 0 if objet[0] == 't' else objet[2]
+
+    def revisions(self, nomset):
+        """Retourne les couples (instant, empreinte) des révisions du set, de la plus ancienne à la plus récente"""
+        nomset = octets(nomset)
+        self.ouvre()
+        with self.verrou:
+            if nomset not in self.journaux:
+                revisions = []
+                if exists(self.cheminJournal(nomset)):
+                    with open(self.cheminJournal(nomset)) as fic:
+                        for ligne in fic:
+                            instant, cle = ligne.split()
+                            revisions.append((float(instant), cle))
+                self.journaux[nomset] = revisions
+            return self.journaux[nomset]
+
+    def enregistre(self, nomset, texte):
+        """Ajoute une révision au set si le texte a changé, et retourne son numéro, ou None"""
+        nomset = octets(nomset)
+        if isinstance(texte, unicode):
+            texte = texte.encode('utf-8')
+        cle = empreinte(texte)
+        with self.verrou:
+            revisions = self.revisions(nomset)
+            if revisions and revisions[-1][1] == cle:
+                return None
+            if not self.existe(cle):
+                objet = ('t', texte)
+                if revisions:
+                    base = revisions[-1][1]
+                    profondeur = self.profondeur(base) + 1
+                    if profondeur <= MAXCHAINE:
+                        operations = differences(self.texte(base), texte)
+                        # Des différences plus longues que le texte ne servent à rien
+                        if len(marshal.dumps(operations)) < len(texte):
+                            objet = ('d', base, profondeur, operations)
+                self.ecritObjet(cle, objet)
+                self.textes[cle] = texte
+            instant = time()
+            with open(self.cheminJournal(nomset), 'a') as fic:
+                fic.write("%.3f %s\n" % (instant, cle))
+            self.journaux[nomset] = revisions + [(instant, cle)]
+            return len(revisions)
+
+    def conserve(self, texte):
+        """Range un texte dans le magasin sans ajouter de révision, et retourne son empreinte"""
+        if isinstance(texte, unicode):
+            texte = texte.encode('utf-8')
+        cle = empreinte(texte)
+        with self.verrou:
+            if not self.existe(cle):
+                self.ecritObjet(cle, ('t', texte))
+        return cle
+
+    def revision(self, nomset, numero):
+        """Retourne le texte de la révision numéro du set, lève IndexError si elle n'existe pas"""
+        return self.texte(self.revisions(nomset)[numero][1])
+
+    def diff(self, nomset, numero):
+        """Retourne les différences entre la révision numéro du set et la précédente"""
+        revisions = self.revisions(nomset)
+        precedent = self.revision(nomset, numero - 1).splitlines(True) if numero > 0 else []
+        texte = self.texte(revisions[numero][1]).splitlines(True)
+        return ''.join(unified_diff(precedent, texte, "revision %d" % (numero - 1), "revision %d" % numero))
+
+    def empaquette(self):
+        """Regroupe tous les objets isolés dans un nouveau paquet, avec les objets des paquets existants
+s'il y en a au moins MAXPAQUETS, retourne le nombre d'objets du nouveau paquet"""
+        self.ouvre()
+        with self.verrou:
+            if not self.isoles:
+                return 0
+            numero = self.paquets[-1] + 1 if self.paquets else 0
+            fusionnes = self.paquets if len(self.paquets) >= MAXPAQUETS else []
+            index = {}
+            position = 0
+            chemin = self.cheminPaquet(numero, "paquet")
+            with open(chemin + ".tmp", 'wb') as paquet:
+                # Les objets des anciens paquets sont recopiés dans leur ordre, chaque paquet est lu une fois
+                contenus = dict((ancien, []) for ancien in fusionnes)
+                for cle, (ancien, debut, longueur) in self.index.iteritems():
+                    if ancien in contenus:
+                        contenus[ancien].append((debut, longueur, cle))
+                for ancien in fusionnes:
+                    with open(self.cheminPaquet(ancien, "paquet"), 'rb') as fic:
+                        for debut, longueur, cle in sorted(contenus[ancien]):
+                            fic.seek(debut)
+                            paquet.write(fic.read(longueur))
+                            index[cle] = (position, longueur)
+                            position += longueur
+                for cle in sorted(self.isoles):
+                    with open(join(self.repertoire, "objets", cle), 'rb') as fic:
+                        donnees = fic.read()
+                    paquet.write(donnees)
+                    index[cle] = (position, len(donnees))
+                    position += len(donnees)
+                paquet.flush()
+                fsync(paquet.fileno())
+            rename(chemin + ".tmp", chemin)
+            # L'index est écrit après le paquet : un paquet sans index est ignoré
+            chemin = self.cheminPaquet(numero, "index")
+            with open(chemin + ".tmp", 'wb') as fic:
+                marshal.dump(index, fic)
+                fic.flush()
+                fsync(fic.fileno())
+            rename(chemin + ".tmp", chemin)
+            # Un objet présent dans deux paquets est lu dans le plus récent : les anciens sont retirés ensuite
+            for ancien in fusionnes:
+                remove(self.cheminPaquet(ancien, "index"))
+                remove(self.cheminPaquet(ancien, "paquet"))
+            self.paquets = [ancien for ancien in self.paquets if ancien not in fusionnes] + [numero]
+            for cle, (position, longueur) in index.iteritems():
+                self.index[cle] = (numero, position, longueur)
+            for cle in self.isoles:
+                remove(join(self.repertoire, "objets", cle))
+            self.isoles = set()
+            return len(index)
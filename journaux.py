@@ -0,0 +1,227 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Journaux des instances IBNIZ
+
+La sortie standard et la sortie d'erreur de chaque instance sont des tubes
+lus par un seul thread qui attend avec poll() : une instance bavarde ne
+bloque jamais sur un tube plein, et ses lignes ne se mélangent plus dans le
+terminal de Pybniz. Chaque instance a un tampon circulaire de
+LIGNESPARINSTANCE lignes, les lignes trop longues sont coupées, et seuls les
+journaux des TERMINEES dernières instances terminées sont gardés : la
+mémoire reste bornée quel que soit le volume de la sortie.
+
+Quand Pybniz se ferme en laissant des instances tourner, leurs tubes sont
+confiés à des processus cat qui les vident dans /dev/null : sans lecteur,
+les écritures d'une instance échoueraient ou l'arrêteraient. Leur sortie
+n'est plus gardée après la fermeture de Pybniz.
+"""
+
+from os import read, write, pipe, devnull, O_NONBLOCK
+from threading import Thread, Lock
+from collections import deque, OrderedDict
+from select import poll, POLLIN, POLLHUP
+from fcntl import fcntl, F_GETFD, F_SETFD, F_GETFL, F_SETFL, FD_CLOEXEC
+from time import time, strftime, localtime
+from operator import itemgetter
+from subprocess import Popen
+import errno
+
+LIGNESPARINSTANCE = 1000
+MAXLONGUEURLIGNE = 1024
+# Nombre de journaux d'instances terminées gardés
+TERMINEES = 32
+TAILLELECTURE = 65536
+# Durée maximum d'une attente, pour que la lecture puisse être arrêtée rapidement
+ATTENTEMAX = 0.5
+
+
+def prepareDescripteur(descripteur):
+    """Rend la lecture non bloquante, et ferme le descripteur dans les processus lancés ensuite"""
+    fcntl(descripteur, F_SETFL, fcntl(descripteur, F_GETFL) | O_NONBLOCK)
+    fcntl(descripteur, F_SETFD, fcntl(descripteur, F_GETFD) | FD_CLOEXEC)
+
+
+def formate(entree):
+    """Retourne une ligne de journal (instant, pid, set, flux, ligne) pour l'affichage"""
+    instant, pid, nomset, flux, ligne = entree
+    return "%s %d %s %s %s" % (strftime("%H:%M:%S", localtime(instant)), pid, nomset, flux, ligne)
+
+
+class Journal(object):
+    """Les dernières lignes écrites par une instance"""
+
+    def __init__(self, instance, lignes=LIGNESPARINSTANCE):
+        self.pid = instance.pid
+        self.nomset = instance.nomset
+        self.lignes = deque(maxlen=lignes)
+        # Début de la ligne en cours de chaque flux
+        self.restes = {}
+        self.total = 0
+        self.ouverts = 0
+
+    def ajoute(self, flux, donnees, instant):
+        """Découpe les données lues en lignes et les ajoute au tampon"""
+        morceaux = (self.restes.get(flux, '') + donnees).split('\n')
+        reste = morceaux.pop()
+        # Une ligne sans fin est coupée, elle ne grossit pas sans limite
+        while len(reste) > MAXLONGUEURLIGNE:
+            morceaux.append(reste[:MAXLONGUEURLIGNE])
+            reste = reste[MAXLONGUEURLIGNE:]
+        self.restes[flux] = reste
+        self.total += len(morceaux)
+        # Seules les dernières lignes d'une rafale restent dans le tampon
+        for ligne in morceaux[-self.lignes.maxlen:]:
+            self.lignes.append((instant, flux, ligne[:MAXLONGUEURLIGNE].rstrip('\r')))
+
+    def ferme(self, flux, instant):
+        """Ajoute la dernière ligne d'un flux fermé"""
+        reste = self.restes.pop(flux, '')
+        if reste:
+            self.ajoute(flux, reste + '\n', instant)
+        self.ouverts -= 1
+
+
+class Journaux(object):
+    """Lit la sortie des instances dans un thread et garde un journal borné par instance"""
+
+    def __init__(self, lignes=LIGNESPARINSTANCE, terminees=TERMINEES):
+        self.lignesParInstance = lignes
+        self.terminees = terminees
+        self.verrou = Lock()
+        # PID -> journal, dans l'ordre des lancements
+        self.journaux = OrderedDict()
+        # descripteur -> (journal, nom du flux, fichier du tube)
+        self.flux = {}
+        self.scrutateur = poll()
+        # Un octet écrit dans ce tube réveille le thread quand un flux est ajouté
+        self.reveil = pipe()
+        for descripteur in self.reveil:
+            prepareDescripteur(descripteur)
+        self.scrutateur.register(self.reveil[0], POLLIN)
+        # Incrémenté à chaque lecture, pour ne rafraîchir l'affichage que si les journaux ont changé
+        self.version = 0
+        self.actif = False
+        self.thread = None
+
+    def suit(self, instance):
+        """Ajoute les tubes stdout et stderr de l'instance, à appeler juste après son lancement"""
+        journal = Journal(instance, self.lignesParInstance)
+        with self.verrou:
+            self.journaux[instance.pid] = journal
+            for nom, fichier in (("out", instance.process.stdout), ("err", instance.process.stderr)):
+                if fichier is None:
+                    continue
+                descripteur = fichier.fileno()
+                prepareDescripteur(descripteur)
+                self.flux[descripteur] = (journal, nom, fichier)
+                journal.ouverts += 1
+                self.scrutateur.register(descripteur, POLLIN)
+            self.oublie()
+        try:
+            write(self.reveil[1], 'r')
+        except OSError:
+            # Le tube de réveil est plein, le thread est déjà réveillé
+            pass
+        return journal
+
+    def oublie(self):
+        """Retire les plus anciens journaux des instances terminées au-delà de la limite"""
+        terminees = [pid for pid, journal in self.journaux.iteritems() if journal.ouverts <= 0]
+        for pid in terminees[:max(len(terminees) - self.terminees, 0)]:
+            del self.journaux[pid]
+
+    def demarre(self):
+        """Démarre le thread de lecture"""
+        self.actif = True
+        self.thread = Thread(target=self.lit, name="Journaux")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def arrete(self):
+        """Arrête le thread de lecture, les tubes restent ouverts jusqu'à l'arrêt des instances"""
+        self.actif = False
+        if self.thread is not None:
+            try:
+                write(self.reveil[1], 'r')
+            except OSError:
+                pass
+            self.thread.join()
+            self.thread = None
+
+    def confie(self, pids):
+        """Confie les tubes des instances indiquées, encore en cours, à des processus cat qui les vident après la
+fermeture de Pybniz, retourne le nombre de tubes confiés. Le thread de lecture doit être arrêté"""
+        confies = 0
+        with self.verrou:
+            with open(devnull, 'w') as nulle:
+                for descripteur, (journal, nom, fichier) in self.flux.items():
+                    if journal.pid not in pids:
+                        continue
+                    # L'état non bloquant est partagé avec le processus qui hérite du tube
+                    fcntl(descripteur, F_SETFL, fcntl(descripteur, F_GETFL) & ~O_NONBLOCK)
+                    Popen(["cat"], stdin=fichier, stdout=nulle, stderr=nulle, close_fds=True)
+                    self.scrutateur.unregister(descripteur)
+                    del self.flux[descripteur]
+                    fichier.close()
+                    confies += 1
+        return confies
+
+    def lit(self):
+        """Boucle du thread : attend des données sur les tubes et les ajoute aux journaux"""
+        while self.actif:
+            try:
+                evenements = self.scrutateur.poll(ATTENTEMAX * 1000)
+            except (IOError, OSError) as erreur:
+                if erreur.errno == errno.EINTR:
+                    continue
+                raise
+            instant = time()
+            for descripteur, evenement in evenements:
+                if descripteur == self.reveil[0]:
+                    try:
+                        read(descripteur, TAILLELECTURE)
+                    except OSError:
+                        pass
+                    continue
+                self.litFlux(descripteur, evenement, instant)
+
+    def litFlux(self, descripteur, evenement, instant):
+        """Lit les données disponibles d'un tube, et le ferme à la fin du flux"""
+        if descripteur not in self.flux:
+            return
+        journal, nom, fichier = self.flux[descripteur]
+        donnees = ''
+        if evenement & (POLLIN | POLLHUP):
+            try:
+                donnees = read(descripteur, TAILLELECTURE)
+            except OSError as erreur:
+                if erreur.errno == errno.EAGAIN:
+                    return
+        with self.verrou:
+            if donnees:
+                journal.ajoute(nom, donnees, instant)
+                self.version += 1
+            else:
+                # Fin du flux : l'instance s'est arrêtée ou a fermé sa sortie
+                self.scrutateur.unregister(descripteur)
+                del self.flux[descripteur]
+                fichier.close()
+                journal.ferme(nom, instant)
+                self.version += 1
+
+    def nomsets(self):
+        """Retourne les noms des sets qui ont un journal"""
+        with self.verrou:
+            return sorted(set(journal.nomset for journal in self.journaux.itervalues()))
+
+    def lignes(self, nomset=None, pid=None, maximum=None):
+        """Retourne les lignes (instant, pid, set, flux, ligne) des journaux, de toutes les instances
+ou de celles du set ou du PID, triées par instant, les maximum dernières si indiqué"""
+        with self.verrou:
+            copies = [(journal.pid, journal.nomset, list(journal.lignes)) for journal in self.journaux.itervalues()
+                      if (nomset is None or journal.nomset == nomset) and (pid is None or journal.pid == pid)]
+        entrees = [(instant, pid, nom, flux, ligne) for pid, nom, lignes in copies for instant, flux, ligne in lignes]
+        # Le tri est stable : les lignes lues ensemble restent dans leur ordre
+        entrees.sort(key=itemgetter(0))
+        return entrees[-maximum:] if maximum else entrees
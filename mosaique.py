@@ -0,0 +1,41 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Calcul de mosaïque pour le lancement groupé de sets ("mur vidéo")
+
+Les fenêtres IBNIZ sont carrées : pour N fenêtres dans une zone donnée, on
+cherche la plus grande taille de côté qui permet de placer les N fenêtres
+sans chevauchement sur une grille.
+"""
+
+
+def calculeMosaique(nombre, largeur, hauteur, taillemax=None):
+    """Retourne (taille, colonnes, lignes) pour placer nombre fenêtres carrées dans la zone,
+ou None si elles ne tiennent pas"""
+    if nombre <= 0:
+        return None
+    meilleur = None
+    # Pour chaque nombre de colonnes, la taille est limitée par la largeur et par la hauteur
+    for colonnes in xrange(1, nombre + 1):
+        lignes = (nombre + colonnes - 1) // colonnes
+        taille = min(largeur // colonnes, hauteur // lignes)
+        if taillemax is not None:
+            taille = min(taille, taillemax)
+        if taille > 0 and (meilleur is None or taille > meilleur[0]):
+            meilleur = (taille, colonnes, lignes)
+        # Au-delà, la largeur seule donne une taille plus petite que la meilleure trouvée
+        if meilleur is not None and largeur // colonnes < meilleur[0]:
+            break
+    return meilleur
+
+
+def positionsMosaique(nombre, largeur, hauteur, taillemax=None, origine=(0, 0)):
+    """Retourne la taille et la liste des positions (x, y) des fenêtres de la mosaïque"""
+    resultat = calculeMosaique(nombre, largeur, hauteur, taillemax)
+    if resultat is None:
+        return 0, []
+    taille, colonnes, lignes = resultat
+    x0, y0 = origine
+    positions = [(x0 + (i % colonnes) * taille, y0 + (i // colonnes) * taille)
+                 for i in xrange(nombre)]
+    return taille, positions
@@ -0,0 +1,176 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Navigateur de sets
+
+Liste virtuelle qui ne dessine que les lignes visibles, avec un champ de
+filtre incrémental et la navigation au clavier. Elle remplace l'OptionMenu
+qui devenait inutilisable avec des milliers de sets.
+"""
+
+from Tkinter import *
+from bisect import bisect_left
+import tkFont
+
+
+class NavigateurSets(Frame):
+    """Liste filtrable des sets, command(nomset) est appelée quand un set est choisi"""
+
+    def __init__(self, master=None, noms=(), command=None, lignes=8, font="Courier 11"):
+        Frame.__init__(self, master, bg='grey')
+        self.command = command
+        self.lignes = lignes
+        self.noms = sorted(noms)
+        self.filtre = ""
+        self.visibles = self.noms
+        self.debut = 0
+        self.courant = 0
+        self.hauteurLigne = tkFont.Font(font=font).metrics('linespace') + 2
+        # Le champ de filtre
+        self.texteFiltre = StringVar()
+        self.texteFiltre.trace('w', lambda *args: self.filtrer(self.texteFiltre.get()))
+        self.EntryFiltre = Entry(self, textvariable=self.texteFiltre)
+        self.EntryFiltre.pack(fill='x')
+        # La liste, une ligne de canevas par ligne visible
+        cadre = Frame(self)
+        cadre.pack(fill='x')
+        self.barre = Scrollbar(cadre, command=self.yview)
+        self.barre.pack(side='right', fill='y')
+        self.canevas = Canvas(cadre, height=lignes * self.hauteurLigne, bg='white', highlightthickness=0)
+        self.canevas.pack(side='left', fill='x', expand=True)
+        self.fonds = []
+        self.textes = []
+        for ligne in xrange(lignes):
+            y = ligne * self.hauteurLigne
+            self.fonds.append(self.canevas.create_rectangle(0, y, 10000, y + self.hauteurLigne, width=0, fill='white'))
+            self.textes.append(self.canevas.create_text(4, y + 1, anchor='nw', font=font))
+        # Les évènements clavier et souris
+        for widget in (self.EntryFiltre, self.canevas):
+            widget.bind("<Up>", lambda e: self.deplace(-1))
+            widget.bind("<Down>", lambda e: self.deplace(1))
+            widget.bind("<Prior>", lambda e: self.deplace(-self.lignes))
+            widget.bind("<Next>", lambda e: self.deplace(self.lignes))
+            widget.bind("<Return>", lambda e: self.choisir())
+            widget.bind("<Button-4>", lambda e: self.yview('scroll', -1, 'units'))
+            widget.bind("<Button-5>", lambda e: self.yview('scroll', 1, 'units'))
+            widget.bind("<MouseWheel>", lambda e: self.yview('scroll', -1 if e.delta > 0 else 1, 'units'))
+        self.canevas.bind("<Button-1>", self.clickLigne)
+        self.dessine()
+
+    def correspond(self, nomset, filtre=None):
+        """Indique si le nom du set contient le filtre, sans tenir compte de la casse"""
+        if filtre is None:
+            filtre = self.filtre
+        return filtre in nomset.lower()
+
+    def filtrer(self, filtre):
+        """Applique le filtre, en ne parcourant que les sets déjà retenus quand le filtre est complété"""
+        filtre = filtre.lower()
+        if filtre == self.filtre:
+            return
+        source = self.visibles if filtre.startswith(self.filtre) else self.noms
+        self.filtre = filtre
+        self.visibles = [v for v in source if self.correspond(v, filtre)] if filtre else self.noms
+        self.debut = 0
+        self.courant = 0
+        self.dessine()
+
+    def dessine(self):
+        """Met à jour les lignes visibles et la barre de défilement"""
+        for ligne in xrange(self.lignes):
+            index = self.debut + ligne
+            nomset = self.visibles[index] if index < len(self.visibles) else ""
+            self.canevas.itemconfigure(self.textes[ligne], text=nomset)
+            self.canevas.itemconfigure(self.fonds[ligne], fill='lightblue' if index == self.courant and nomset else 'white')
+        total = float(max(len(self.visibles), 1))
+        self.barre.set(self.debut / total, min(1.0, (self.debut + self.lignes) / total))
+
+    def defile(self, debut):
+        """Fait défiler la liste pour que la première ligne visible soit debut"""
+        self.debut = max(0, min(debut, len(self.visibles) - self.lignes))
+        self.dessine()
+
+    def yview(self, action, valeur, unite=None):
+        """Reçoit les commandes de la barre de défilement"""
+        if action == 'moveto':
+            self.defile(int(float(valeur) * len(self.visibles)))
+        elif action == 'scroll':
+            pas = self.lignes if unite == 'pages' else 1
+            self.defile(self.debut + int(valeur) * pas)
+
+    def deplace(self, pas):
+        """Déplace la ligne courante et fait défiler la liste pour qu'elle reste visible"""
+        if not self.visibles:
+            return "break"
+        self.courant = max(0, min(self.courant + pas, len(self.visibles) - 1))
+        if self.courant < self.debut:
+            self.debut = self.courant
+        elif self.courant >= self.debut + self.lignes:
+            self.debut = self.courant - self.lignes + 1
+        self.dessine()
+        return "break"
+
+    def clickLigne(self, e):
+        """Choisit le set sous le curseur de la souris"""
+        # Le focus permet de parcourir la liste avec les flèches
+        self.canevas.focus_set()
+        index = self.debut + int(self.canevas.canvasy(e.y) // self.hauteurLigne)
+        if index < len(self.visibles):
+            self.courant = index
+            self.dessine()
+            self.choisir()
+
+    def choisir(self):
+        """Appelle la commande avec le set courant"""
+        if self.command and self.courant < len(self.visibles):
+            self.command(self.visibles[self.courant])
+        return "break"
+
+    def selectionne(self, nomset):
+        """Rend courant le set indiqué s'il est visible, sans appeler la commande"""
+        index = bisect_left(self.visibles, nomset)
+        if index < len(self.visibles) and self.visibles[index] == nomset:
+            self.courant = index
+            self.deplace(0)
+
+    def remplace(self, noms):
+        """Remplace toute la liste des sets, en gardant le filtre"""
+        self.noms = sorted(noms)
+        self.visibles = [v for v in self.noms if self.correspond(v)] if self.filtre else self.noms
+        self.debut = 0
+        self.courant = 0
+        self.dessine()
+
+    def ajoute(self, nomset):
+        """Ajoute un set à la liste sans la reconstruire, la ligne courante reste sur le même set"""
+        index = bisect_left(self.noms, nomset)
+        if index < len(self.noms) and self.noms[index] == nomset:
+            return
+        self.noms.insert(index, nomset)
+        if self.visibles is not self.noms:
+            if not self.correspond(nomset):
+                self.dessine()
+                return
+            index = bisect_left(self.visibles, nomset)
+            self.visibles.insert(index, nomset)
+        if index <= self.courant and len(self.visibles) > 1:
+            self.courant += 1
+        self.dessine()
+
+    def retire(self, nomset):
+        """Retire un set de la liste sans la reconstruire, la ligne courante reste sur le même set s'il est gardé"""
+        retire = None
+        index = bisect_left(self.noms, nomset)
+        if index < len(self.noms) and self.noms[index] == nomset:
+            del self.noms[index]
+            retire = index
+        if self.visibles is not self.noms:
+            retire = None
+            index = bisect_left(self.visibles, nomset)
+            if index < len(self.visibles) and self.visibles[index] == nomset:
+                del self.visibles[index]
+                retire = index
+        if retire is not None and retire < self.courant:
+            self.courant -= 1
+        self.courant = min(self.courant, max(len(self.visibles) - 1, 0))
+        self.defile(self.debut)
@@ -0,0 +1,184 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Placement des instances IBNIZ sur les coeurs du processeur
+
+Au lancement, chaque IBNIZ est attaché à un coeur choisi à tour de rôle
+('rr') ou au coeur le moins chargé ('charge', la charge d'un coeur étant le
+nombre de pixels calculés par les instances qui y sont attachées), avec une
+priorité nice. Un coeur peut être réservé à Pybniz, les instances n'y sont
+jamais placées. Un set peut imposer son placement par une ligne d'en-tête :
+
+  \\ cpu: 3           attache le set au coeur 3
+  \\ cpu: 2,3 10      aux coeurs 2 et 3, avec nice 10
+  \\ cpu: charge 5    au coeur le moins chargé, avec nice 5
+
+Python 2 n'a pas os.sched_setaffinity ni os.setpriority : l'affinité et le
+nice sont appliqués par la libc avec ctypes, depuis Pybniz juste après le
+lancement de IBNIZ. Rien n'est fait entre le fork et l'exécution de IBNIZ,
+ce qui n'est pas sûr quand Pybniz a plusieurs threads.
+"""
+
+from os import nice, sysconf, listdir, readlink
+from threading import Lock
+from re import compile, MULTILINE
+
+CPU = compile(r'\\ cpu: ([0-9,]+|rr|charge)(?: (-?[0-9]+))?', MULTILINE)
+# Taille de cpu_set_t en mots de 64 bits, 1024 coeurs
+MOTSCPUSET = 16
+PRIO_PROCESS = 0
+_libc = []
+
+
+def lisCPU(texte):
+    """Retourne la politique ou la liste des coeurs, et le nice indiqués dans le set, ou None"""
+    result = CPU.search(texte)
+    if not result:
+        return None
+    politique, niveau = result.groups()
+    if politique not in ('rr', 'charge'):
+        politique = [int(coeur) for coeur in politique.split(',') if coeur]
+    return politique, int(niveau) if niveau is not None else None
+
+
+def coeursAutorises():
+    """Retourne les coeurs sur lesquels le processus peut s'exécuter, lus dans /proc/self/status"""
+    try:
+        with open('/proc/self/status') as fic:
+            for ligne in fic:
+                if ligne.startswith('Cpus_allowed_list:'):
+                    coeurs = []
+                    for plage in ligne.split(':', 1)[1].strip().split(','):
+                        debut, _, fin = plage.partition('-')
+                        coeurs.extend(range(int(debut), int(fin or debut) + 1))
+                    return coeurs
+    except (IOError, ValueError):
+        pass
+    return range(sysconf('SC_NPROCESSORS_ONLN'))
+
+
+def libc():
+    """Retourne la libc chargée par ctypes, ou None. Elle est chargée une seule fois, find_library lance un
+sous-processus"""
+    if not _libc:
+        try:
+            import ctypes
+            import ctypes.util
+            _libc.append(ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True))
+        except OSError:
+            _libc.append(None)
+    return _libc[0]
+
+
+def fixeAffinite(coeurs, pid=0):
+    """Attache le processus aux coeurs indiqués, pid 0 étant le processus courant. Retourne faux en cas d'échec"""
+    bibliotheque = libc()
+    if bibliotheque is None or not hasattr(bibliotheque, 'sched_setaffinity'):
+        return False
+    import ctypes
+    masque = (ctypes.c_uint64 * MOTSCPUSET)()
+    for coeur in coeurs:
+        masque[coeur // 64] |= 1 << (coeur % 64)
+    return bibliotheque.sched_setaffinity(pid, ctypes.sizeof(masque), ctypes.byref(masque)) == 0
+
+
+def taches(pid='self'):
+    """Retourne les identifiants des threads d'un processus, lus dans /proc"""
+    try:
+        return [int(tache) for tache in listdir("/proc/%s/task" % pid)]
+    except OSError:
+        return []
+
+
+def fixeNice(pid, niveau):
+    """Donne au thread pid le nice de Pybniz augmenté de niveau. Retourne faux en cas d'échec.
+Sous Linux le nice est propre à chaque thread : pour un processus, il faut l'appliquer à chacune de ses tâches"""
+    bibliotheque = libc()
+    if bibliotheque is None:
+        return False
+    priorite = max(-20, min(19, nice(0) + niveau))
+    return bibliotheque.setpriority(PRIO_PROCESS, pid, priorite) == 0
+
+
+def abaisseThread(niveau):
+    """Augmente de niveau le nice du thread courant seulement, à appeler depuis ce thread. Retourne faux en cas d'échec"""
+    try:
+        tache = int(readlink('/proc/thread-self').rsplit('/', 1)[1])
+    except (OSError, ValueError):
+        return False
+    return fixeNice(tache, niveau)
+
+
+class Place(object):
+    """Les coeurs et le nice d'une instance, appliqués au processus lancé par applique()"""
+
+    def __init__(self, coeurs, niveau):
+        self.coeurs = coeurs
+        self.niveau = niveau
+
+    def applique(self, pid):
+        """Attache le processus IBNIZ à ses coeurs et fixe son nice, appelé par Pybniz juste après le lancement :
+IBNIZ vient d'être exécuté et n'a pas encore créé d'autres threads"""
+        if self.coeurs:
+            for tache in taches(pid) or [pid]:
+                fixeAffinite(self.coeurs, tache)
+        if self.niveau:
+            for tache in taches(pid) or [pid]:
+                fixeNice(tache, self.niveau)
+
+    def description(self):
+        """Retourne les coeurs pour l'affichage"""
+        return "cpu %s" % ",".join(str(coeur) for coeur in self.coeurs) if self.coeurs else ""
+
+
+class Placement(object):
+    """Choisit les coeurs et le nice de chaque instance lancée
+
+politique est 'rr', 'charge' ou None pour laisser faire l'ordonnanceur, reserve
+est le coeur réservé à Pybniz ou None, niveau est le nice par défaut des instances"""
+
+    def __init__(self, politique='rr', reserve=None, niveau=0):
+        self.politique = politique
+        self.niveau = niveau
+        self.verrou = Lock()
+        self.suivant = 0
+        autorises = coeursAutorises()
+        self.reserve = reserve if reserve in autorises and len(autorises) > 1 else None
+        self.coeurs = [coeur for coeur in autorises if coeur != self.reserve]
+        if politique is not None or self.reserve is not None:
+            libc()
+
+    def reserveCoeur(self):
+        """Attache Pybniz à son coeur réservé, les instances sont ensuite placées sur les autres coeurs.
+L'affinité est propre à chaque thread : elle est appliquée à tous les threads déjà démarrés (thread de
+travail, sauvegarde...), les suivants en héritent"""
+        if self.reserve is None:
+            return False
+        resultat = True
+        for tache in taches():
+            resultat = fixeAffinite([self.reserve], tache) and resultat
+        return resultat
+
+    def choisit(self, instances, demande=None):
+        """Retourne la Place d'une nouvelle instance, demande étant le placement lu dans le set par lisCPU"""
+        politique, niveau = demande or (self.politique, None)
+        niveau = self.niveau if niveau is None else niveau
+        if isinstance(politique, list):
+            coeurs = [coeur for coeur in politique if coeur in self.coeurs]
+            return Place(coeurs or self.coeurs, niveau)
+        if politique == 'rr':
+            with self.verrou:
+                coeur = self.coeurs[self.suivant % len(self.coeurs)]
+                self.suivant += 1
+            return Place([coeur], niveau)
+        if politique == 'charge':
+            charges = dict((coeur, 0) for coeur in self.coeurs)
+            for instance in instances:
+                place = getattr(instance, 'place', None)
+                if place and len(place.coeurs) == 1 and place.coeurs[0] in charges:
+                    charges[place.coeurs[0]] += instance.taille * instance.taille
+            # En cas d'égalité le coeur de plus petit numéro est choisi
+            coeur = min(self.coeurs, key=lambda coeur: (charges[coeur], coeur))
+            return Place([coeur], niveau)
+        # Sans politique, les instances restent hors du coeur réservé à Pybniz
+        return Place(self.coeurs if self.reserve is not None else [], niveau)
@@ -0,0 +1,716 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Interface graphique de Pybniz
+
+Ce module est le seul à importer Tkinter, il n'est chargé que par
+Pybniz.lanceInterface pour que la ligne de commande fonctionne sans écran.
+"""
+
+from Tkinter import *
+import tkMessageBox
+import tkFileDialog
+import ttk
+from time import strftime, localtime, time
+from pybniz import XMAX, YMAX, TAILLEMAX, DELAIRECOLTE, DELAIMOSAIQUE, INTERVALLEBASCULE, \
+    INTERVALLERETOURS, TAILLEAPERCU, DELAIAPERCU, INTERVALLEAPERCU, INTERVALLEJOURNAUX, LIGNESJOURNAUX
+from superviseur import LimiteInstances
+from gouverneur import Surcharge, EnAttente
+from stockage import lisXYT, nomValide
+from navigateur import NavigateurSets
+from coloration import Coloration
+from traces import traceur, trace, note
+from journaux import formate
+
+# Au-delà de ce nombre de sets ajoutés ou supprimés, la liste est reconstruite en une fois
+NOMBREMAXCHANGEMENTS = 50
+
+
+class PybnizUI(Frame):
+    """La classe PybnizUI contient l'interface graphique et le code pour gérer les évènements"""
+
+    def __init__(self, master=None, pybniz=None):
+        """Appel de la méthode qui dessine l'interface graphique"""
+        Frame.__init__(self, master, bg='grey')
+        self.pybniz = pybniz
+        self.pack()
+        self.creerInterface()
+
+    def creerInterface(self):
+        """Dessine l'interface graphique"""
+        # Le titre
+        self.labelTitre = Label(self, text="Pybniz", padx=10, pady=10, font="Helvetica 24 bold", bg='grey')
+        self.labelTitre.pack(pady=10)
+        # Le label Nouveau Set
+        self.LabelSet = Label(self, text="Nouveau Set", bg='grey')
+        self.LabelSet.pack(pady=2)
+        # Le nom du set
+        self.nomset = StringVar()
+        self.EntryNomSet = Entry(self, textvariable=self.nomset)
+        self.EntryNomSet.pack(pady=2, padx=10, fill='x')
+        # Le bouton ajouter
+        self.boutonAjouter = Button(self, text="Ajouter un Set", command=self.clickAjouterSet, fg="blue")
+        self.boutonAjouter.pack(pady=2)
+        # Le label Sets
+        self.LabelSets = Label(self, text="Sets", bg='grey')
+        self.LabelSets.pack(pady=2)
+        # La liste des Sets
+        self.choix = StringVar()
+        # Set en cours de lecture, None quand la zone d'édition contient le set choisi : elle n'est pas enregistrée avant
+        self.chargement = None
+        self.ListeSets = NavigateurSets(self, self.pybniz.listesets, command=self.clickSet)
+        self.ListeSets.pack(pady=2, padx=10, fill='x')
+        # La recherche dans le code des sets
+        self.boutonChercher = Button(self, text="Chercher dans le code...", command=self.clickChercher)
+        self.boutonChercher.pack(pady=2)
+        # Le set en cours d'édition
+        self.LabelChoix = Label(self, textvariable=self.choix, font="Helvetica 12 bold", bg='grey')
+        self.LabelChoix.pack(pady=2)
+        # La zone d'affichage
+        self.zoneAffichage=Text(self,font="Courier 14 bold",height=14,width=52)
+        self.zoneAffichage.pack(pady=5, padx=10, fill='x')
+        self.coloration = Coloration(self.zoneAffichage)
+        self.zoneAffichage.bind("<FocusOut>", self.quitteZoneAffichage)
+        self.zoneAffichage.bind("<KeyRelease>", lambda e: self.programmeApercu(DELAIAPERCU))
+        # L'aperçu du set, calculé sans lancer IBNIZ
+        self.cadreApercu = Frame(self, bg='grey')
+        self.cadreApercu.pack(pady=2)
+        self.imageApercu = PhotoImage(width=TAILLEAPERCU, height=TAILLEAPERCU)
+        self.LabelApercu = Label(self.cadreApercu, image=self.imageApercu, bg='black')
+        self.LabelApercu.pack(side='left', padx=5)
+        self.animation = BooleanVar()
+        self.animation.set(False)
+        self.CheckAnimation = Checkbutton(self.cadreApercu, text="Animer l'aperçu", variable=self.animation,
+                                          command=lambda: self.programmeApercu(0), bg='grey')
+        self.CheckAnimation.pack(side='left', padx=5)
+        self.boutonHistorique = Button(self.cadreApercu, text="Historique...", command=self.clickHistorique)
+        self.boutonHistorique.pack(side='left', padx=5)
+        self.imageAnimation = 0
+        self.apercuProgramme = None
+        self.apercuEnCours = False
+        self.apercuARefaire = False
+        # Set dont l'aperçu est en cours de calcul
+        self.setApercu = None
+        # Le label Position
+        self.LabelPosition = Label(self, text="Position (X et Y)", bg='grey')
+        self.LabelPosition.pack(pady=2)
+        # posx
+        self.posx = IntVar()
+        self.posx.set(0)
+        #self.EntryPositionX = Entry(self, textvariable=self.posx)
+        self.EntryPositionX = Scale(self, orient='horizontal', from_=0, to_=XMAX, variable=self.posx)
+        self.EntryPositionX.pack(pady=2, padx=10, fill='x')
+        # posy
+        self.posy = IntVar()
+        self.posy.set(0)
+        #self.EntryPositionY = Entry(self, textvariable=self.posy)
+        self.EntryPositionY = Scale(self, orient='horizontal', from_=0, to_=YMAX, variable=self.posy)
+        self.EntryPositionY.pack(pady=2, padx=10, fill='x')
+        # Le label Taille
+        self.LabelTaille = Label(self, text="Taille", bg='grey')
+        self.LabelTaille.pack(pady=2)
+        # taille
+        self.taille = IntVar()
+        self.taille.set(512)
+        #self.EntryLongueur = Entry(self, textvariable=self.taille)
+        self.EntryLongueur = Scale(self, orient='horizontal', from_=0, to_=TAILLEMAX, variable=self.taille,resolution=1)
+        self.EntryLongueur.pack(pady=2, padx=10, fill='x')
+        # Le bouton envoyer
+        self.boutonJouerEnBoucle = Button(self, text="*** ENVOYER ***", command=self.clickEnvoyer, font="Helvetica 16 bold", fg="red")
+        self.boutonJouerEnBoucle.pack(pady=5)
+        # Le remplacement à chaud de l'instance précédente du set
+        self.remplacement = BooleanVar()
+        self.remplacement.set(False)
+        self.CheckRemplacement = Checkbutton(self, text="Remplacer l'instance précédente du set", variable=self.remplacement, bg='grey')
+        self.CheckRemplacement.pack(pady=2)
+        self.messageBascule = StringVar()
+        self.verificationBascules = False
+        self.LabelBascule = Label(self, textvariable=self.messageBascule, bg='grey')
+        self.LabelBascule.pack(pady=2)
+        # Le label Instances
+        self.LabelInstances = Label(self, text="Instances", bg='grey')
+        self.LabelInstances.pack(pady=2)
+        # La liste des instances en cours
+        self.ListeInstances = Listbox(self, height=5, font="Courier 10")
+        self.ListeInstances.pack(pady=2, padx=10, fill='x')
+        # Les boutons de gestion des instances
+        self.cadreInstances = Frame(self, bg='grey')
+        self.cadreInstances.pack(pady=2)
+        self.boutonArreter = Button(self.cadreInstances, text="Arrêter", command=self.clickArreter)
+        self.boutonArreter.pack(side='left', padx=2)
+        self.boutonRelancer = Button(self.cadreInstances, text="Relancer", command=self.clickRelancer)
+        self.boutonRelancer.pack(side='left', padx=2)
+        self.boutonArreterTout = Button(self.cadreInstances, text="Tout arrêter", command=self.clickArreterTout)
+        self.boutonArreterTout.pack(side='left', padx=2)
+        self.boutonMosaique = Button(self.cadreInstances, text="Mosaïque...", command=self.clickMosaique)
+        self.boutonMosaique.pack(side='left', padx=2)
+        self.boutonSequence = Button(self.cadreInstances, text="Séquence...", command=self.clickSequence)
+        self.boutonSequence.pack(side='left', padx=2)
+        self.sequenceur = None
+        self.boutonTelemetrie = Button(self.cadreInstances, text="Télémétrie...", command=self.clickTelemetrie)
+        self.boutonTelemetrie.pack(side='left', padx=2)
+        self.fenetreTelemetrie = None
+        self.boutonJournaux = Button(self.cadreInstances, text="Journaux...", command=self.clickJournaux)
+        self.boutonJournaux.pack(side='left', padx=2)
+        self.fenetreJournaux = None
+        # La restauration du mur d'instances de la dernière session
+        self.boutonRestaurer = Button(self, text="Restaurer la session", command=self.clickRestaurer)
+        self.boutonRestaurer.pack(pady=2)
+        # La trace des traitements, exportée pour chrome://tracing
+        self.cadreTrace = Frame(self, bg='grey')
+        self.cadreTrace.pack(pady=2)
+        self.tracage = BooleanVar()
+        self.tracage.set(traceur.actif)
+        self.CheckTrace = Checkbutton(self.cadreTrace, text="Tracer", variable=self.tracage, command=self.clickTrace, bg='grey')
+        self.CheckTrace.pack(side='left', padx=2)
+        self.boutonExporterTrace = Button(self.cadreTrace, text="Exporter la trace...", command=self.clickExporterTrace)
+        self.boutonExporterTrace.pack(side='left', padx=2)
+        # Le bouton quitter
+        self.boutonQuitter = Button(self, text="Quitter", command=self.clickQuitter)
+        self.boutonQuitter.pack(pady=5)
+        # Les résultats du thread de travail sont traités dans la boucle Tk
+        self.after(INTERVALLERETOURS, self.traiteRetours)
+        # Récolte périodique des instances terminées dans le thread de travail, les ressources y sont relevées par Pybniz
+        self.pybniz.boucle.periodique(DELAIRECOLTE / 1000.0, self.pybniz.superviseur.recolte, rappel=self.instancesRecoltees)
+        self.pybniz.rappelTelemetrie = self.telemetrieRelevee
+
+    def traiteRetours(self):
+        """Appelle les rappels des tâches terminées par le thread de travail, puis se reprogramme"""
+        self.pybniz.boucle.traiteRetours()
+        self.pybniz.arrierePlan.traiteRetours()
+        # La trace peut être activée par un signal
+        if self.tracage.get() != traceur.actif:
+            self.tracage.set(traceur.actif)
+        self.after(INTERVALLERETOURS, self.traiteRetours)
+
+    def chargeBibliotheque(self):
+        """Charge la liste des sets dans le thread d'arrière-plan, une fois la fenêtre affichée"""
+        self.pybniz.rappelSets = self.setsModifies
+        self.pybniz.arrierePlan.soumet(self.pybniz.chargeListeSets, rappel=self.bibliothequeChargee)
+
+    def bibliothequeChargee(self, resultat):
+        """Affiche la liste des sets et demande le chargement du premier set"""
+        self.pybniz.etape("liste des sets")
+        self.ListeSets.remplace(self.pybniz.listesets)
+        if self.pybniz.listesets:
+            self.clickSet(self.pybniz.listesets[0], rappel=self.premierSetAffiche)
+        else:
+            self.premierSetAffiche()
+
+    def setsModifies(self, ajouts, suppressions, modifications):
+        """Met à jour la liste des sets après des changements faits par d'autres programmes"""
+        if len(ajouts) + len(suppressions) > NOMBREMAXCHANGEMENTS:
+            self.ListeSets.remplace(self.pybniz.listesets)
+            return
+        for nomset in ajouts:
+            self.ListeSets.ajoute(nomset)
+        for nomset in suppressions:
+            self.ListeSets.retire(nomset)
+
+    def premierSetAffiche(self):
+        """Termine le profil du démarrage quand il est demandé, sinon synchronise l'index de recherche"""
+        self.pybniz.etape("premier set")
+        if self.pybniz.profil:
+            print self.pybniz.profil.rapport()
+            self.quit()
+            return
+        # L'index de recherche est mis à jour en arrière-plan, une fois l'interface prête
+        self.pybniz.demarreRecherche()
+
+    def setXYT(self, texte):
+        """Change la position des ascenceurs horizontaux en fonction des variables X Y et T indiquées dans le set"""
+        result = lisXYT(texte)
+        if result:
+            x, y, t = result
+            note("x y t:", x, y, t)
+            self.posx.set(x)
+            self.posy.set(y)
+            self.taille.set(t)
+
+    @trace("interface")
+    def clickAjouterSet(self):
+        """Gère l'évènement du bouton Ajouter un set"""
+        nomset = self.nomset.get()
+        if nomset and not nomValide(nomset):
+            tkMessageBox.showwarning("Pybniz", "Un nom de set ne peut pas contenir '/' ni commencer par '.'")
+            return
+        if nomset and nomset not in self.pybniz.listesets:
+            self.pybniz.ajouterSet(nomset)
+            note("Sets:", len(self.pybniz.listesets))
+            self.quitteZoneAffichage(None)
+            self.choix.set(nomset)
+            self.chargement = None
+            self.ListeSets.ajoute(nomset)
+            self.ListeSets.selectionne(nomset)
+            self.nomset.set("")
+            self.zoneAffichage.delete("1.0", END)
+            self.zoneAffichage.focus_set()
+
+    @trace("interface")
+    def clickSet(self, nomset, rappel=None):
+        """Gère l'évènement de sélection d'un set, le set est lu dans le thread de travail"""
+        # Un clic dans le navigateur ne retire pas le focus de la zone d'édition : le set en cours est enregistré ici
+        self.quitteZoneAffichage(None)
+        self.choix.set(nomset)
+        self.chargement = nomset
+        self.ListeSets.selectionne(nomset)
+        note('Set:', nomset)
+        self.zoneAffichage.delete("1.0", END)
+        def charge(texte):
+            self.afficheSet(nomset, texte)
+            if rappel:
+                rappel()
+        self.pybniz.chargeSetAsynchrone(nomset, charge, self.erreurChargement)
+
+    @trace("interface")
+    def afficheSet(self, nomset, texte):
+        """Affiche le texte d'un set lu en arrière-plan, s'il est toujours le set choisi"""
+        if nomset != self.choix.get():
+            return
+        self.chargement = None
+        self.zoneAffichage.delete("1.0", END)
+        self.setXYT(texte)
+        if texte:
+            self.zoneAffichage.insert(END, texte)
+        self.imageAnimation = 0
+        self.programmeApercu(0)
+
+    def programmeApercu(self, delai):
+        """Programme le calcul de l'aperçu dans delai ms, en remplaçant celui déjà programmé"""
+        if self.apercuProgramme is not None:
+            self.after_cancel(self.apercuProgramme)
+        self.apercuProgramme = self.after(delai, self.demandeApercu)
+
+    @trace("interface")
+    def demandeApercu(self):
+        """Demande au thread d'arrière-plan l'aperçu du code en cours d'édition, un seul calcul à la fois :
+les demandes faites pendant le calcul sont remplacées par une seule, faite à la fin du calcul"""
+        self.apercuProgramme = None
+        if self.apercuEnCours:
+            self.apercuARefaire = True
+            return
+        self.apercuEnCours = True
+        self.setApercu = self.choix.get()
+        texte = self.zoneAffichage.get("1.0", END)
+        image = self.imageAnimation if self.animation.get() else None
+        self.pybniz.arrierePlan.soumet(self.calculeApercu, texte, image, rappel=self.afficheApercu,
+                                       erreur=lambda erreur: self.afficheApercu(None))
+
+    def calculeApercu(self, texte, image):
+        """Calcule l'aperçu et le convertit pour PhotoImage, dans le thread d'arrière-plan"""
+        pixels = self.pybniz.apercuSet(texte, image)
+        if pixels is None:
+            return None
+        from apercu import couleursTk
+        return couleursTk(pixels)
+
+    @trace("interface")
+    def afficheApercu(self, couleurs):
+        """Affiche l'aperçu calculé, et programme l'image suivante quand l'aperçu est animé.
+Un aperçu dépassé, d'un autre set ou d'un code modifié pendant le calcul, n'est pas affiché"""
+        self.apercuEnCours = False
+        if self.setApercu != self.choix.get() or self.apercuARefaire:
+            self.apercuARefaire = False
+            self.programmeApercu(0)
+            return
+        if couleurs is None:
+            self.imageApercu.blank()
+        else:
+            self.imageApercu.put(couleurs, to=(0, 0))
+        if self.animation.get() and couleurs is not None and self.apercuProgramme is None:
+            # IBNIZ calcule 60 images par seconde
+            self.imageAnimation += INTERVALLEAPERCU * 60 // 1000
+            self.programmeApercu(INTERVALLEAPERCU)
+
+    def erreurChargement(self, erreur):
+        """Signale qu'un set n'a pas pu être lu"""
+        tkMessageBox.showwarning("Pybniz", "Lecture impossible : %s" % erreur)
+
+    @trace("interface")
+    def quitteZoneAffichage(self, e):
+        """Gère l'évènement de sortie de la zone d'édition par l'appel de la méthode qui enregistre le set"""
+        nomset = self.choix.get()
+        # Pendant la lecture d'un set, ou si elle a échoué, la zone vide ne doit pas remplacer le set
+        if not nomset or self.chargement is not None:
+            return
+        texte = self.zoneAffichage.get("1.0", END)
+        self.pybniz.sauveSetDiffere(nomset, texte, self.posx.get(), self.posy.get(), self.taille.get())
+
+    @trace("interface")
+    def clickEnvoyer(self):
+        """Gère l'évènement du bouton Envoyer par le lancement de IBNIZ"""
+        texte = self.zoneAffichage.get("1.0", END)
+        nomset = self.choix.get()
+        posx = self.posx.get()
+        posy = self.posy.get()
+        taille = self.taille.get()
+        if texte:
+            if self.remplacement.get():
+                self.pybniz.remplaceIBNIZAsynchrone(nomset, texte, posx, posy, taille,
+                                                    rappel=self.basculeLancee, erreur=self.erreurLancement)
+            else:
+                self.pybniz.lanceIBNIZAsynchrone(nomset, texte, posx, posy, taille,
+                                                 rappel=self.instanceLancee, erreur=self.erreurLancement)
+
+    @trace("interface")
+    def instanceLancee(self, instance):
+        """Rafraîchit la liste des instances après un lancement"""
+        self.afficheInstances()
+
+    @trace("interface")
+    def basculeLancee(self, instance):
+        """Démarre la vérification des remplacements à chaud après le lancement de la nouvelle instance"""
+        self.afficheInstances()
+        if self.pybniz.superviseur.bascules and not self.verificationBascules:
+            self.verificationBascules = True
+            self.after(INTERVALLEBASCULE, self.verifieBascules)
+
+    def erreurLancement(self, erreur):
+        """Signale qu'IBNIZ n'a pas pu être lancé"""
+        if isinstance(erreur, EnAttente):
+            self.messageBascule.set(str(erreur))
+        elif isinstance(erreur, (LimiteInstances, Surcharge)):
+            tkMessageBox.showwarning("Pybniz", str(erreur))
+        else:
+            tkMessageBox.showerror("Pybniz", "Lancement impossible : %s" % erreur)
+        self.afficheInstances()
+
+    def verifieBascules(self):
+        """Demande au thread de travail de terminer les remplacements à chaud dont la nouvelle instance est prête"""
+        self.pybniz.boucle.soumet(self.pybniz.superviseur.verifieBascules, rappel=self.basculesVerifiees)
+
+    @trace("interface")
+    def basculesVerifiees(self, terminees):
+        """Affiche la durée des remplacements terminés, et reprogramme la vérification s'il en reste"""
+        for bascule in terminees:
+            if bascule.reussie:
+                self.messageBascule.set("%s remplacé en %d ms" % (bascule.nouvelle.nomset, bascule.latence * 1000))
+            else:
+                self.messageBascule.set("%s : la nouvelle instance s'est arrêtée" % bascule.nouvelle.nomset)
+            self.afficheInstances()
+        self.verificationBascules = bool(self.pybniz.superviseur.bascules)
+        if self.verificationBascules:
+            self.after(INTERVALLEBASCULE, self.verifieBascules)
+
+    @trace("interface")
+    def instancesRecoltees(self, terminees):
+        """Rafraîchit la liste des instances après la récolte faite par le thread de travail"""
+        if terminees:
+            note("Instances terminees recoltees", len(terminees))
+        self.afficheInstances()
+
+    @trace("interface")
+    def telemetrieRelevee(self, lignes):
+        """Met à jour le tableau des ressources s'il est ouvert"""
+        if self.fenetreTelemetrie is not None:
+            self.afficheTelemetrie(lignes)
+
+    def clickTelemetrie(self):
+        """Gère l'évènement du bouton Télémétrie par l'ouverture du tableau des ressources des instances"""
+        if self.fenetreTelemetrie is not None:
+            self.fenetreTelemetrie.lift()
+            return
+        fenetre = Toplevel(self)
+        fenetre.title("Télémétrie")
+        colonnes = (("pid", "PID", 70), ("set", "Set", 200), ("cpu", "CPU %", 70),
+                    ("rss", "Mémoire (Mo)", 100), ("duree", "Durée (s)", 80))
+        self.tableauTelemetrie = ttk.Treeview(fenetre, columns=[c[0] for c in colonnes], show='headings', height=20)
+        for colonne, titre, largeur in colonnes:
+            self.tableauTelemetrie.heading(colonne, text=titre)
+            self.tableauTelemetrie.column(colonne, width=largeur, anchor='e' if colonne != 'set' else 'w')
+        self.tableauTelemetrie.pack(pady=5, padx=10, fill='both', expand=True)
+        Button(fenetre, text="Exporter...", command=self.clickExporterTelemetrie).pack(pady=5)
+        def fermer():
+            self.fenetreTelemetrie = None
+            fenetre.destroy()
+        fenetre.protocol("WM_DELETE_WINDOW", fermer)
+        self.fenetreTelemetrie = fenetre
+        self.afficheTelemetrie(self.pybniz.telemetrie.tableau())
+
+    def afficheTelemetrie(self, lignes):
+        """Remplit le tableau des ressources des instances"""
+        self.tableauTelemetrie.delete(*self.tableauTelemetrie.get_children())
+        for pid, nomset, cpu, rss, duree in lignes:
+            self.tableauTelemetrie.insert('', END, values=(pid, nomset, "%.1f" % cpu, "%.1f" % (rss / 1024.0), "%d" % duree))
+
+    def clickExporterTelemetrie(self):
+        """Gère l'évènement du bouton Exporter par l'enregistrement de l'historique des relevés en CSV"""
+        chemin = tkFileDialog.asksaveasfilename(defaultextension=".csv", initialfile="telemetrie.csv",
+                                                filetypes=[("CSV", "*.csv")])
+        if chemin:
+            # Les relevés sont ajoutés par le thread de travail : l'export y est fait aussi, entre deux relevés
+            self.pybniz.boucle.soumet(self.pybniz.telemetrie.exporte, chemin,
+                                      erreur=lambda e: tkMessageBox.showwarning("Pybniz", "Export impossible : %s" % e))
+
+    def clickJournaux(self):
+        """Gère l'évènement du bouton Journaux par l'ouverture des lignes écrites par les instances, filtrées par set"""
+        if self.fenetreJournaux is not None:
+            self.fenetreJournaux.lift()
+            return
+        journaux = self.pybniz.journaux
+        if journaux is None:
+            tkMessageBox.showinfo("Pybniz", "La sortie des instances n'est pas capturée (CAPTUREJOURNAUX)")
+            return
+        fenetre = Toplevel(self)
+        fenetre.title("Journaux des instances")
+        tous = "(tous les sets)"
+        filtre = StringVar()
+        filtre.set(tous)
+        choix = ttk.Combobox(fenetre, textvariable=filtre, state='readonly', values=[tous])
+        choix.pack(pady=5, padx=10, fill='x')
+        affichage = Text(fenetre, font="Courier 10", height=30, width=100, wrap='none')
+        affichage.tag_configure('err', foreground='red')
+        affichage.pack(pady=5, padx=10, fill='both', expand=True)
+        # Version des journaux et filtre du dernier affichage, pour ne relire que ce qui a changé
+        dernier = [None, None]
+        def affiche(lignes):
+            if self.fenetreJournaux is not fenetre:
+                return
+            # Le défilement ne suit la fin que si elle était visible
+            suit = affichage.yview()[1] >= 1.0
+            affichage.delete("1.0", END)
+            for entree in lignes:
+                affichage.insert(END, formate(entree).decode('utf-8', 'replace') + "\n", entree[3])
+            if suit:
+                affichage.see(END)
+        def actualise():
+            nomset = filtre.get()
+            if (journaux.version, nomset) != tuple(dernier):
+                dernier[:] = [journaux.version, nomset]
+                choix.configure(values=[tous] + journaux.nomsets())
+                self.pybniz.arrierePlan.soumet(journaux.lignes, None if nomset == tous else nomset, None, LIGNESJOURNAUX,
+                                          rappel=affiche)
+        def rafraichit():
+            # La fenêtre a été fermée, le rafraîchissement s'arrête
+            if self.fenetreJournaux is not fenetre:
+                return
+            actualise()
+            self.after(INTERVALLEJOURNAUX, rafraichit)
+        def fermer():
+            self.fenetreJournaux = None
+            fenetre.destroy()
+        choix.bind("<<ComboboxSelected>>", lambda e: actualise())
+        fenetre.protocol("WM_DELETE_WINDOW", fermer)
+        self.fenetreJournaux = fenetre
+        rafraichit()
+
+    @trace("interface")
+    def afficheInstances(self):
+        """Met à jour la liste des instances en cours"""
+        selection = self.instanceSelectionnee()
+        self.ListeInstances.delete(0, END)
+        for index, instance in enumerate(self.pybniz.superviseur.instances):
+            self.ListeInstances.insert(END, instance.description())
+            if instance.pid == selection:
+                self.ListeInstances.selection_set(index)
+
+    def instanceSelectionnee(self):
+        """Retourne le PID de l'instance sélectionnée dans la liste, ou None"""
+        selection = self.ListeInstances.curselection()
+        if not selection:
+            return None
+        instances = self.pybniz.superviseur.instances
+        index = int(selection[0])
+        if index < len(instances):
+            return instances[index].pid
+        return None
+
+    @trace("interface")
+    def clickArreter(self):
+        """Gère l'évènement du bouton Arrêter par l'arrêt de l'instance sélectionnée"""
+        pid = self.instanceSelectionnee()
+        if pid is not None:
+            self.pybniz.superviseur.arrete(pid)
+            self.afficheInstances()
+
+    @trace("interface")
+    def clickRelancer(self):
+        """Gère l'évènement du bouton Relancer par le redémarrage de l'instance sélectionnée"""
+        pid = self.instanceSelectionnee()
+        if pid is not None:
+            self.pybniz.boucle.soumet(self.pybniz.superviseur.relance, pid, rappel=self.instanceLancee)
+
+    @trace("interface")
+    def clickArreterTout(self):
+        """Gère l'évènement du bouton Tout arrêter"""
+        self.pybniz.superviseur.arreteTout()
+        self.afficheInstances()
+
+    def clickMosaique(self):
+        """Gère l'évènement du bouton Mosaïque par l'ouverture de la fenêtre de sélection des sets"""
+        fenetre = Toplevel(self)
+        fenetre.title("Mosaïque")
+        liste = Listbox(fenetre, selectmode=EXTENDED, height=20)
+        for nomset in self.pybniz.listesets:
+            liste.insert(END, nomset)
+        liste.pack(pady=5, padx=10, fill='both', expand=True)
+        def lancer():
+            nomsets = [liste.get(index) for index in liste.curselection()]
+            fenetre.destroy()
+            if nomsets:
+                self.pybniz.arrierePlan.soumet(self.pybniz.planMosaique, nomsets, rappel=self.lanceMosaique)
+        Button(fenetre, text="Lancer la mosaïque", command=lancer, fg="red").pack(pady=5)
+
+    @trace("interface")
+    def lanceMosaique(self, plan):
+        """Lance le premier set du plan et programme le suivant, pour ne pas lancer tous les IBNIZ en même temps"""
+        if not plan:
+            return
+        nomset, texte, posx, posy, taille = plan[0]
+        def suivant(instance):
+            self.afficheInstances()
+            self.after(DELAIMOSAIQUE, self.lanceMosaique, plan[1:])
+        self.pybniz.lanceIBNIZAsynchrone(nomset, texte, posx, posy, taille,
+                                         rappel=suivant, erreur=self.erreurLancement)
+
+    def clickSequence(self):
+        """Gère l'évènement du bouton Séquence par le choix d'une playlist à jouer, ou l'arrêt de la séquence en cours"""
+        if self.sequenceur is not None and self.sequenceur.actif:
+            if tkMessageBox.askyesno("Pybniz", "Arrêter la séquence en cours ?"):
+                self.sequenceur.arrete()
+            return
+        chemin = tkFileDialog.askopenfilename(filetypes=[("Playlist", "*.txt"), ("Tous les fichiers", "*")])
+        if not chemin:
+            return
+        from sequenceur import Sequenceur, lisPlaylist
+        try:
+            self.sequenceur = Sequenceur(self.pybniz, lisPlaylist(chemin))
+        except (IOError, ValueError) as erreur:
+            tkMessageBox.showwarning("Pybniz", str(erreur))
+            return
+        # Les sets sont lus et préparés dans le thread d'arrière-plan avant le début de la séquence
+        self.pybniz.arrierePlan.soumet(self.sequenceur.valide, rappel=self.sequenceValidee)
+
+    def sequenceValidee(self, erreurs):
+        """Démarre la séquence si tous ses sets existent"""
+        if erreurs:
+            tkMessageBox.showwarning("Pybniz", "\n".join(erreurs))
+            return
+        self.sequenceur.demarre()
+
+    @trace("interface")
+    def clickRestaurer(self):
+        """Gère l'évènement du bouton Restaurer par la relance des instances de la dernière session"""
+        restauration = self.pybniz.restaureSession()
+        if not restauration.entrees:
+            tkMessageBox.showinfo("Pybniz", "Aucune session à restaurer")
+            return
+        self.boutonRestaurer.config(state=DISABLED)
+        self.messageBascule.set("Restauration de %d instances..." % len(restauration.entrees))
+        # La restauration attend l'ouverture des fenêtres dans son propre thread, le rapport revient par la boucle
+        restauration.demarre(rappel=lambda rapport: self.pybniz.boucle.signale(self.sessionRestauree, rapport))
+
+    def sessionRestauree(self, rapport):
+        """Affiche le rapport de la restauration"""
+        self.boutonRestaurer.config(state=NORMAL)
+        self.messageBascule.set(rapport.split("\n")[0])
+        self.afficheInstances()
+        if "\n" in rapport:
+            tkMessageBox.showwarning("Pybniz", rapport)
+
+    @trace("interface")
+    def clickChercher(self):
+        """Gère l'évènement du bouton Chercher par l'ouverture de la recherche dans le code des sets"""
+        fenetre = Toplevel(self)
+        fenetre.title("Chercher dans le code")
+        motif = StringVar()
+        champ = Entry(fenetre, textvariable=motif, font="Courier 12")
+        champ.pack(pady=5, padx=10, fill='x')
+        cadre = Frame(fenetre)
+        cadre.pack(pady=2)
+        expression = BooleanVar()
+        expression.set(False)
+        Checkbutton(cadre, text="Expression régulière", variable=expression).pack(side='left', padx=2)
+        message = StringVar()
+        Label(fenetre, textvariable=message).pack(pady=2)
+        liste = Listbox(fenetre, height=20, font="Courier 11")
+        liste.pack(pady=5, padx=10, fill='both', expand=True)
+        def affiche(noms, debut):
+            liste.delete(0, END)
+            for nomset in noms:
+                liste.insert(END, nomset)
+            message.set("%d sets en %.1f ms" % (len(noms), (time() - debut) * 1000))
+        def erreur(exception):
+            liste.delete(0, END)
+            message.set("Expression invalide : %s" % exception)
+        def chercher():
+            if not motif.get():
+                return
+            debut = time()
+            self.pybniz.chercheSetsAsynchrone(motif.get(), expression.get(),
+                                              rappel=lambda noms: affiche(noms, debut), erreur=erreur)
+        def choisir():
+            choix = liste.curselection()
+            if choix:
+                self.clickSet(liste.get(choix[0]))
+        Button(cadre, text="Chercher", command=chercher).pack(side='left', padx=2)
+        champ.bind("<Return>", lambda e: chercher())
+        liste.bind("<<ListboxSelect>>", lambda e: choisir())
+        champ.focus_set()
+
+    def clickHistorique(self):
+        """Gère l'évènement du bouton Historique par l'ouverture de la liste des révisions du set"""
+        nomset = self.choix.get()
+        if not nomset:
+            return
+        # Les modifications en cours sont enregistrées avant de lire l'historique
+        self.quitteZoneAffichage(None)
+        fenetre = Toplevel(self)
+        fenetre.title("Historique de %s" % nomset)
+        liste = Listbox(fenetre, height=12, font="Courier 11")
+        liste.pack(pady=5, padx=10, fill='x')
+        cadre = Frame(fenetre)
+        cadre.pack(pady=2)
+        affichage = Text(fenetre, font="Courier 11", height=20, width=70)
+        affichage.pack(pady=5, padx=10, fill='both', expand=True)
+        historique = self.pybniz.historique
+        def montre(texte):
+            affichage.delete("1.0", END)
+            affichage.insert(END, texte)
+        def selection():
+            choix = liste.curselection()
+            return int(choix[0]) if choix else None
+        def revision():
+            numero = selection()
+            if numero is not None:
+                self.pybniz.arrierePlan.soumet(historique.revision, nomset, numero, rappel=montre)
+        def diff():
+            numero = selection()
+            if numero is not None:
+                self.pybniz.arrierePlan.soumet(historique.diff, nomset, numero, rappel=montre)
+        def revenir():
+            numero = selection()
+            if numero is not None:
+                self.pybniz.arrierePlan.soumet(historique.revision, nomset, numero,
+                                               rappel=lambda texte: self.afficheSet(nomset, texte))
+        def lit():
+            # La liste est lue après l'écriture des modifications en attente
+            self.pybniz.sauvegarde.vide()
+            return list(historique.revisions(nomset))
+        def remplit(revisions):
+            for numero, (instant, cle) in enumerate(revisions):
+                liste.insert(END, "%4d  %s  %s" % (numero, strftime("%Y-%m-%d %H:%M:%S", localtime(instant)), cle[:10]))
+            liste.see(END)
+        liste.bind("<<ListboxSelect>>", lambda e: revision())
+        Button(cadre, text="Différences avec la précédente", command=diff).pack(side='left', padx=2)
+        Button(cadre, text="Revenir à cette révision", command=revenir, fg="red").pack(side='left', padx=2)
+        self.pybniz.arrierePlan.soumet(lit, rappel=remplit)
+
+    def clickTrace(self):
+        """Gère l'évènement de la case Tracer par l'activation ou la désactivation de la trace"""
+        traceur.actif = self.tracage.get()
+
+    def clickExporterTrace(self):
+        """Gère l'évènement du bouton Exporter la trace par l'enregistrement de la trace au format de Chrome"""
+        chemin = tkFileDialog.asksaveasfilename(defaultextension=".json", initialfile="pybniz-trace.json",
+                                                filetypes=[("Trace Chrome", "*.json")])
+        if chemin:
+            nombre = traceur.exporte(chemin)
+            rapport = traceur.rapportProfil(10)
+            tkMessageBox.showinfo("Pybniz", "%d évènements exportés" % nombre + ("\n\n" + rapport if rapport else ""))
+
+    def clickQuitter(self):
+        """Gère l'évènement du bouton Quitter par la sauvegarde du set et l'arrêt du programme"""
+        self.quitteZoneAffichage(None)
+        self.pybniz.sauvegarde.vide()
+        self.quit()
@@ -0,0 +1,353 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Recherche dans le code des sets
+
+Un index de trigrammes donne, pour chaque suite de trois octets, la liste
+des sets qui la contiennent. Une recherche d'une sous-chaîne ne vérifie que
+les sets qui contiennent tous ses trigrammes, une expression régulière est
+filtrée par les trigrammes de ses parties littérales. Les suites d'un et de
+deux octets sont indexées de la même façon : une recherche plus courte qu'un
+trigramme lit directement sa liste, sans parcourir tous les sets. L'index
+garde aussi le code des sets, pour vérifier les candidats sans ouvrir un
+seul fichier.
+
+Chaque set reçoit un numéro, et les listes de numéros sont des tableaux
+triés auxquels un set modifié est ajouté sous un nouveau numéro : l'ancien
+numéro est seulement marqué mort, et les numéros sont renumérotés quand les
+morts sont trop nombreux. Les modifications sont ajoutées à un journal, et
+l'index est réécrit entièrement quand le journal devient long.
+
+  .recherche/index     l'index complet (marshal)
+  .recherche/journal   les modifications depuis l'écriture de l'index
+"""
+
+from os import mkdir, rename, fsync
+from os.path import exists, join
+from threading import RLock
+from array import array
+from bisect import bisect_left
+from stockage import octets
+import marshal
+import re
+import sre_parse
+import sre_constants
+
+REPERTOIRERECHERCHE = ".recherche"
+VERSIONINDEX = 2
+# Nombre de modifications dans le journal au-delà duquel l'index est réécrit
+SEUILJOURNAL = 2000
+# Nombre maximum de résultats retournés
+MAXRESULTATS = 1000
+
+
+def trigrammes(texte):
+    """Retourne l'ensemble des trigrammes d'un texte"""
+    return set([texte[i:i + 3] for i in xrange(len(texte) - 2)])
+
+
+def cles(texte):
+    """Retourne les suites d'un, deux et trois octets d'un texte, ses clés dans l'index"""
+    return set([texte[i:i + n] for n in (1, 2, 3) for i in xrange(len(texte) - n + 1)])
+
+
+def requises(chaine):
+    """Retourne les clés de l'index qu'un texte contenant la chaîne contient forcément"""
+    return trigrammes(chaine) if len(chaine) >= 3 else set([chaine]) if chaine else set()
+
+
+def litteraux(motif):
+    """Retourne les chaînes littérales qui apparaissent forcément dans le texte d'une expression régulière,
+en ne suivant que la suite principale de l'expression"""
+    try:
+        elements = sre_parse.parse(motif)
+    except (sre_constants.error, OverflowError):
+        return []
+    if elements.pattern.flags & sre_parse.SRE_FLAG_IGNORECASE:
+        return []
+    chaines = []
+    courante = []
+    for code, valeur in elements:
+        if code == sre_constants.LITERAL and valeur < 256:
+            courante.append(chr(valeur))
+            continue
+        chaines.append(''.join(courante))
+        courante = []
+        # Une répétition au moins une fois d'un littéral le contient
+        if code in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and valeur[0] > 0:
+            sous = list(valeur[2])
+            if len(sous) == 1 and sous[0][0] == sre_constants.LITERAL and sous[0][1] < 256:
+                courante.append(chr(sous[0][1]))
+    chaines.append(''.join(courante))
+    return [chaine for chaine in chaines if chaine]
+
+
+def intersection(candidats, numeros):
+    """Retourne les candidats présents dans le tableau trié numeros"""
+    if len(candidats) * 16 < len(numeros):
+        # Peu de candidats : une recherche dichotomique pour chacun
+        garde = set()
+        for numero in candidats:
+            position = bisect_left(numeros, numero)
+            if position < len(numeros) and numeros[position] == numero:
+                garde.add(numero)
+        return garde
+    return candidats.intersection(numeros)
+
+
+class IndexRecherche(object):
+    """Index de trigrammes du code des sets, mis à jour à chaque sauvegarde
+
+L'index est lu à la première utilisation, pour ne pas retarder le démarrage"""
+
+    def __init__(self, repertoire=REPERTOIRERECHERCHE):
+        self.repertoire = repertoire
+        self.verrou = RLock()
+        self.ouvert = False
+        self.journal = None
+        self.modifications = 0
+        # numéro -> nom et code du set, None pour un numéro mort
+        self.noms = []
+        self.textes = []
+        # nom -> numéro vivant, et signature du set dans le stockage (None si elle est inconnue)
+        self.numeros = {}
+        self.signatures = {}
+        # nom -> nombre de mises à jour en mémoire, pour qu'une synchronisation n'écrase pas une indexation plus récente
+        self.versions = {}
+        # suite d'un à trois octets -> tableau trié des numéros
+        self.index = {}
+        self.morts = 0
+
+    def chemin(self, nom):
+        """Retourne le chemin d'un fichier de l'index"""
+        return join(self.repertoire, nom)
+
+    def ouvre(self):
+        """Lit l'index et rejoue le journal, une seule fois"""
+        with self.verrou:
+            if self.ouvert:
+                return
+            if not exists(self.repertoire):
+                mkdir(self.repertoire)
+            if exists(self.chemin("index")):
+                with open(self.chemin("index"), 'rb') as fic:
+                    donnees = marshal.load(fic)
+                if donnees.get('version') == VERSIONINDEX:
+                    self.noms = donnees['noms']
+                    self.textes = donnees['textes']
+                    self.signatures = donnees['signatures']
+                    for trigramme, numeros in donnees['index'].iteritems():
+                        tableau = array('i')
+                        tableau.fromstring(numeros)
+                        self.index[trigramme] = tableau
+                    self.numeros = dict((nom, numero) for numero, nom in enumerate(self.noms)
+                                        if self.textes[numero] is not None)
+                    self.morts = len(self.noms) - len(self.numeros)
+            if exists(self.chemin("journal")):
+                with open(self.chemin("journal"), 'rb') as fic:
+                    while True:
+                        try:
+                            operation = marshal.load(fic)
+                        except (EOFError, ValueError, TypeError):
+                            # Fin du journal, ou dernière écriture interrompue
+                            break
+                        self.applique(*operation)
+                        self.modifications += 1
+            self.journal = open(self.chemin("journal"), 'ab')
+            self.ouvert = True
+
+    def applique(self, nomset, signature, texte):
+        """Met à jour l'index en mémoire : texte None retire le set"""
+        self.versions[nomset] = self.versions.get(nomset, 0) + 1
+        numero = self.numeros.get(nomset)
+        if numero is not None and texte is not None and self.textes[numero] == texte:
+            # Seule la signature change
+            self.signatures[nomset] = signature
+            return
+        self.numeros.pop(nomset, None)
+        if numero is not None:
+            self.textes[numero] = None
+            self.morts += 1
+        self.signatures.pop(nomset, None)
+        if texte is None:
+            return
+        numero = len(self.noms)
+        self.noms.append(nomset)
+        self.textes.append(texte)
+        self.numeros[nomset] = numero
+        self.signatures[nomset] = signature
+        index = self.index
+        for cle in cles(texte):
+            numeros = index.get(cle)
+            if numeros is None:
+                index[cle] = array('i', (numero,))
+            else:
+                # Les numéros sont donnés dans l'ordre, les tableaux restent triés
+                numeros.append(numero)
+
+    def ecritJournal(self, nomset, signature, texte):
+        """Ajoute une modification au journal, et réécrit l'index quand le journal est long"""
+        marshal.dump((nomset, signature, texte), self.journal)
+        self.journal.flush()
+        self.modifications += 1
+        if self.modifications >= SEUILJOURNAL:
+            self.ecrit()
+
+    def indexe(self, nomset, texte, signature=None):
+        """Indexe le code d'un set ajouté ou modifié"""
+        nomset = octets(nomset)
+        texte = octets(texte)
+        with self.verrou:
+            self.ouvre()
+            numero = self.numeros.get(nomset)
+            if numero is not None and self.textes[numero] == texte and signature in (None, self.signatures.get(nomset)):
+                return
+            self.applique(nomset, signature, texte)
+            self.ecritJournal(nomset, signature, texte)
+
+    def retire(self, nomset):
+        """Retire un set supprimé de l'index"""
+        nomset = octets(nomset)
+        with self.verrou:
+            self.ouvre()
+            if nomset in self.numeros:
+                self.applique(nomset, None, None)
+                self.ecritJournal(nomset, None, None)
+
+    def synchronise(self, stockage):
+        """Met l'index à jour d'après les signatures du stockage : les sets nouveaux ou modifiés depuis
+la dernière utilisation sont lus et indexés, les sets disparus retirés. Retourne le nombre de sets relus"""
+        signatures = stockage.signatures()
+        with self.verrou:
+            self.ouvre()
+            connus = dict(self.signatures)
+            versions = dict(self.versions)
+            disparus = [nomset for nomset in self.numeros if nomset not in signatures]
+        relus = []
+        for nomset, signature in signatures.iteritems():
+            if connus.get(nomset) != signature:
+                try:
+                    texte = octets(stockage.charge(nomset))
+                except IOError:
+                    continue
+                # Le verrou est pris pour chaque set, les recherches ne sont pas bloquées pendant la synchronisation.
+                # Un set indexé entre-temps par une sauvegarde garde son texte, plus récent que celui lu ici
+                with self.verrou:
+                    if self.versions.get(nomset) != versions.get(nomset):
+                        continue
+                    self.applique(nomset, signature, texte)
+                relus.append((nomset, signature, texte))
+        with self.verrou:
+            disparus = [nomset for nomset in disparus if self.versions.get(nomset) == versions.get(nomset)]
+            for nomset in disparus:
+                self.applique(nomset, None, None)
+            # Beaucoup de sets relus : l'index est réécrit une fois plutôt que journalisé
+            if len(relus) + len(disparus) >= SEUILJOURNAL:
+                self.ecrit()
+            else:
+                for operation in relus + [(nomset, None, None) for nomset in disparus]:
+                    self.ecritJournal(*operation)
+        return len(relus)
+
+    def renumerote(self):
+        """Renumérote les sets vivants pour que les tableaux ne contiennent plus de numéros morts"""
+        nouveaux = array('i', [-1]) * len(self.noms)
+        noms = []
+        textes = []
+        for numero, texte in enumerate(self.textes):
+            if texte is not None:
+                nouveaux[numero] = len(noms)
+                noms.append(self.noms[numero])
+                textes.append(texte)
+        index = {}
+        for trigramme, numeros in self.index.iteritems():
+            tableau = array('i', [nouveaux[numero] for numero in numeros if nouveaux[numero] >= 0])
+            if tableau:
+                index[trigramme] = tableau
+        self.noms = noms
+        self.textes = textes
+        self.index = index
+        self.numeros = dict((nom, numero) for numero, nom in enumerate(noms))
+        self.morts = 0
+
+    def ecrit(self):
+        """Réécrit l'index complet et vide le journal"""
+        with self.verrou:
+            self.ouvre()
+            if self.morts > len(self.numeros):
+                self.renumerote()
+            donnees = {'version': VERSIONINDEX, 'noms': self.noms, 'textes': self.textes,
+                       'signatures': self.signatures,
+                       'index': dict((trigramme, numeros.tostring()) for trigramme, numeros in self.index.iteritems())}
+            temporaire = self.chemin("index.tmp")
+            with open(temporaire, 'wb') as fic:
+                marshal.dump(donnees, fic)
+                fic.flush()
+                fsync(fic.fileno())
+            rename(temporaire, self.chemin("index"))
+            # Le journal n'est vidé qu'après l'écriture complète de l'index
+            self.journal.close()
+            self.journal = open(self.chemin("journal"), 'wb')
+            self.modifications = 0
+
+    def candidats(self, chaines):
+        """Retourne les numéros des sets qui contiennent toutes les clés des chaînes, ou None pour tous"""
+        requis = set()
+        for chaine in chaines:
+            requis.update(requises(chaine))
+        if not requis:
+            return None
+        listes = []
+        for cle in requis:
+            numeros = self.index.get(cle)
+            if numeros is None:
+                return set()
+            listes.append(numeros)
+        listes.sort(key=len)
+        resultat = set(listes[0])
+        for numeros in listes[1:]:
+            if not resultat:
+                break
+            resultat = intersection(resultat, numeros)
+        return resultat
+
+    def cherche(self, motif, expression=False, maximum=MAXRESULTATS):
+        """Retourne les noms triés des sets dont le code contient motif, ou une correspondance de
+l'expression régulière motif. Lève re.error pour une expression invalide"""
+        motif = octets(motif)
+        if expression:
+            compilee = re.compile(motif, re.MULTILINE)
+            chaines = litteraux(motif)
+        else:
+            chaines = [motif]
+        with self.verrou:
+            self.ouvre()
+            numeros = self.candidats(chaines)
+            textes = self.textes
+            noms = self.noms
+            if numeros is None:
+                # Sans clé à chercher, tous les sets sont vérifiés
+                numeros = xrange(len(textes))
+            candidats = [(numero, textes[numero]) for numero in numeros if textes[numero] is not None]
+            if not expression and 0 < len(motif) <= 3:
+                # La liste d'une clé est exacte, les candidats contiennent tous le motif
+                trouves = [noms[numero] for numero, texte in candidats]
+            elif expression:
+                trouves = [noms[numero] for numero, texte in candidats if compilee.search(texte)]
+            else:
+                trouves = [noms[numero] for numero, texte in candidats if motif in texte]
+        trouves.sort()
+        return trouves[:maximum]
+
+    def nombre(self):
+        """Retourne le nombre de sets indexés"""
+        with self.verrou:
+            self.ouvre()
+            return len(self.numeros)
+
+    def fermer(self):
+        """Ferme le journal, l'index reste à jour sur le disque"""
+        with self.verrou:
+            if self.journal is not None:
+                self.journal.close()
+                self.journal = None
@@ -0,0 +1,143 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Sauvegarde différée des sets
+
+Les demandes de sauvegarde faites par l'interface sont regroupées pendant
+DELAISAUVEGARDE secondes puis écrites par un thread en arrière-plan. Un set
+dont le contenu n'a pas changé n'est pas réécrit.
+"""
+
+from threading import Thread, Condition, Lock
+from hashlib import sha1
+from time import time
+from traceback import print_exc
+from sys import stderr
+
+DELAISAUVEGARDE = 1.0
+
+
+def empreinte(*valeurs):
+    """Retourne l'empreinte d'une suite de valeurs"""
+    sha = sha1()
+    for valeur in valeurs:
+        if isinstance(valeur, unicode):
+            valeur = valeur.encode('utf-8')
+        sha.update(str(valeur))
+        sha.update('\0')
+    return sha.hexdigest()
+
+
+class SauvegardeDifferee(object):
+    """Écrit les sets en arrière-plan, après un délai qui regroupe les modifications rapprochées
+
+prepare(*arguments) retourne le texte à enregistrer, stocke(nomset, texte) l'enregistre"""
+
+    def __init__(self, prepare, stocke, delai=DELAISAUVEGARDE):
+        self.prepare = prepare
+        self.stocke = stocke
+        self.delai = delai
+        # nomset -> (échéance, arguments) des sets modifiés qui restent à écrire
+        self.attente = {}
+        # Empreinte des derniers arguments demandés tant qu'ils ne sont pas écrits, et du dernier texte écrit ou chargé
+        self.demandes = {}
+        self.empreintes = {}
+        self.condition = Condition()
+        # Prendre les demandes et les écrire se fait sous ce verrou, pour ne jamais écrire une version plus ancienne
+        self.verrouEcriture = Lock()
+        self.actif = True
+        self.thread = Thread(target=self.boucle, name="SauvegardeDifferee")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def demande(self, nomset, *arguments):
+        """Demande la sauvegarde d'un set, ignorée si les arguments n'ont pas changé"""
+        cle = empreinte(*arguments)
+        with self.condition:
+            if self.demandes.get(nomset) == cle:
+                return False
+            self.demandes[nomset] = cle
+            self.attente[nomset] = (time() + self.delai, arguments)
+            self.condition.notify()
+        return True
+
+    def memorise(self, nomset, texte):
+        """Mémorise le contenu actuel d'un set, tel qu'il est sur le disque : la prochaine demande est comparée à ce
+contenu, même si elle reprend les arguments d'une demande précédente"""
+        with self.condition:
+            self.empreintes[nomset] = empreinte(texte)
+            self.demandes.pop(nomset, None)
+
+    def enAttente(self, nomset):
+        """Indique si le set a des modifications qui ne sont pas encore écrites"""
+        with self.condition:
+            return nomset in self.attente
+
+    def boucle(self):
+        """Boucle du thread d'écriture"""
+        while True:
+            with self.condition:
+                while self.actif and not self.attente:
+                    self.condition.wait()
+                if not self.actif:
+                    return
+                reste = min(echeance for echeance, arguments in self.attente.values()) - time()
+                if reste > 0:
+                    self.condition.wait(reste)
+                    continue
+            self.ecrit(lambda echeance: echeance <= time())
+
+    def ecrit(self, choix):
+        """Écrit les sets en attente dont l'échéance est retenue par choix"""
+        with self.verrouEcriture:
+            with self.condition:
+                prets = [(nomset, arguments) for nomset, (echeance, arguments) in self.attente.items()
+                         if choix(echeance)]
+                for nomset, arguments in prets:
+                    del self.attente[nomset]
+            for nomset, arguments in prets:
+                try:
+                    self.ecritSet(nomset, arguments)
+                except Exception:
+                    print >>stderr, "Erreur de sauvegarde du set", nomset
+                    print_exc()
+                    with self.condition:
+                        self.demandes.pop(nomset, None)
+        return len(prets)
+
+    def ecritSet(self, nomset, arguments):
+        """Prépare le texte d'un set et l'écrit s'il diffère du contenu connu"""
+        texte = self.prepare(*arguments)
+        cle = empreinte(texte)
+        with self.condition:
+            ecrit = self.empreintes.get(nomset) != cle
+        if ecrit:
+            self.stocke(nomset, texte)
+        with self.condition:
+            self.empreintes[nomset] = cle
+            # La demande est traitée : les mêmes arguments redemandés seront comparés au contenu connu
+            if self.demandes.get(nomset) == empreinte(*arguments):
+                del self.demandes[nomset]
+        return ecrit
+
+    def ecritMaintenant(self, nomset):
+        """Écrit tout de suite un set en attente"""
+        with self.verrouEcriture:
+            with self.condition:
+                if nomset not in self.attente:
+                    return False
+                echeance, arguments = self.attente.pop(nomset)
+            self.ecritSet(nomset, arguments)
+        return True
+
+    def vide(self):
+        """Écrit tout de suite tous les sets en attente"""
+        return self.ecrit(lambda echeance: True)
+
+    def arrete(self):
+        """Écrit les sets en attente et arrête le thread d'écriture"""
+        self.vide()
+        with self.condition:
+            self.actif = False
+            self.condition.notify()
+        self.thread.join()
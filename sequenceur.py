@@ -0,0 +1,192 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Séquenceur de sets
+
+Lance et arrête des sets selon une playlist, pour suivre la chronologie d'un
+spectacle. Chaque ligne de la playlist indique l'heure de lancement, le set,
+la position, la taille et la durée :
+
+  # temps  set          x    y    taille  durée
+  0:00     demo         0    0    256     30
+  0:30     "mon set"    0    0    1000    1:00
+
+Le temps et la durée sont en secondes ou en [h:]m:s, une durée de 0 laisse le
+set tourner. Les échéances sont calculées depuis le début de la séquence sur
+une horloge monotone, pour que les retards ne s'accumulent pas, et chaque
+lancement est préparé (lecture du set, arguments de IBNIZ) avant son heure.
+"""
+
+from threading import Thread
+from heapq import heappush, heappop
+from time import time, sleep
+from shlex import split
+
+# Préparation des lancements en avance, en secondes
+AVANCE = 1.0
+# Fin de l'attente d'une échéance en attente active, en secondes
+ATTENTEACTIVE = 0.002
+# Durée maximum d'un sommeil, pour que la séquence puisse être arrêtée rapidement
+SOMMEILMAX = 0.1
+
+
+def horlogeMonotone():
+    """Retourne une fonction qui lit CLOCK_MONOTONIC, ou time() s'il n'est pas accessible"""
+    try:
+        import ctypes
+        import ctypes.util
+
+        class timespec(ctypes.Structure):
+            _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+
+        clock_gettime = ctypes.CDLL(ctypes.util.find_library('rt') or 'libc.so.6').clock_gettime
+        clock_gettime.argtypes = [ctypes.c_int, ctypes.POINTER(timespec)]
+        mesure = timespec()
+
+        def horloge():
+            # CLOCK_MONOTONIC vaut 1 sous Linux
+            clock_gettime(1, ctypes.byref(mesure))
+            return mesure.tv_sec + mesure.tv_nsec * 1e-9
+        horloge()
+        return horloge
+    except (OSError, AttributeError):
+        return time
+
+horloge = horlogeMonotone()
+
+
+def lisTemps(texte):
+    """Retourne en secondes un temps écrit en secondes ou en [h:]m:s"""
+    secondes = 0.0
+    for partie in texte.split(':'):
+        secondes = secondes * 60 + float(partie)
+    return secondes
+
+
+class Entree(object):
+    """Une ligne de la playlist"""
+
+    def __init__(self, temps, nomset, posx, posy, taille, duree, ligne=0):
+        self.temps = temps
+        self.nomset = nomset
+        self.posx = posx
+        self.posy = posy
+        self.taille = taille
+        self.duree = duree
+        self.ligne = ligne
+        self.texte = None
+        self.arguments = None
+        self.instance = None
+
+    def prepare(self, pybniz):
+        """Lit le set et calcule les arguments de IBNIZ, lève IOError si le set n'existe pas"""
+        if self.arguments is None:
+            self.texte = pybniz.chargeSet(self.nomset)
+            self.arguments = pybniz.argumentsIBNIZ(self.texte, self.posx, self.posy, self.taille)
+
+
+def lisPlaylist(chemin):
+    """Retourne les entrées de la playlist, triées par temps. Lève ValueError si une ligne est invalide"""
+    entrees = []
+    with open(chemin) as fic:
+        for numero, ligne in enumerate(fic, 1):
+            try:
+                champs = split(ligne, comments=True)
+                if not champs:
+                    continue
+                temps, nomset, posx, posy, taille, duree = champs
+                entrees.append(Entree(lisTemps(temps), nomset, int(posx), int(posy), int(taille),
+                                      lisTemps(duree), numero))
+            except ValueError:
+                raise ValueError("%s ligne %d invalide : %s" % (chemin, numero, ligne.strip()))
+    entrees.sort(key=lambda entree: entree.temps)
+    return entrees
+
+
+class Sequenceur(object):
+    """Joue une playlist dans un thread, en lançant les sets par Pybniz.lanceIBNIZ"""
+
+    def __init__(self, pybniz, entrees, avance=AVANCE):
+        self.pybniz = pybniz
+        self.entrees = entrees
+        self.avance = avance
+        self.actif = False
+        self.debut = None
+        self.thread = None
+        # Écarts en secondes entre l'échéance et le lancement effectif
+        self.gigues = []
+        self.erreurs = []
+
+    def valide(self):
+        """Prépare toutes les entrées, et retourne les messages des sets introuvables"""
+        erreurs = []
+        for entree in self.entrees:
+            try:
+                entree.prepare(self.pybniz)
+            except (IOError, OSError) as erreur:
+                erreurs.append("ligne %d : set %s introuvable (%s)" % (entree.ligne, entree.nomset, erreur))
+        return erreurs
+
+    def demarre(self):
+        """Démarre la séquence dans un thread"""
+        self.actif = True
+        self.thread = Thread(target=self.joue, name="Sequenceur")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def arrete(self):
+        """Arrête la séquence, les instances déjà lancées continuent"""
+        self.actif = False
+        if self.thread is not None:
+            self.thread.join()
+
+    def attend(self):
+        """Attend la fin de la séquence"""
+        while self.thread is not None and self.thread.is_alive():
+            self.thread.join(SOMMEILMAX)
+
+    def attendJusqua(self, echeance):
+        """Attend l'échéance de l'horloge monotone, retourne faux si la séquence a été arrêtée.
+Le sommeil s'arrête un peu avant l'échéance, la fin de l'attente est active"""
+        while self.actif:
+            reste = echeance - horloge()
+            if reste <= 0:
+                return True
+            if reste > ATTENTEACTIVE:
+                sleep(min(reste - ATTENTEACTIVE, SOMMEILMAX))
+        return False
+
+    def joue(self):
+        """Boucle du thread : prépare, lance et arrête les sets à leurs échéances"""
+        self.debut = horloge()
+        # Évènements (échéance, ordre, action, entrée) ; les préparations passent avant les lancements
+        evenements = []
+        for ordre, entree in enumerate(self.entrees):
+            heappush(evenements, (self.debut + entree.temps - self.avance, ordre, 'prepare', entree))
+            heappush(evenements, (self.debut + entree.temps, ordre, 'lance', entree))
+        while evenements and self.actif:
+            echeance, ordre, action, entree = heappop(evenements)
+            if not self.attendJusqua(echeance):
+                break
+            try:
+                if action == 'prepare':
+                    entree.prepare(self.pybniz)
+                elif action == 'lance':
+                    entree.prepare(self.pybniz)
+                    entree.instance = self.pybniz.lanceIBNIZ(entree.nomset, entree.texte, entree.posx, entree.posy,
+                                                             entree.taille, entree.arguments)
+                    self.gigues.append(horloge() - echeance)
+                    if entree.duree > 0:
+                        heappush(evenements, (echeance + entree.duree, ordre, 'arrete', entree))
+                elif entree.instance is not None:
+                    self.pybniz.superviseur.arrete(entree.instance.pid)
+            except Exception as erreur:
+                self.erreurs.append("ligne %d : %s" % (entree.ligne, erreur))
+        self.actif = False
+
+    def rapport(self):
+        """Retourne le résumé des écarts de lancement en millisecondes"""
+        if not self.gigues:
+            return "Aucun lancement"
+        gigues = sorted(abs(g) * 1000 for g in self.gigues)
+        return "%d lancements, ecart median %.2f ms, max %.2f ms" % (len(gigues), gigues[len(gigues) // 2], gigues[-1])
@@ -0,0 +1,177 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Session des instances en cours
+
+Le mur d'instances lancées est enregistré dans FICHIERSESSION à chaque
+changement de la liste des instances : une ligne par instance avec
+l'empreinte de son code, sa position, sa taille et le nom du set. Le code
+est rangé une seule fois dans le magasin d'objets de l'historique, et la
+liste n'est comparée que par identité, elle est remplacée par le
+superviseur à chaque lancement ou arrêt.
+
+  # session 1718000000.000
+  <empreinte> <x> <y> <taille> <set>
+
+Après un plantage ou un redémarrage, la restauration relance tout le mur :
+au plus PARALLELE instances démarrent en même temps, la suivante est lancée
+dès qu'une instance a ouvert sa fenêtre, et le rapport donne le temps écoulé
+jusqu'à l'affichage de la dernière.
+"""
+
+from os import rename, fsync
+from os.path import exists
+from threading import Thread, Lock
+from shlex import split
+from pipes import quote
+from time import time, sleep
+from superviseur import LimiteInstances, estAffiche
+from gouverneur import Surcharge, EnAttente
+from stockage import octets
+
+FICHIERSESSION = ".session"
+# Nombre maximum d'instances qui démarrent en même temps pendant une restauration
+PARALLELE = 4
+# Une instance qui n'a pas ouvert sa fenêtre après ce délai, en secondes, est considérée démarrée
+DELAIMAXDEMARRAGE = 5.0
+INTERVALLEVERIFICATION = 0.02
+
+
+class EntreeSession(object):
+    """Une instance de la session enregistrée"""
+
+    def __init__(self, cle, posx, posy, taille, nomset):
+        self.cle = cle
+        self.posx = posx
+        self.posy = posy
+        self.taille = taille
+        self.nomset = nomset
+
+
+def lisSession(chemin=FICHIERSESSION):
+    """Retourne les entrées de la session enregistrée, une liste vide s'il n'y en a pas"""
+    entrees = []
+    if not exists(chemin):
+        return entrees
+    with open(chemin) as fic:
+        for ligne in fic:
+            champs = split(ligne, comments=True)
+            if len(champs) == 5:
+                cle, posx, posy, taille, nomset = champs
+                entrees.append(EntreeSession(cle, int(posx), int(posy), int(taille), nomset))
+    return entrees
+
+
+class Session(object):
+    """Enregistre les instances en cours quand leur liste change
+
+historique est le magasin d'objets qui garde le code des instances"""
+
+    def __init__(self, historique, chemin=FICHIERSESSION, instances=None):
+        self.historique = historique
+        self.chemin = chemin
+        self.verrou = Lock()
+        # Dernière liste enregistrée : une liste jamais remplacée n'est pas enregistrée
+        self.derniere = instances
+        # PID -> empreinte du code, calculée une seule fois par instance
+        self.empreintes = {}
+
+    def enregistre(self, instances):
+        """Écrit la session si la liste des instances a changé depuis le dernier enregistrement.
+Retourne vrai si elle a été écrite"""
+        with self.verrou:
+            if instances is self.derniere:
+                return False
+            empreintes = {}
+            lignes = ["# session %.3f\n" % time()]
+            for instance in instances:
+                cle = self.empreintes.get(instance.pid) or self.historique.conserve(instance.texte)
+                empreintes[instance.pid] = cle
+                lignes.append("%s %d %d %d %s\n" % (cle, instance.posx, instance.posy, instance.taille,
+                                                    quote(octets(instance.nomset))))
+            # Le fichier est écrit à côté puis renommé : une session n'est jamais tronquée
+            with open(self.chemin + ".tmp", 'w') as fic:
+                fic.writelines(lignes)
+                fic.flush()
+                fsync(fic.fileno())
+            rename(self.chemin + ".tmp", self.chemin)
+            self.empreintes = empreintes
+            self.derniere = instances
+            return True
+
+
+class Restauration(object):
+    """Relance les instances d'une session avec Pybniz.lanceIBNIZ, au plus parallele à la fois"""
+
+    def __init__(self, pybniz, entrees, parallele=PARALLELE, delai=DELAIMAXDEMARRAGE):
+        self.pybniz = pybniz
+        self.entrees = entrees
+        self.parallele = max(parallele, 1)
+        self.delai = delai
+        self.debut = None
+        self.duree = None
+        # Couples (instance, durée jusqu'à son affichage en secondes)
+        self.restaurees = []
+        self.enAttente = []
+        self.erreurs = []
+        self.thread = None
+
+    def texte(self, entree):
+        """Retourne le code lancé lors de la session, ou le code actuel du set s'il n'est plus dans le magasin"""
+        try:
+            return self.pybniz.historique.texte(entree.cle)
+        except (KeyError, IOError):
+            return self.pybniz.chargeSet(entree.nomset)
+
+    def restaure(self):
+        """Relance toutes les entrées et attend que leurs fenêtres soient ouvertes, retourne le rapport"""
+        self.debut = time()
+        attente = list(self.entrees)
+        demarrage = []
+        while attente or demarrage:
+            while attente and len(demarrage) < self.parallele:
+                entree = attente.pop(0)
+                try:
+                    instance = self.pybniz.lanceIBNIZ(entree.nomset, self.texte(entree), entree.posx, entree.posy,
+                                                      entree.taille)
+                except EnAttente:
+                    self.enAttente.append(entree.nomset)
+                    continue
+                except (LimiteInstances, Surcharge, IOError, OSError) as erreur:
+                    self.erreurs.append("%s : %s" % (entree.nomset, erreur))
+                    continue
+                demarrage.append((instance, time()))
+            sleep(INTERVALLEVERIFICATION)
+            maintenant = time()
+            restants = []
+            for instance, lancement in demarrage:
+                if instance.process.poll() is not None:
+                    self.erreurs.append("%s : IBNIZ s'est arrêté au démarrage" % instance.nomset)
+                elif estAffiche(instance.pid) or maintenant - lancement >= self.delai:
+                    self.restaurees.append((instance, maintenant - self.debut))
+                else:
+                    restants.append((instance, lancement))
+            demarrage = restants
+        self.duree = time() - self.debut
+        return self.rapport()
+
+    def demarre(self, rappel=None):
+        """Restaure la session dans un thread, rappel(rapport) est appelé à la fin depuis ce thread"""
+        def restaure():
+            rapport = self.restaure()
+            if rappel:
+                rappel(rapport)
+        self.thread = Thread(target=restaure, name="Restauration")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def rapport(self):
+        """Retourne le résumé de la restauration"""
+        if not self.entrees:
+            return "Aucune session a restaurer"
+        lignes = ["%d/%d instances restaurees en %d ms, avec %d demarrages simultanes au plus"
+                  % (len(self.restaurees), len(self.entrees), (self.duree or 0) * 1000, self.parallele)]
+        if self.enAttente:
+            lignes.append("%d lancements mis en attente par le gouverneur" % len(self.enAttente))
+        lignes.extend(self.erreurs)
+        return "\n".join(lignes)
@@ -0,0 +1,445 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Stockage des sets
+
+Trois implémentations partagent la même interface :
+- StockageRepertoire : un fichier texte par set dans le répertoire sets/,
+  le format historique de Pybniz
+- StockageSQLite : une base SQLite indexée (journal WAL) qui garde le code,
+  la géométrie extraite de la ligne '\\ xyt:', la date de modification et
+  l'empreinte de chaque set, pour les bibliothèques de plusieurs milliers
+  de sets
+- StockageArchive : un seul fichier, l'index des sets (nom, position,
+  longueur, géométrie, empreinte) suivi de leur code, lu par mmap, pour
+  copier et charger rapidement une bibliothèque sur les machines de spectacle
+"""
+
+from os import listdir, mkdir, remove, rename, fsync
+from os.path import exists, getmtime, join
+from threading import RLock
+from hashlib import sha1
+from bisect import bisect_right, insort
+from struct import Struct
+from time import time
+from re import compile, MULTILINE
+
+XYT = compile(r'\ xyt: ([0-9]+) ([0-9]+) ([0-9]+)', MULTILINE)
+XYTREMPLACE = compile(r'xyt: ([0-9]+) ([0-9]+) ([0-9]+)')
+# Extension des archives de sets
+EXTENSIONARCHIVE = ".pybz"
+# En-tête de l'archive : signature, position de l'index et nombre de sets
+SIGNATURE = "PYBNIZA1"
+ENTETE = Struct("<8sQI")
+# Entrée de l'index : longueur du nom, position et longueur du code, x, y, taille (-1 sans géométrie), empreinte
+ENTREE = Struct("<HQIiii20s")
+
+
+def lisXYT(texte):
+    """Retourne la position et la taille (x, y, t) indiquées dans le set, ou None"""
+    result = XYT.search(texte)
+    if result:
+        return tuple(int(v) for v in result.groups())
+    return None
+
+
+def octets(texte):
+    """Retourne le texte encodé en UTF-8 s'il est en unicode"""
+    if isinstance(texte, unicode):
+        return texte.encode('utf-8')
+    return texte
+
+
+def nomValide(nomset):
+    """Indique si le nom peut être celui d'un set : pas de chemin, pas de fichier caché"""
+    nomset = octets(nomset)
+    return bool(nomset) and '/' not in nomset and '\0' not in nomset and not nomset.startswith('.')
+
+
+def verifieNom(nomset):
+    """Lève IOError si le nom n'est pas un nom de set valide"""
+    if not nomValide(nomset):
+        raise IOError("Nom de set invalide: %r" % nomset)
+
+
+def empreinteTexte(texte):
+    """Retourne l'empreinte du contenu d'un set"""
+    return sha1(octets(texte)).hexdigest()
+
+
+def copie(source, destination):
+    """Copie tous les sets d'un stockage vers un autre, retourne le nombre de sets copiés"""
+    sets = ((nomset, source.charge(nomset)) for nomset in source.listeSets())
+    return destination.sauvePlusieurs(sets)
+
+
+class StockageRepertoire(object):
+    """Stockage historique : un fichier par set, les espaces du nom sont remplacés par '_'"""
+
+    def __init__(self, repertoire="sets"):
+        self.repertoire = repertoire
+        if not exists(repertoire):
+            mkdir(repertoire)
+
+    def chemin(self, nomset):
+        """Retourne le chemin du fichier d'un set, lève IOError pour un nom qui sortirait du répertoire"""
+        verifieNom(nomset)
+        return join(self.repertoire, nomset.replace(' ', '_'))
+
+    def nomSet(self, fichier):
+        """Retourne le nom du set d'un fichier du répertoire, ou None pour un fichier caché"""
+        # Les fichiers cachés sont les fichiers temporaires des sauvegardes en cours
+        if fichier.startswith('.'):
+            return None
+        return fichier.replace('_', ' ')
+
+    def listeSets(self, apres=None, nombre=None):
+        """Retourne les noms des sets triés, à partir du nom qui suit apres, et au plus nombre noms"""
+        noms = sorted([v.replace('_', ' ') for v in listdir(self.repertoire) if not v.startswith('.')])
+        if apres is not None:
+            noms = [v for v in noms if v > apres]
+        if nombre is not None:
+            noms = noms[:nombre]
+        return noms
+
+    def nombre(self):
+        """Retourne le nombre de sets"""
+        return len([v for v in listdir(self.repertoire) if not v.startswith('.')])
+
+    def existe(self, nomset):
+        """Indique si le set existe"""
+        return nomValide(nomset) and exists(self.chemin(nomset))
+
+    def charge(self, nomset):
+        """Retourne le texte d'un set"""
+        with open(self.chemin(nomset), 'r') as fic:
+            return fic.read()
+
+    def geometrie(self, nomset):
+        """Retourne la position et la taille (x, y, t) du set, ou None"""
+        return lisXYT(self.charge(nomset))
+
+    def signatures(self):
+        """Retourne pour chaque set une valeur qui change quand son code change : la date de modification"""
+        resultat = {}
+        for fichier in listdir(self.repertoire):
+            if not fichier.startswith('.'):
+                try:
+                    resultat[fichier.replace('_', ' ')] = getmtime(join(self.repertoire, fichier))
+                except OSError:
+                    pass
+        return resultat
+
+    def sauve(self, nomset, texte):
+        """Enregistre le texte d'un set dans un fichier temporaire renommé ensuite, un arrêt brutal ne peut pas tronquer le set"""
+        chemin = self.chemin(nomset)
+        temporaire = join(self.repertoire, '.' + nomset.replace(' ', '_') + '.tmp')
+        with open(temporaire, 'w') as fic:
+            fic.write(texte)
+            fic.flush()
+            fsync(fic.fileno())
+        rename(temporaire, chemin)
+
+    def sauvePlusieurs(self, sets):
+        """Enregistre une suite de couples (nomset, texte), retourne le nombre de sets enregistrés"""
+        nombre = 0
+        for nomset, texte in sets:
+            self.sauve(nomset, texte)
+            nombre += 1
+        return nombre
+
+    def supprime(self, nomset):
+        """Supprime un set"""
+        remove(self.chemin(nomset))
+
+    def fermer(self):
+        """Rien à fermer pour ce stockage"""
+
+
+class StockageSQLite(object):
+    """Stockage indexé dans une base SQLite, la clé primaire sur le nom donne un accès en O(log n)
+
+La connexion est partagée entre threads, chaque accès est protégé par un verrou"""
+
+    def __init__(self, chemin="sets.db"):
+        import sqlite3
+        self.chemin = chemin
+        self.verrou = RLock()
+        self.connexion = sqlite3.connect(chemin, check_same_thread=False)
+        self.connexion.text_factory = str
+        self.connexion.execute("PRAGMA journal_mode=WAL")
+        self.connexion.execute("PRAGMA synchronous=NORMAL")
+        self.connexion.execute("""CREATE TABLE IF NOT EXISTS sets (
+            nom TEXT PRIMARY KEY,
+            texte TEXT NOT NULL,
+            posx INTEGER, posy INTEGER, taille INTEGER,
+            mtime REAL NOT NULL,
+            empreinte TEXT NOT NULL)""")
+        self.connexion.commit()
+
+    def requete(self, requete, parametres=()):
+        """Exécute une requête de lecture et retourne toutes les lignes"""
+        with self.verrou:
+            return self.connexion.execute(requete, parametres).fetchall()
+
+    def modifie(self, requete, lignes):
+        """Exécute une requête de modification pour chaque ligne dans une seule transaction"""
+        with self.verrou:
+            with self.connexion:
+                self.connexion.executemany(requete, lignes)
+
+    def listeSets(self, apres=None, nombre=None):
+        """Retourne les noms des sets triés, à partir du nom qui suit apres, et au plus nombre noms"""
+        requete = "SELECT nom FROM sets"
+        parametres = []
+        if apres is not None:
+            requete += " WHERE nom > ?"
+            parametres.append(octets(apres))
+        requete += " ORDER BY nom"
+        if nombre is not None:
+            requete += " LIMIT ?"
+            parametres.append(nombre)
+        return [ligne[0] for ligne in self.requete(requete, parametres)]
+
+    def nombre(self):
+        """Retourne le nombre de sets"""
+        return self.requete("SELECT COUNT(*) FROM sets")[0][0]
+
+    def existe(self, nomset):
+        """Indique si le set existe"""
+        return bool(self.requete("SELECT 1 FROM sets WHERE nom = ?", (octets(nomset),)))
+
+    def charge(self, nomset):
+        """Retourne le texte d'un set, lève IOError s'il n'existe pas"""
+        lignes = self.requete("SELECT texte FROM sets WHERE nom = ?", (octets(nomset),))
+        if not lignes:
+            raise IOError("Set inconnu: %s" % nomset)
+        return lignes[0][0]
+
+    def geometrie(self, nomset):
+        """Retourne la position et la taille (x, y, t) du set, ou None"""
+        lignes = self.requete("SELECT posx, posy, taille FROM sets WHERE nom = ?", (octets(nomset),))
+        if not lignes or lignes[0][0] is None:
+            return None
+        return lignes[0]
+
+    def signatures(self):
+        """Retourne pour chaque set une valeur qui change quand son code change : son empreinte"""
+        return dict(self.requete("SELECT nom, empreinte FROM sets"))
+
+    def _ligne(self, nomset, texte, mtime=None):
+        """Prépare les valeurs à enregistrer pour un set"""
+        verifieNom(nomset)
+        texte = octets(texte)
+        xyt = lisXYT(texte) or (None, None, None)
+        return (octets(nomset), texte) + tuple(xyt) + (mtime or time(), empreinteTexte(texte))
+
+    def sauve(self, nomset, texte):
+        """Enregistre le texte d'un set"""
+        self.sauvePlusieurs([(nomset, texte)])
+        return len(octets(texte))
+
+    def sauvePlusieurs(self, sets):
+        """Enregistre une suite de couples (nomset, texte) dans une seule transaction"""
+        lignes = [self._ligne(nomset, texte) for nomset, texte in sets]
+        self.modifie("INSERT OR REPLACE INTO sets VALUES (?, ?, ?, ?, ?, ?, ?)", lignes)
+        return len(lignes)
+
+    def supprime(self, nomset):
+        """Supprime un set"""
+        self.modifie("DELETE FROM sets WHERE nom = ?", [(octets(nomset),)])
+
+    def importeRepertoire(self, repertoire="sets"):
+        """Importe les sets d'un répertoire au format historique, en conservant leur date de modification"""
+        source = StockageRepertoire(repertoire)
+        lignes = [self._ligne(nomset, source.charge(nomset), getmtime(source.chemin(nomset)))
+                  for nomset in source.listeSets()]
+        self.modifie("INSERT OR REPLACE INTO sets VALUES (?, ?, ?, ?, ?, ?, ?)", lignes)
+        return len(lignes)
+
+    def exporteRepertoire(self, repertoire="sets"):
+        """Exporte tous les sets vers un répertoire au format historique"""
+        return copie(self, StockageRepertoire(repertoire))
+
+    def fermer(self):
+        """Ferme la connexion à la base"""
+        with self.verrou:
+            self.connexion.close()
+
+
+class StockageArchive(object):
+    """Stockage dans une archive d'un seul fichier, lue par mmap
+
+L'en-tête indique la position de l'index, qui donne pour chaque set la
+position de son code dans le fichier : la liste des sets et la géométrie sont
+lues dans l'index chargé à l'ouverture, et le code d'un set est lu dans la
+projection du fichier en mémoire, sans appel à open() ni lecture. Les sets
+sauvés sont ajoutés à la fin du fichier, suivis d'un nouvel index, puis
+l'en-tête est mis à jour : l'ancien code reste dans le fichier jusqu'à ce que
+l'archive soit recréée par empaquette()"""
+
+    def __init__(self, chemin="sets" + EXTENSIONARCHIVE):
+        self.chemin = chemin
+        self.verrou = RLock()
+        if not exists(chemin):
+            ecritArchive(chemin, [])
+        self.fichier = open(chemin, 'r+b')
+        self.carte = None
+        self.projette()
+        signature, position, nombre = ENTETE.unpack_from(self.carte, 0)
+        if signature != SIGNATURE:
+            raise IOError("%s n'est pas une archive de sets" % chemin)
+        self.index = {}
+        for i in xrange(nombre):
+            longueurNom, debut, longueur, x, y, t, empreinte = ENTREE.unpack_from(self.carte, position)
+            position += ENTREE.size
+            nomset = self.carte[position:position + longueurNom]
+            position += longueurNom
+            self.index[nomset] = (debut, longueur, None if x < 0 else (x, y, t), empreinte)
+        # L'index est écrit trié par nom
+        self.noms = sorted(self.index)
+
+    def projette(self):
+        """Projette le fichier en mémoire, à nouveau après chaque écriture"""
+        from mmap import mmap, ACCESS_READ
+        with self.verrou:
+            if self.carte is not None:
+                self.carte.close()
+            self.carte = mmap(self.fichier.fileno(), 0, access=ACCESS_READ)
+
+    def listeSets(self, apres=None, nombre=None):
+        """Retourne les noms des sets triés, à partir du nom qui suit apres, et au plus nombre noms"""
+        noms = self.noms
+        debut = bisect_right(noms, octets(apres)) if apres is not None else 0
+        fin = debut + nombre if nombre is not None else len(noms)
+        return noms[debut:fin]
+
+    def nombre(self):
+        """Retourne le nombre de sets"""
+        return len(self.noms)
+
+    def existe(self, nomset):
+        """Indique si le set existe"""
+        return octets(nomset) in self.index
+
+    def charge(self, nomset):
+        """Retourne le texte d'un set, lève IOError s'il n'existe pas"""
+        with self.verrou:
+            entree = self.index.get(octets(nomset))
+            if entree is None:
+                raise IOError("Set inconnu: %s" % nomset)
+            debut, longueur = entree[:2]
+            return self.carte[debut:debut + longueur]
+
+    def geometrie(self, nomset):
+        """Retourne la position et la taille (x, y, t) du set, ou None"""
+        entree = self.index.get(octets(nomset))
+        return entree[2] if entree else None
+
+    def signatures(self):
+        """Retourne pour chaque set une valeur qui change quand son code change : son empreinte"""
+        return dict((nomset, entree[3]) for nomset, entree in self.index.iteritems())
+
+    def sauve(self, nomset, texte):
+        """Enregistre le texte d'un set"""
+        self.sauvePlusieurs([(nomset, texte)])
+        return len(octets(texte))
+
+    def sauvePlusieurs(self, sets):
+        """Ajoute une suite de couples (nomset, texte) à la fin de l'archive, suivis du nouvel index"""
+        with self.verrou:
+            index = dict(self.index)
+            self.fichier.seek(0, 2)
+            position = self.fichier.tell()
+            nombre = 0
+            noms = self.noms
+            for nomset, texte in sets:
+                verifieNom(nomset)
+                nomset = octets(nomset)
+                texte = octets(texte)
+                self.fichier.write(texte)
+                if nomset not in index:
+                    if noms is self.noms:
+                        noms = list(noms)
+                    insort(noms, nomset)
+                index[nomset] = (position, len(texte), lisXYT(texte), sha1(texte).digest())
+                position += len(texte)
+                nombre += 1
+            self.ecritIndex(index, noms)
+            return nombre
+
+    def supprime(self, nomset):
+        """Supprime un set de l'index"""
+        with self.verrou:
+            index = dict(self.index)
+            nomset = octets(nomset)
+            del index[nomset]
+            self.fichier.seek(0, 2)
+            self.ecritIndex(index, [v for v in self.noms if v != nomset])
+
+    def ecritIndex(self, index, noms):
+        """Écrit l'index à la position courante, puis l'en-tête qui le désigne, et projette à nouveau l'archive.
+L'index entier est réécrit à chaque sauvegarde, l'archive est faite pour être surtout lue"""
+        position = self.fichier.tell()
+        self.fichier.write(indexArchive(index, noms))
+        self.fichier.flush()
+        fsync(self.fichier.fileno())
+        self.fichier.seek(0)
+        self.fichier.write(ENTETE.pack(SIGNATURE, position, len(index)))
+        self.fichier.flush()
+        fsync(self.fichier.fileno())
+        # Les listes et l'index sont remplacés, jamais modifiés, pour les lectures sans verrou
+        self.index = index
+        self.noms = noms
+        self.projette()
+
+    def fermer(self):
+        """Ferme la projection et le fichier"""
+        with self.verrou:
+            self.carte.close()
+            self.fichier.close()
+
+
+def indexArchive(index, noms=None):
+    """Retourne l'index d'une archive, les entrées triées par nom"""
+    entrees = []
+    for nomset in noms if noms is not None else sorted(index):
+        debut, longueur, xyt, empreinte = index[nomset]
+        x, y, t = xyt or (-1, -1, -1)
+        entrees.append(ENTREE.pack(len(nomset), debut, longueur, x, y, t, empreinte) + nomset)
+    return "".join(entrees)
+
+
+def ecritArchive(chemin, sets):
+    """Écrit une archive compacte à partir d'une suite de couples (nomset, texte), retourne le nombre de sets"""
+    temporaire = chemin + ".tmp"
+    index = {}
+    with open(temporaire, 'wb') as fic:
+        fic.write(ENTETE.pack(SIGNATURE, 0, 0))
+        position = ENTETE.size
+        for nomset, texte in sets:
+            texte = octets(texte)
+            fic.write(texte)
+            index[octets(nomset)] = (position, len(texte), lisXYT(texte), sha1(texte).digest())
+            position += len(texte)
+        fic.write(indexArchive(index))
+        fic.seek(0)
+        fic.write(ENTETE.pack(SIGNATURE, position, len(index)))
+        fic.flush()
+        fsync(fic.fileno())
+    rename(temporaire, chemin)
+    return len(index)
+
+
+def empaquette(source, chemin):
+    """Écrit tous les sets d'un stockage dans une archive, retourne le nombre de sets"""
+    return ecritArchive(chemin, ((nomset, source.charge(nomset)) for nomset in source.listeSets()))
+
+
+def depaquette(chemin, repertoire="sets"):
+    """Extrait tous les sets d'une archive vers un répertoire au format historique, retourne le nombre de sets"""
+    archive = StockageArchive(chemin)
+    try:
+        return copie(archive, StockageRepertoire(repertoire))
+    finally:
+        archive.fermer()
@@ -0,0 +1,247 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Superviseur des instances IBNIZ
+
+Le superviseur garde la trace de chaque IBNIZ lancé par Pybniz (nom du set,
+position, taille, PID et heure de lancement), récolte les processus terminés
+sans bloquer la boucle Tk, et permet d'arrêter ou de relancer une instance.
+"""
+
+from time import time, sleep
+from threading import RLock
+from os import listdir, readlink
+from os.path import basename
+
+MAXINSTANCES = 32
+DELAIARRET = 2.0
+INTERVALLEATTENTE = 0.2
+# Bornes de l'attente du démarrage d'une nouvelle instance lors d'un remplacement à chaud
+DELAIMINBASCULE = 0.1
+DELAIMAXBASCULE = 3.0
+
+
+def processusIBNIZ(nom="ibniz"):
+    """Retourne les couples (pid, arguments) des processus IBNIZ en cours, lus dans /proc"""
+    processus = []
+    for pid in listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open("/proc/%s/cmdline" % pid, 'rb') as fic:
+                arguments = fic.read().split('\0')[:-1]
+        except IOError:
+            continue
+        if arguments and basename(arguments[0]) == nom:
+            processus.append((int(pid), arguments))
+    return processus
+
+
+def estAffiche(pid):
+    """Indique si le processus semble avoir ouvert sa fenêtre : il a une connexion par socket
+(au serveur X) et il a commencé à calculer des images"""
+    try:
+        sockets = [fd for fd in listdir("/proc/%d/fd" % pid)
+                   if readlink("/proc/%d/fd/%s" % (pid, fd)).startswith('socket:')]
+        with open("/proc/%d/stat" % pid) as fic:
+            champs = fic.read().rsplit(')', 1)[1].split()
+    except (IOError, OSError):
+        return False
+    # utime est le champ 14 de stat, soit 11 après le nom
+    return bool(sockets) and int(champs[11]) > 0
+
+
+class Bascule(object):
+    """Remplacement à chaud d'une instance par une nouvelle instance du même set"""
+
+    def __init__(self, ancienne, nouvelle):
+        self.ancienne = ancienne
+        self.nouvelle = nouvelle
+        self.debut = time()
+        self.latence = None
+        self.reussie = None
+
+
+class LimiteInstances(Exception):
+    """Exception levée quand le nombre maximum d'instances est atteint"""
+
+
+class Instance(object):
+    """Une instance IBNIZ lancée par Pybniz"""
+
+    def __init__(self, nomset, texte, posx, posy, taille, arguments, process, place=None):
+        self.nomset = nomset
+        self.texte = texte
+        self.posx = posx
+        self.posy = posy
+        self.taille = taille
+        self.arguments = arguments
+        self.process = process
+        self.place = place
+        self.pid = process.pid
+        self.debut = time()
+
+    def duree(self):
+        """Retourne le temps écoulé depuis le lancement en secondes"""
+        return time() - self.debut
+
+    def description(self):
+        """Retourne une ligne décrivant l'instance pour l'affichage"""
+        description = "%d  %s  (%d,%d) %d  %ds" % (self.pid, self.nomset, self.posx,
+                                                   self.posy, self.taille, self.duree())
+        if self.place and self.place.coeurs:
+            description += "  " + self.place.description()
+        return description
+
+
+class Superviseur(object):
+    """Le superviseur lance les processus IBNIZ et suit leur cycle de vie
+
+Il peut être utilisé depuis plusieurs threads : les listes d'instances ne sont
+jamais modifiées sur place mais remplacées, et peuvent être parcourues sans verrou"""
+
+    def __init__(self, maxinstances=MAXINSTANCES, journaux=None):
+        self.maxinstances = maxinstances
+        # Journaux qui lisent la sortie des instances, None pour qu'elles écrivent dans le terminal
+        self.journaux = journaux
+        self.verrou = RLock()
+        self.instances = []
+        # Instances à qui on a demandé de s'arrêter et qui n'ont pas encore été récoltées
+        self.enArret = []
+        self.bascules = []
+
+    def lance(self, nomset, texte, posx, posy, taille, arguments, place=None):
+        """Lance un processus IBNIZ et l'enregistre, lève LimiteInstances si la limite est atteinte.
+place indique les coeurs et le nice appliqués au processus dès son lancement"""
+        with self.verrou:
+            self.recolte()
+            if len(self.instances) >= self.maxinstances:
+                raise LimiteInstances("Limite de %d instances atteinte" % self.maxinstances)
+            return self._demarre(nomset, texte, posx, posy, taille, arguments, place)
+
+    def _demarre(self, nomset, texte, posx, posy, taille, arguments, place=None):
+        """Démarre le processus et ajoute l'instance à la liste"""
+        from subprocess import Popen, PIPE
+        with self.verrou:
+            sortie = PIPE if self.journaux is not None else None
+            # Les descripteurs de Pybniz (socket de contrôle, connexion X, tubes des autres instances) ne sont
+            # pas hérités : ils garderaient le port ouvert après Pybniz et fausseraient estAffiche()
+            process = Popen(arguments, stdout=sortie, stderr=sortie, close_fds=True)
+            if place is not None:
+                place.applique(process.pid)
+            instance = Instance(nomset, texte, posx, posy, taille, arguments, process, place)
+            if self.journaux is not None:
+                self.journaux.suit(instance)
+            self.instances = self.instances + [instance]
+            return instance
+
+    def recolte(self):
+        """Récolte les processus terminés sans bloquer, et retourne les instances terminées"""
+        with self.verrou:
+            terminees = [i for i in self.instances if i.process.poll() is not None]
+            if terminees:
+                self.instances = [i for i in self.instances if i not in terminees]
+            maintenant = time()
+            restants = []
+            for instance in self.enArret:
+                if instance.process.poll() is not None:
+                    continue
+                # Un IBNIZ qui ne répond pas au SIGTERM est tué après DELAIARRET secondes
+                if maintenant - instance.arret > DELAIARRET:
+                    try:
+                        instance.process.kill()
+                    except OSError:
+                        pass
+                restants.append(instance)
+            self.enArret = restants
+            return terminees
+
+    def derniere(self, nomset):
+        """Retourne la dernière instance lancée pour le set, ou None"""
+        for instance in reversed(self.instances):
+            if instance.nomset == nomset:
+                return instance
+        return None
+
+    def bascule(self, ancienne, nomset, texte, arguments):
+        """Lance une nouvelle instance à la place de l'ancienne, qui ne sera arrêtée
+par verifieBascules que quand la nouvelle sera affichée"""
+        with self.verrou:
+            nouvelle = self._demarre(nomset, texte, ancienne.posx, ancienne.posy, ancienne.taille, arguments,
+                                     ancienne.place)
+            self.bascules = self.bascules + [Bascule(ancienne, nouvelle)]
+            return nouvelle
+
+    def verifieBascules(self):
+        """Termine les remplacements dont la nouvelle instance est prête, et retourne les remplacements terminés"""
+        with self.verrou:
+            maintenant = time()
+            terminees = []
+            for bascule in self.bascules:
+                duree = maintenant - bascule.debut
+                if bascule.nouvelle.process.poll() is not None:
+                    # La nouvelle instance s'est arrêtée : l'ancienne reste en place
+                    bascule.reussie = False
+                elif duree >= DELAIMINBASCULE and (estAffiche(bascule.nouvelle.pid) or duree >= DELAIMAXBASCULE):
+                    self.arrete(bascule.ancienne.pid)
+                    bascule.reussie = True
+                else:
+                    continue
+                bascule.latence = duree
+                terminees.append(bascule)
+            if terminees:
+                self.bascules = [b for b in self.bascules if b not in terminees]
+            return terminees
+
+    def cherche(self, pid):
+        """Retourne l'instance correspondant au PID, ou None"""
+        for instance in self.instances:
+            if instance.pid == pid:
+                return instance
+        return None
+
+    def arrete(self, pid):
+        """Demande l'arrêt d'une instance, la récolte est faite plus tard par recolte()"""
+        with self.verrou:
+            instance = self.cherche(pid)
+            if instance is None:
+                return None
+            self.instances = [i for i in self.instances if i is not instance]
+            try:
+                instance.process.terminate()
+            except OSError:
+                pass
+            instance.arret = time()
+            self.enArret = self.enArret + [instance]
+            return instance
+
+    def relance(self, pid):
+        """Arrête une instance et la relance avec les mêmes arguments"""
+        with self.verrou:
+            instance = self.arrete(pid)
+            if instance is None:
+                return None
+            return self._demarre(instance.nomset, instance.texte, instance.posx,
+                                 instance.posy, instance.taille, instance.arguments, instance.place)
+
+    def arreteTout(self):
+        """Demande l'arrêt de toutes les instances"""
+        with self.verrou:
+            for instance in list(self.instances):
+                self.arrete(instance.pid)
+
+    def nombre(self):
+        """Retourne le nombre d'instances en cours d'exécution"""
+        return len(self.instances)
+
+    def attend(self, duree=None):
+        """Attend la fin de toutes les instances, en les arrêtant au bout de duree secondes si elle est indiquée"""
+        fin = time() + duree if duree is not None else None
+        while True:
+            self.recolte()
+            if not self.instances and not self.enArret:
+                return
+            if fin is not None and time() >= fin:
+                self.arreteTout()
+                fin = None
+            sleep(INTERVALLEATTENTE)
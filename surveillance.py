@@ -0,0 +1,173 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Surveillance du répertoire des sets
+
+Un thread suit les fichiers ajoutés, supprimés ou modifiés dans sets/ par
+d'autres outils, avec inotify sous Linux, sinon en relisant le répertoire
+quand sa date de modification change. Les évènements rapprochés sont
+regroupés : une synchronisation de milliers de fichiers donne un seul appel
+de rappel(ajouts, suppressions, modifications) avec les noms des sets.
+"""
+
+from os import listdir, read, close, stat
+from os.path import join, exists
+from threading import Thread
+from select import select
+from struct import Struct
+from time import time, sleep
+from placement import libc
+
+# Fin du regroupement quand aucun évènement n'arrive pendant ce délai, en secondes
+DELAIREGROUPEMENT = 0.25
+# Durée maximum d'un regroupement, pour que la liste avance pendant une longue synchronisation
+DELAIMAXREGROUPEMENT = 2.0
+INTERVALLESCRUTATION = 2.0
+# Durée maximum d'une attente, pour que la surveillance puisse être arrêtée rapidement
+ATTENTEMAX = 0.5
+
+IN_MODIFY = 0x2
+IN_CLOSE_WRITE = 0x8
+IN_MOVED_FROM = 0x40
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_Q_OVERFLOW = 0x4000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENEMENT = Struct("iIII")
+
+
+def inotify(repertoire):
+    """Retourne un descripteur inotify qui surveille le répertoire, ou None si inotify n'est pas disponible"""
+    bibliotheque = libc()
+    if bibliotheque is None:
+        return None
+    try:
+        descripteur = bibliotheque.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+    except AttributeError:
+        return None
+    if descripteur < 0:
+        return None
+    masque = IN_CLOSE_WRITE | IN_MODIFY | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    if bibliotheque.inotify_add_watch(descripteur, repertoire, masque) < 0:
+        close(descripteur)
+        return None
+    return descripteur
+
+
+class Surveillance(object):
+    """Surveille un répertoire de sets et signale les changements regroupés
+
+nomme(fichier) retourne le nom du set d'un fichier, ou None pour un fichier à ignorer"""
+
+    def __init__(self, repertoire, rappel, nomme):
+        self.repertoire = repertoire
+        self.rappel = rappel
+        self.nomme = nomme
+        self.connus = set(self.liste())
+        self.descripteur = inotify(repertoire)
+        self.actif = False
+        self.thread = None
+
+    def liste(self):
+        """Retourne les noms des sets présents dans le répertoire"""
+        return [nom for nom in (self.nomme(fichier) for fichier in listdir(self.repertoire)) if nom is not None]
+
+    def demarre(self):
+        """Démarre le thread de surveillance"""
+        self.actif = True
+        cible = self.surveilleInotify if self.descripteur is not None else self.scrute
+        self.thread = Thread(target=cible, name="Surveillance")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def arrete(self):
+        """Arrête le thread de surveillance"""
+        self.actif = False
+        if self.thread is not None:
+            self.thread.join()
+        if self.descripteur is not None:
+            close(self.descripteur)
+            self.descripteur = None
+
+    def lisEvenements(self, attente):
+        """Attend des évènements inotify, retourne les fichiers concernés, ou None si la file a débordé"""
+        if not select([self.descripteur], [], [], attente)[0]:
+            return []
+        try:
+            donnees = read(self.descripteur, 65536)
+        except OSError:
+            return []
+        fichiers = []
+        position = 0
+        while position + EVENEMENT.size <= len(donnees):
+            wd, masque, cookie, longueur = EVENEMENT.unpack_from(donnees, position)
+            position += EVENEMENT.size
+            if masque & IN_Q_OVERFLOW:
+                return None
+            fichiers.append(donnees[position:position + longueur].rstrip('\0'))
+            position += longueur
+        return fichiers
+
+    def surveilleInotify(self):
+        """Boucle du thread avec inotify : regroupe les évènements puis signale les changements"""
+        while self.actif:
+            fichiers = self.lisEvenements(ATTENTEMAX)
+            if fichiers == []:
+                continue
+            touches = set()
+            complet = fichiers is None
+            debut = time()
+            while fichiers:
+                touches.update(fichiers)
+                if time() - debut > DELAIMAXREGROUPEMENT:
+                    break
+                fichiers = self.lisEvenements(DELAIREGROUPEMENT)
+                if fichiers is None:
+                    complet = True
+            if complet:
+                # La file d'évènements a débordé : le répertoire est relu entièrement
+                self.compare(set(self.liste()))
+            else:
+                self.applique(touches)
+
+    def applique(self, fichiers):
+        """Détermine l'état final des fichiers touchés et signale les changements"""
+        ajouts, suppressions, modifications = [], [], []
+        for fichier in fichiers:
+            nomset = self.nomme(fichier)
+            if nomset is None:
+                continue
+            if exists(join(self.repertoire, fichier)):
+                (modifications if nomset in self.connus else ajouts).append(nomset)
+            elif nomset in self.connus:
+                suppressions.append(nomset)
+        self.signale(ajouts, suppressions, modifications)
+
+    def compare(self, presents):
+        """Signale les différences entre les sets présents et les sets connus"""
+        self.signale(sorted(presents - self.connus), sorted(self.connus - presents), [])
+
+    def signale(self, ajouts, suppressions, modifications):
+        """Met à jour les sets connus et appelle le rappel s'il y a des changements"""
+        self.connus.update(ajouts)
+        self.connus.difference_update(suppressions)
+        if ajouts or suppressions or modifications:
+            self.rappel(ajouts, suppressions, modifications)
+
+    def scrute(self):
+        """Boucle du thread sans inotify : relit le répertoire quand sa date de modification change.
+Les modifications du contenu des sets ne sont pas détectées"""
+        dernier = stat(self.repertoire).st_mtime
+        while self.actif:
+            debut = time()
+            while self.actif and time() - debut < INTERVALLESCRUTATION:
+                sleep(ATTENTEMAX)
+            try:
+                mtime = stat(self.repertoire).st_mtime
+            except OSError:
+                continue
+            if mtime != dernier:
+                dernier = mtime
+                self.compare(set(self.liste()))
@@ -0,0 +1,107 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Télémétrie des instances IBNIZ
+
+Relève le CPU, la mémoire résidente et la durée de chaque instance lancée par
+Pybniz en lisant /proc/<pid>/stat et /proc/<pid>/status. Toutes les instances
+sont relevées en une seule passe, et l'historique de chacune est borné.
+"""
+
+from collections import deque
+from os import sysconf
+from time import time
+
+HISTORIQUE = 600
+TERMINEES = 50
+TICKS = sysconf('SC_CLK_TCK')
+
+
+def lisProcessus(pid):
+    """Retourne (temps CPU en secondes, mémoire résidente en ko) d'un processus, ou None s'il n'existe plus"""
+    try:
+        with open('/proc/%d/stat' % pid) as fic:
+            # Le nom du programme peut contenir des espaces, les champs sont comptés après la parenthèse
+            champs = fic.read().rsplit(')', 1)[1].split()
+        rss = 0
+        with open('/proc/%d/status' % pid) as fic:
+            for ligne in fic:
+                if ligne.startswith('VmRSS:'):
+                    rss = int(ligne.split()[1])
+                    break
+    except (IOError, IndexError):
+        return None
+    # utime et stime sont les champs 14 et 15 de stat, soit 11 et 12 après le nom
+    return (int(champs[11]) + int(champs[12])) / float(TICKS), rss
+
+
+class Serie(object):
+    """Historique des relevés d'une instance"""
+
+    def __init__(self, instance):
+        self.pid = instance.pid
+        self.nomset = instance.nomset
+        self.debut = instance.debut
+        self.releves = deque(maxlen=HISTORIQUE)
+        self.cpuPrecedent = None
+        self.instantPrecedent = None
+
+    def dernier(self):
+        """Retourne le dernier relevé (instant, cpu %, rss ko, durée), ou None"""
+        return self.releves[-1] if self.releves else None
+
+
+class Telemetrie(object):
+    """Relève les ressources utilisées par les instances du superviseur"""
+
+    def __init__(self):
+        self.series = {}
+        self.terminees = deque(maxlen=TERMINEES)
+
+    def releve(self, instances):
+        """Relève toutes les instances en une passe, et retourne les derniers relevés"""
+        maintenant = time()
+        actives = {}
+        for instance in instances:
+            serie = self.series.get(instance.pid) or Serie(instance)
+            actives[instance.pid] = serie
+            mesure = lisProcessus(instance.pid)
+            if mesure is None:
+                continue
+            cpu, rss = mesure
+            pourcentage = 0.0
+            if serie.cpuPrecedent is not None and maintenant > serie.instantPrecedent:
+                pourcentage = 100.0 * (cpu - serie.cpuPrecedent) / (maintenant - serie.instantPrecedent)
+            serie.cpuPrecedent = cpu
+            serie.instantPrecedent = maintenant
+            serie.releves.append((maintenant, pourcentage, rss, maintenant - serie.debut))
+        for pid, serie in self.series.items():
+            if pid not in actives:
+                self.terminees.append(serie)
+        self.series = actives
+        return self.tableau()
+
+    def tableau(self):
+        """Retourne les lignes (pid, nomset, cpu %, rss ko, durée) des instances actives, les plus gourmandes en premier"""
+        lignes = []
+        for serie in self.series.values():
+            dernier = serie.dernier()
+            if dernier:
+                instant, cpu, rss, duree = dernier
+                lignes.append((serie.pid, serie.nomset, cpu, rss, duree))
+        return sorted(lignes, key=lambda ligne: -ligne[2])
+
+    def exporte(self, chemin):
+        """Exporte l'historique de toutes les instances au format CSV, retourne le nombre de relevés.
+À appeler dans le thread qui fait les relevés"""
+        nombre = 0
+        with open(chemin, 'w') as fic:
+            fic.write("instant,pid,set,cpu,rss_ko,duree\n")
+            for serie in list(self.terminees) + self.series.values():
+                nomset = serie.nomset.replace('"', '""')
+                if isinstance(nomset, unicode):
+                    nomset = nomset.encode('utf-8')
+                for instant, cpu, rss, duree in serie.releves:
+                    fic.write('%.3f,%d,"%s",%.1f,%d,%.1f\n' % (instant, serie.pid, nomset, cpu, rss, duree))
+                    nombre += 1
+        return nombre
@@ -0,0 +1,67 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Test du serveur de contrôle : aller-retour de commandes sur une socket Unix
+et en UDP, avec un faux IBNIZ qui attend d'être arrêté.
+
+  python -m unittest discover tests
+"""
+
+import sys
+import unittest
+from os import chdir, getcwd, chmod
+from os.path import join, dirname, abspath
+from shutil import rmtree
+from tempfile import mkdtemp
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+import pybniz
+from controle import envoie, commande, echappe
+
+
+class TestControle(unittest.TestCase):
+    """Lance, sauve et liste par le serveur de contrôle d'un Pybniz sans interface"""
+
+    def setUp(self):
+        self.precedent = getcwd()
+        self.repertoire = mkdtemp()
+        chdir(self.repertoire)
+        ibniz = join(self.repertoire, "ibniz")
+        with open(ibniz, 'w') as fic:
+            fic.write("#!/bin/sh\nexec sleep 60\n")
+        chmod(ibniz, 0755)
+        self.ibnizpath = pybniz.IBNIZPATH
+        pybniz.IBNIZPATH = ibniz
+        self.pybniz = pybniz.Pybniz(interface=False)
+
+    def tearDown(self):
+        self.pybniz.fermer(True)
+        self.pybniz.superviseur.attend()
+        pybniz.IBNIZPATH = self.ibnizpath
+        chdir(self.precedent)
+        rmtree(self.repertoire)
+
+    def allerRetour(self, adresse):
+        """Sauve un set, le lance et liste les instances par le serveur ouvert à l'adresse"""
+        self.assertTrue(self.pybniz.demarreControle(adresse))
+        adresse = self.pybniz.controle.adresse
+        reponse = envoie([commande("sauve", "essai", echappe("d*"), 10, 20, 128),
+                          commande("lance", "essai")], adresse)
+        self.assertEqual(reponse[0], "ok")
+        self.assertTrue(reponse[1].startswith("ok "), reponse)
+        pid = int(reponse[1].split()[1])
+        self.assertIn("essai", self.pybniz.listesets)
+        self.assertEqual(envoie(["liste"], adresse), ["ok 1", commande(pid, "essai", 10, 20, 128)])
+        self.assertEqual(envoie(["sets ess"], adresse), ["ok 1", "essai"])
+        self.assertEqual(envoie(["lance"], adresse), ["erreur arguments invalides : lance"])
+
+    def test_socketUnix(self):
+        self.allerRetour(join(self.repertoire, "controle.sock"))
+
+    def test_udp(self):
+        self.allerRetour(("127.0.0.1", 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
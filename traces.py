@@ -0,0 +1,235 @@
+# -*- coding: UTF-8 -*-
+
+"""
+Traces et profils de Pybniz
+
+Les chemins critiques (lecture, sauvegarde, lancement, rappels de
+l'interface) sont mesurés par des intervalles enregistrés dans un tampon
+circulaire de taille fixe : une trace active coûte une lecture de l'horloge
+et une écriture dans une liste, une trace inactive un test. La trace est
+activée depuis l'interface ou par un signal, et exportée au format JSON des
+traces de Chrome (chrome://tracing ou Perfetto) :
+
+  kill -USR1 <pid>   active ou désactive la trace
+  kill -USR2 <pid>   exporte la trace dans FICHIERTRACE, et le profil
+
+Un traitement peut aussi être profilé avec cProfile : chacune de ses
+exécutions est ajoutée au profil, enregistré avec la trace.
+"""
+
+from functools import wraps
+from itertools import count
+from threading import Lock, enumerate as threads
+from thread import get_ident
+from time import time
+from os import getpid
+import json
+
+# Nombre d'évènements gardés, les plus anciens sont remplacés
+TAILLETAMPON = 65536
+FICHIERTRACE = "pybniz-trace.json"
+FICHIERPROFIL = "pybniz-%s.prof"
+
+
+def unicode8(valeur):
+    """Retourne une valeur en unicode pour les messages, les octets étant lus en UTF-8"""
+    if isinstance(valeur, unicode):
+        return valeur
+    if isinstance(valeur, str):
+        return valeur.decode('utf-8', 'replace')
+    return unicode(valeur)
+
+
+class Intervalle(object):
+    """Mesure la durée d'un traitement dans un bloc with, et le profile s'il est choisi"""
+
+    def __init__(self, traceur, nom, categorie, arguments):
+        self.traceur = traceur
+        self.nom = nom
+        self.categorie = categorie
+        self.arguments = arguments
+        self.profil = None
+
+    def __enter__(self):
+        if self.nom == self.traceur.profile:
+            self.profil = self.traceur.debutProfil()
+        self.debut = time()
+        return self
+
+    def __exit__(self, type, valeur, pile):
+        fin = time()
+        if self.profil is not None:
+            self.traceur.finProfil(self.profil)
+        if self.traceur.actif:
+            self.traceur.enregistre('X', self.nom, self.categorie, self.debut, fin - self.debut, self.arguments)
+        return False
+
+
+class IntervalleNul(object):
+    """Intervalle d'une trace inactive, qui ne mesure rien"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, valeur, pile):
+        return False
+
+NUL = IntervalleNul()
+
+
+class Traceur(object):
+    """Enregistre les évènements dans un tampon circulaire et les exporte
+
+actif active la trace, affiche écrit aussi les messages sur la console, et
+profile est le nom du traitement à profiler, ou None"""
+
+    def __init__(self, taille=TAILLETAMPON):
+        self.tampon = [None] * taille
+        # next() sur un compteur est atomique, les threads écrivent sans verrou
+        self.compteur = count()
+        self.actif = False
+        self.affiche = False
+        self.profile = None
+        self.profil = None
+        self.verrou = Lock()
+        self.profilEnCours = False
+
+    def enregistre(self, phase, nom, categorie, debut, duree, arguments):
+        """Ajoute un évènement au tampon, en remplaçant le plus ancien s'il est plein"""
+        self.tampon[next(self.compteur) % len(self.tampon)] = (phase, nom, categorie, debut, duree, get_ident(), arguments)
+
+    def intervalle(self, nom, categorie="pybniz", **arguments):
+        """Retourne un intervalle à utiliser dans un bloc with"""
+        if not self.actif and nom != self.profile:
+            return NUL
+        return Intervalle(self, nom, categorie, arguments)
+
+    def note(self, message, *valeurs):
+        """Enregistre un message ponctuel, et l'affiche si affiche est vrai"""
+        if not self.actif and not self.affiche:
+            return
+        texte = u" ".join(unicode8(valeur) for valeur in (message,) + valeurs)
+        if self.affiche:
+            print texte.encode('utf-8')
+        if self.actif:
+            self.enregistre('i', message, "message", time(), 0, {"message": texte})
+
+    def bascule(self):
+        """Active ou désactive la trace, retourne le nouvel état"""
+        self.actif = not self.actif
+        return self.actif
+
+    def evenements(self):
+        """Retourne les évènements du tampon du plus ancien au plus récent"""
+        return sorted((evenement for evenement in list(self.tampon) if evenement is not None), key=lambda e: e[3])
+
+    def vide(self):
+        """Efface les évènements enregistrés"""
+        self.tampon = [None] * len(self.tampon)
+
+    def chrome(self):
+        """Retourne la trace au format JSON des traces de Chrome, les instants en microsecondes"""
+        pid = getpid()
+        noms = dict((thread.ident, thread.name) for thread in threads())
+        evenements = []
+        for phase, nom, categorie, debut, duree, thread, arguments in self.evenements():
+            evenement = {"name": nom, "cat": categorie, "ph": phase, "ts": int(debut * 1e6),
+                         "pid": pid, "tid": thread, "args": arguments or {}}
+            if phase == 'X':
+                evenement["dur"] = int(duree * 1e6)
+            else:
+                evenement["s"] = 't'
+            evenements.append(evenement)
+        for thread in set(evenement["tid"] for evenement in evenements):
+            evenements.append({"name": "thread_name", "ph": 'M', "pid": pid, "tid": thread,
+                               "args": {"name": noms.get(thread, str(thread))}})
+        return {"traceEvents": evenements, "displayTimeUnit": "ms"}
+
+    def exporte(self, chemin=FICHIERTRACE):
+        """Écrit la trace au format JSON des traces de Chrome, et le profil s'il y en a un.
+Retourne le nombre d'évènements écrits"""
+        trace = self.chrome()
+        with open(chemin, 'w') as fic:
+            json.dump(trace, fic)
+        self.sauveProfil()
+        return sum(1 for evenement in trace["traceEvents"] if evenement["ph"] != 'M')
+
+    def debutProfil(self):
+        """Démarre le profil du traitement choisi, retourne None s'il est déjà en cours dans un autre appel"""
+        from cProfile import Profile
+        with self.verrou:
+            if self.profilEnCours:
+                return None
+            self.profilEnCours = True
+            if self.profil is None:
+                self.profil = Profile()
+        self.profil.enable()
+        return self.profil
+
+    def finProfil(self, profil):
+        """Arrête le profil, les exécutions suivantes s'y ajouteront"""
+        profil.disable()
+        self.profilEnCours = False
+
+    def profileTraitement(self, nom):
+        """Choisit le traitement à profiler, None pour arrêter, et efface le profil précédent"""
+        self.profile = nom
+        self.profil = None
+
+    def sauveProfil(self, chemin=None):
+        """Écrit le profil pour pstats ou snakeviz, retourne le chemin ou None s'il n'y a pas de profil"""
+        if self.profil is None or self.profile is None:
+            return None
+        chemin = chemin or FICHIERPROFIL % self.profile
+        self.profil.dump_stats(chemin)
+        return chemin
+
+    def rapportProfil(self, lignes=25):
+        """Retourne les fonctions les plus coûteuses du profil, ou None"""
+        if self.profil is None:
+            return None
+        from pstats import Stats
+        from StringIO import StringIO
+        sortie = StringIO()
+        Stats(self.profil, stream=sortie).sort_stats('cumulative').print_stats(lignes)
+        return sortie.getvalue()
+
+traceur = Traceur()
+
+
+def trace(categorie="pybniz", nom=None):
+    """Décorateur qui enregistre chaque exécution d'une fonction comme un intervalle"""
+    def decore(fonction):
+        libelle = nom or fonction.__name__
+        @wraps(fonction)
+        def enveloppe(*arguments, **options):
+            if libelle == traceur.profile:
+                with Intervalle(traceur, libelle, categorie, None):
+                    return fonction(*arguments, **options)
+            if not traceur.actif:
+                return fonction(*arguments, **options)
+            # Le chemin le plus fréquent, sans objet Intervalle
+            debut = time()
+            try:
+                return fonction(*arguments, **options)
+            finally:
+                traceur.enregistre('X', libelle, categorie, debut, time() - debut, None)
+        return enveloppe
+    return decore
+
+
+def note(message, *valeurs):
+    """Enregistre un message ponctuel dans la trace"""
+    traceur.note(message, *valeurs)
+
+
+def installeSignaux(chemin=FICHIERTRACE):
+    """Active ou désactive la trace sur SIGUSR1, l'exporte sur SIGUSR2. À appeler depuis le thread principal"""
+    from signal import signal, SIGUSR1, SIGUSR2
+    from sys import stderr
+    def bascule(numero, pile):
+        print >>stderr, "Trace", "activee" if traceur.bascule() else "desactivee"
+    def exporte(numero, pile):
+        print >>stderr, traceur.exporte(chemin), "evenements ecrits dans", chemin
+    signal(SIGUSR1, bascule)
+    signal(SIGUSR2, exporte)